@@ -2,21 +2,57 @@
 
 from __future__ import annotations
 
+from collections import deque
+from datetime import datetime
 import logging
 from pathlib import Path
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
+from .analytics import parse_timestamp
 from .client import MobileVikingsClient
-from .const import COORDINATOR_UPDATE_INTERVAL, DOMAIN, MOBILE_VIKINGS, PLATFORMS
+from .const import (
+    CONF_COMPACT_INVOICES,
+    DEBUG_CAPTURE_SIZE,
+    DEFAULT_COMPACT_INVOICES,
+    DOMAIN,
+    MOBILE_VIKINGS,
+    PLATFORMS,
+    SECTION_UPDATE_INTERVALS,
+    TOKEN_SAVE_DELAY,
+)
+from .forecast import UsageForecaster
+from .invoices import aggregate_invoices
+from .request_log import LazyPayload
+from .scheduler import AdaptiveBalanceInterval, SectionScheduler
+from .services import async_setup_services
+from .session import async_get_request_scheduler
+from .statistics import StatisticsImporter
+from .storage import MobileVikingsStorage
+from .timeseries import UsageHistoryStore
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the MobileVikings services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MobileVikings / JimMobile from a config entry."""
@@ -25,6 +61,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     for platform in PLATFORMS:
         hass.data[DOMAIN][entry.entry_id].setdefault(platform, set())
 
+    storage_dir = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}")
+    if storage_dir.is_file():
+        storage_dir.unlink()
+    storage_dir.mkdir(exist_ok=True)
+    storage = MobileVikingsStorage(hass, entry.entry_id)
+    # Tokens are kept apart from the data, so a token refresh only writes them
+    token_store: Store = Store(hass, 1, f"{DOMAIN}/{entry.entry_id}_tokens")
+
     client = MobileVikingsClient(
         hass=hass,
         mobile_platform=entry.data.get(
@@ -32,13 +76,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ),  # Default to MOBILE_VIKINGS for backward compatibility
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
+        tokens=await token_store.async_load(),
+        on_tokens_update=lambda: token_store.async_delay_save(
+            client.token_manager.as_dict, TOKEN_SAVE_DELAY
+        ),
+        scheduler=async_get_request_scheduler(hass),
     )
-
-    storage_dir = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}")
-    if storage_dir.is_file():
-        storage_dir.unlink()
-    storage_dir.mkdir(exist_ok=True)
-    store: Store = Store(hass, 1, f"{DOMAIN}/{entry.entry_id}")
     dev_reg = dr.async_get(hass)
 
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator = (
@@ -47,7 +90,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             entry=entry,
             client=client,
             dev_reg=dev_reg,
-            store=store,
+            storage=storage,
         )
     )
     await coordinator.async_config_entry_first_refresh()
@@ -56,46 +99,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await coordinator.async_trigger_cleanup()
 
+    # Reload the entry when its password or options are changed
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
-async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle removal of pubsub subscriptions created during config flow."""
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after it was updated."""
+    await hass.config_entries.async_reload(entry.entry_id)
 
-    # Define blocking file operations
-    def remove_storage_files():
-        storage = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}/{entry.entry_id}")
+
+def _remove_storage_files(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the storage files of a config entry."""
+    storage_dir = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}")
+    if not storage_dir.is_dir():
+        return
+    for storage in storage_dir.glob(f"{entry_id}*"):
         storage.unlink(missing_ok=True)  # Unlink (delete) the storage file
 
-        storage_dir = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}")
-        # If the directory exists and is empty, remove it
-        if storage_dir.is_dir() and not any(storage_dir.iterdir()):
-            storage_dir.rmdir()
+    # If the directory is empty, remove it
+    if not any(storage_dir.iterdir()):
+        storage_dir.rmdir()
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle removal of pubsub subscriptions created during config flow."""
     # Offload the file system operations to a thread
-    await hass.async_add_executor_job(remove_storage_files)
+    await hass.async_add_executor_job(_remove_storage_files, hass, entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
-    # Unload the platforms first
+    # Unload the platforms first, the stores are kept for the next setup and
+    # only removed with the entry
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
-        # Define blocking file operations
-        def remove_storage_files():
-            storage = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}/{entry.entry_id}")
-            storage.unlink(missing_ok=True)  # Unlink (delete) the storage file
-
-            storage_dir = Path(f"{hass.config.path(STORAGE_DIR)}/{DOMAIN}")
-            # If the directory exists and is empty, remove it
-            if storage_dir.is_dir() and not any(storage_dir.iterdir()):
-                storage_dir.rmdir()
-
-        # Offload the file system operations to a thread
-        await hass.async_add_executor_job(remove_storage_files)
-
     return unload_ok
 
 
@@ -110,14 +151,19 @@ class MobileVikingsDataUpdateCoordinator(DataUpdateCoordinator):
         entry: ConfigEntry,
         client: MobileVikingsClient,
         dev_reg: dr.DeviceRegistry,
-        store: Store,
+        storage: MobileVikingsStorage,
     ) -> None:
         """Initialize coordinator."""
+        self.scheduler = SectionScheduler(SECTION_UPDATE_INTERVALS)
+        self.balance_interval = AdaptiveBalanceInterval()
+        self.forecaster = UsageForecaster()
+        self.usage_history = UsageHistoryStore(hass, entry.entry_id)
+        self.statistics = StatisticsImporter(hass, entry.entry_id, self.usage_history)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=COORDINATOR_UPDATE_INTERVAL,
+            update_interval=self.scheduler.update_interval,
             config_entry=entry,
         )
         self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
@@ -126,17 +172,56 @@ class MobileVikingsDataUpdateCoordinator(DataUpdateCoordinator):
         self._device_registry = dev_reg
         self.client = client
         self.hass = hass
-        self.store = store
+        self.storage = storage
         self.entry = entry
+        self.debug_captures: deque[dict] = deque(maxlen=DEBUG_CAPTURE_SIZE)
+        self.compact_invoices = entry.options.get(
+            CONF_COMPACT_INVOICES, DEFAULT_COMPACT_INVOICES
+        )
+        self._last_poll: dict = {}
 
     async def async_config_entry_first_refresh(self) -> None:
         """Refresh data for the first time when a config entry is setup."""
-        self.data = await self.store.async_load() or {}
+        self.data = await self.storage.async_load()
+        # Tokens used to be stored with the data, they have their own store now
+        legacy_tokens = self.data.pop("tokens", None)
+        if legacy_tokens and not self.client.token_manager.refresh_token:
+            _LOGGER.debug("Migrating the stored tokens to the token store")
+            self.client.token_manager.restore(legacy_tokens)
+            if self.client.token_manager.on_update:
+                self.client.token_manager.on_update()
+        self.client.product_cache.restore(self.data.get("product_cache"))
+        self.client.invoice_ledger.restore(self.data.get("paid_invoices"))
+        await self._async_seed_forecaster()
         await super().async_config_entry_first_refresh()
 
+    async def _async_seed_forecaster(self) -> None:
+        """Seed the forecaster with the stored usage of the current periods."""
+        for subscription_id, subscription in (
+            self.data.get("subscriptions") or {}
+        ).items():
+            bundles = (subscription.get("balance") or {}).get("bundles") or {}
+            for bundle_id, bundle in bundles.items():
+                try:
+                    period_start = parse_timestamp(bundle["valid_from"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                records = await self.usage_history.async_read(
+                    subscription_id, bundle_id, start=period_start
+                )
+                if records:
+                    self.forecaster.seed(
+                        subscription_id,
+                        bundle_id,
+                        bundle["valid_from"],
+                        [(timestamp, used) for timestamp, used, _ in records],
+                    )
+
     async def get_data(self) -> dict | None:
-        """Get the data from the Robonect client."""
-        data = await self.client.get_data()
+        """Get the sections that are due from the client and merge them in the data."""
+        now = dt_util.utcnow()
+        sections = self.scheduler.due_sections(now)
+        data = self._last_poll = await self.client.get_data(sections)
         if self._init:
             self._init = False
         for key, value in data.items():
@@ -148,24 +233,74 @@ class MobileVikingsDataUpdateCoordinator(DataUpdateCoordinator):
                     )
                 continue  # Skip this key if "error" is present
             self.data[key] = value
-        await self.store.async_save(self.data)
+            if key in sections:
+                self.scheduler.mark_fetched(key, now)
+        # Adapt the balance polling to the freshly fetched bundle usage
+        if "subscriptions" in data and data["subscriptions"] is self.data.get(
+            "subscriptions"
+        ):
+            interval = self.balance_interval.update(self.data["subscriptions"])
+            self.scheduler.set_interval("subscriptions", interval)
+            self.update_interval = self.scheduler.update_interval
+            self.data["subscriptions"] = self.forecaster.update(
+                self.data["subscriptions"], now
+            )
+            await self.usage_history.async_append(self.data["subscriptions"], now)
+        self.storage.async_schedule_save(self.data)
+        # Long-term statistics are built from the freshly stored history
+        if "subscriptions" in sections and "subscriptions" in self.data:
+            await self.statistics.async_import_usage(self.data["subscriptions"], now)
+        if "paid_invoices" in sections and "paid_invoices" in self.data:
+            await self.statistics.async_import_invoices(self.data["paid_invoices"])
 
     async def _async_update_data(self) -> dict | None:
         """Update data."""
+        # Evaluated every poll, so enabling debug logging takes effect directly
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
         if self._debug:
-            await self.get_data()
-            if self.data:
-                _LOGGER.debug(f"Returned items: {self.data}")
+            self.client.start_capture()
+        if self.client.scheduler is not None:
+            # Spread the polls of the accounts sharing the API host
+            await self.client.scheduler.async_stagger()
+        started = time.monotonic()
+        self._last_poll = {}
 
         try:
             await self.get_data()
         except Exception as exception:
             _LOGGER.warning(f"Exception {exception}")
 
+        if self.data:
+            # Aggregated once per update, all invoice sensors read the result
+            self.data["invoice_summary"] = aggregate_invoices(
+                self.data, dt_util.utcnow()
+            )
+
+        if self._debug:
+            self._record_debug_capture(started)
+            if self.data:
+                _LOGGER.debug("Returned items: %s", LazyPayload(self.data))
+
         if len(self.data) > 0:
             return self.data
         return {}
 
+    def _record_debug_capture(self, started: float) -> None:
+        """Record the requests and responses of the last poll for diagnostics."""
+        self.debug_captures.append(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "duration_ms": round((time.monotonic() - started) * 1000),
+                "requests": self.client.stop_capture(),
+                "responses": self._last_poll,
+            }
+        )
+        _LOGGER.debug(
+            "Poll took %s ms for %s requests",
+            self.debug_captures[-1]["duration_ms"],
+            len(self.debug_captures[-1]["requests"]),
+        )
+
     async def async_trigger_cleanup(self) -> None:
         """Trigger entity cleanup."""
         entity_reg: er.EntityRegistry = er.async_get(self.hass)
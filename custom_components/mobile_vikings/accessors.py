@@ -0,0 +1,36 @@
+"""Compiled accessor paths into the MobileVikings coordinator data."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+# Placeholder in a path, replaced by the bundle id of the entity
+BUNDLE_ID: Final = object()
+
+
+def bundle_path(*keys: str) -> tuple:
+    """Return the path of a bundle, or of a key of a bundle, in a subscription."""
+    return ("balance", "bundles", BUNDLE_ID, *keys)
+
+
+class CompiledPath:
+    """Path into nested dictionaries, bound to the bundle id of an entity.
+
+    Resolving it is equivalent to utils.safe_get, without building a key list
+    and checking types on every call.
+    """
+
+    __slots__ = ("keys",)
+
+    def __init__(self, path: tuple, bundle_id: str | None = None) -> None:
+        """Compile the path, substituting the bundle id placeholder."""
+        self.keys = tuple(bundle_id if key is BUNDLE_ID else key for key in path)
+
+    def __call__(self, data: Any, default: Any = None) -> Any:
+        """Return the value at the path in data, or default when missing."""
+        try:
+            for key in self.keys:
+                data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+        return data
@@ -0,0 +1,142 @@
+"""Batched analytics of the bundles of all subscriptions."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import logging
+
+from .const import DATETIME_FORMAT, GIB, SECONDS_PER_DAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an API timestamp, cached as bundles keep their period across polls."""
+    return datetime.strptime(value, DATETIME_FORMAT)
+
+
+def bundle_key(bundle: dict) -> str:
+    """Return a composite key for a bundle like data_default, sms_loyalty."""
+    bundle_type = bundle.get("type", "unknown")
+    bundle_category = bundle.get("category", "unknown")
+    return f"{bundle_type}_{bundle_category}"
+
+
+def project_depletion(
+    now: datetime, total: float, used: float, daily_rate: float | None
+) -> datetime | None:
+    """Return when a bundle runs out at a daily usage rate.
+
+    None for unlimited bundles and bundles that are not used.
+    """
+    if total <= 0 or not daily_rate or daily_rate <= 0:
+        return None
+    return now + timedelta(days=max(total - used, 0) / daily_rate)
+
+
+def _percentage(part: float, total: float) -> float:
+    """Return part as a percentage of total, 0 for an unlimited total."""
+    return round((part / total) * 100, 2) if total > 0 else 0
+
+
+class BundleAnalytics:
+    """Enrich the bundles of all subscriptions in a single pass.
+
+    The client enriches the changed subscriptions of a poll with one instance,
+    so every bundle is evaluated against the same moment. Timestamps are
+    parsed once per distinct value. The API data is left untouched: enriched
+    copies of the subscriptions are returned.
+    """
+
+    def __init__(self, now: datetime | None = None) -> None:
+        """Initialize the analytics for the moment now, the current time by default."""
+        self.now = now or datetime.now(timezone.utc)
+
+    def enrich_subscription(self, subscription: dict) -> dict:
+        """Return a copy of the subscription with its bundles enriched by key."""
+        balance = subscription.get("balance")
+        if not isinstance(balance, dict) or not isinstance(
+            balance.get("bundles"), list
+        ):
+            return subscription
+        sim_info = subscription.get("sim") or {}
+        try:
+            bundles = {
+                bundle_key(bundle): self.enrich_bundle(bundle, sim_info)
+                for bundle in balance["bundles"]
+            }
+        except (KeyError, TypeError, ValueError) as exception:
+            _LOGGER.debug(
+                f"Failed to enrich bundles of {subscription.get('id')}: {exception}"
+            )
+            return {
+                key: value for key, value in subscription.items() if key != "balance"
+            }
+        return subscription | {"balance": balance | {"bundles": bundles}}
+
+    def enrich_bundle(self, bundle: dict, sim_info: dict) -> dict:
+        """Return a copy of the bundle with derived properties for the sensors."""
+        now = self.now
+        total = bundle.get("total", 0)
+        used = bundle.get("used", 0)
+
+        valid_from = parse_timestamp(bundle["valid_from"])
+        valid_until = parse_timestamp(bundle["valid_until"])
+        validity_seconds = (valid_until - valid_from).total_seconds()
+        elapsed_seconds = (now - valid_from).total_seconds()
+
+        enriched = bundle | {
+            "used_percentage": _percentage(used, total),
+            "period_percentage": round(
+                max(0, min((elapsed_seconds / validity_seconds) * 100, 100)), 2
+            ),
+            "remaining_days": max((valid_until - now).days, 0),
+            "unlimited": total <= 0,
+            "msisdn": sim_info.get("msisdn"),
+            "alias": sim_info.get("alias"),
+            **self._burn(total, used, elapsed_seconds, valid_until),
+        }
+        if bundle["type"] != "data":
+            return enriched
+
+        rlah_total = bundle.get("rlah_total", 0)
+        rlah_used = bundle.get("rlah_used", 0)
+        roam_row_total = bundle.get("roam_row_total", 0)
+        roam_row_used = bundle.get("roam_row_used", 0)
+        enriched |= {
+            "remaining_gb": round(max(total - used, 0) / GIB, 2),
+            "rlah_used_percentage": _percentage(rlah_used, rlah_total),
+            "rlah_remaining_gb": round(max(rlah_total - rlah_used, 0) / GIB, 2),
+            "roam_row_used_percentage": _percentage(roam_row_used, roam_row_total),
+            "roam_row_remaining_gb": round(
+                max(roam_row_total - roam_row_used, 0) / GIB, 2
+            ),
+        }
+        return enriched
+
+    def _burn(
+        self, total: float, used: float, elapsed_seconds: float, valid_until: datetime
+    ) -> dict:
+        """Return the average daily usage and the moment the bundle runs out.
+
+        The projected depletion assumes usage continues at the average rate of
+        the period so far. It is None for unlimited bundles, idle bundles and
+        periods that have not started yet.
+        """
+        if elapsed_seconds <= 0:
+            return {
+                "daily_burn_rate": None,
+                "projected_depletion": None,
+                "depletes_before_renewal": False,
+            }
+        daily_burn_rate = used / elapsed_seconds * SECONDS_PER_DAY
+        depletion = project_depletion(self.now, total, used, daily_burn_rate)
+        return {
+            "daily_burn_rate": round(daily_burn_rate, 2),
+            "projected_depletion": depletion.isoformat() if depletion else None,
+            "depletes_before_renewal": (
+                depletion is not None and depletion < valid_until
+            ),
+        }
@@ -0,0 +1,201 @@
+"""OAuth2 token management for the Mobile Vikings / JimMobile API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+import logging
+
+from .const import (
+    CLIENT_ID,
+    CLIENT_ID_JIMMOBILE,
+    CLIENT_SECRET,
+    CLIENT_SECRET_TAG,
+    CLIENT_SECRET_TAG_JIMMOBILE,
+    CLIENT_SECRET_VALUE_JIMMOBILE,
+    JIM_MOBILE,
+    TOKEN_REFRESH_MARGIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AuthenticationError(Exception):
+    """Exception raised for authentication errors."""
+
+    pass
+
+
+class TokenManager:
+    """Keep a valid access token for the Mobile Vikings / JimMobile API.
+
+    Token requests are single-flight: concurrent callers needing a new token
+    wait on the refresh already in progress instead of starting their own. The
+    token is refreshed proactively when it is about to expire.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        mobile_platform: str,
+        request_token: Callable[[dict], Awaitable],
+        margin: timedelta = TOKEN_REFRESH_MARGIN,
+        on_update: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the token manager.
+
+        Parameters
+        ----------
+        username : str
+            The username for authenticating with the API.
+        password : str
+            The password for authenticating with the API.
+        mobile_platform : str
+            The name of the mobile platform (Mobile Vikings or Jim Mobile).
+        request_token : Callable
+            Coroutine function posting a token payload and returning the raw response.
+        margin : timedelta, optional
+            How long before its expiry the access token is refreshed.
+        on_update : Callable, optional
+            Called when a new token set was obtained, to persist it.
+
+        """
+        self.username = username
+        self.password = password
+        self.margin = margin
+        self.refresh_token = None
+        self.access_token = None
+        self.expires_in = None
+        self.access_token_expiry = None
+        self._request_token = request_token
+        self.on_update = on_update
+        self._lock = asyncio.Lock()
+        if mobile_platform == JIM_MOBILE:
+            self._client_payload = {
+                "client_id": CLIENT_ID_JIMMOBILE,
+                CLIENT_SECRET_TAG_JIMMOBILE: CLIENT_SECRET_VALUE_JIMMOBILE,
+            }
+        else:
+            self._client_payload = {
+                "client_id": CLIENT_ID,
+                CLIENT_SECRET_TAG: CLIENT_SECRET,
+            }
+
+    def is_token_valid(self, margin: timedelta = timedelta(0)) -> bool:
+        """Check if the current access token is valid for at least margin."""
+        return bool(
+            self.access_token
+            and self.access_token_expiry
+            and datetime.now(timezone.utc) + margin < self.access_token_expiry
+        )
+
+    async def async_get_access_token(self) -> str:
+        """Return a valid access token, refreshing it when it is about to expire."""
+        if self.is_token_valid(self.margin):
+            return self.access_token
+        async with self._lock:
+            # Another caller may have refreshed the token while we waited
+            if not self.is_token_valid(self.margin):
+                await self._async_refresh()
+            return self.access_token
+
+    async def async_refresh(self, rejected_token: str | None) -> str:
+        """Refresh the access token after it was rejected by the API.
+
+        Only one refresh happens for a given rejected token, concurrent callers
+        get the token obtained by the first one.
+        """
+        async with self._lock:
+            if self.access_token == rejected_token:
+                self.access_token = None
+                await self._async_refresh()
+            return self.access_token
+
+    async def _async_refresh(self) -> None:
+        """Request a new access token, with the refresh token when available."""
+        if self.refresh_token:
+            _LOGGER.debug("Access token renewal with refresh token")
+            try:
+                await self._async_request_token(
+                    {
+                        "refresh_token": self.refresh_token,
+                        "grant_type": "refresh_token",
+                    }
+                )
+                return
+            except AuthenticationError as exception:
+                _LOGGER.debug(f"Refresh token rejected, logging in again: {exception}")
+                self.refresh_token = None
+
+        _LOGGER.debug("Requesting new access token")
+        await self._async_request_token(
+            {
+                "username": self.username,
+                "password": self.password,
+                "grant_type": "password",
+            }
+        )
+
+    async def _async_request_token(self, payload: dict) -> None:
+        """Request an access token with the given payload."""
+        # The client payload is added last, JimMobile overrides the grant_type
+        response = await self._request_token(payload | self._client_payload)
+
+        data = response.json()
+        if response.status_code == 200:
+            self.access_token = data.get("access_token")
+            self.expires_in = data.get("expires_in")
+            self.access_token_expiry = datetime.now(timezone.utc) + timedelta(
+                seconds=self.expires_in
+            )
+            self.refresh_token = data.get("refresh_token")
+            if self.on_update:
+                self.on_update()
+        elif response.status_code == 400 and payload.get("grant_type") == "password":
+            raise AuthenticationError(
+                f"Invalid grant_type - {data.get('error_description')}"
+            )
+        elif (
+            response.status_code in (400, 401)
+            and payload.get("grant_type") == "refresh_token"
+        ):
+            raise AuthenticationError(f"Unauthorized - {data.get('error_description')}")
+        else:
+            raise AuthenticationError("Failed to authenticate")
+
+    def restore(self, tokens: dict | None) -> None:
+        """Restore a token set exported by as_dict.
+
+        An access token without a valid expiry, or one that already expired, is
+        dropped. The refresh token is kept so no password login is needed.
+        """
+        if not tokens:
+            return
+        self.refresh_token = tokens.get("refresh_token")
+        self.expires_in = tokens.get("expires_in")
+        try:
+            expiry = datetime.fromisoformat(tokens["expires_at"])
+        except (KeyError, TypeError, ValueError):
+            expiry = None
+        if expiry and expiry.tzinfo and expiry > datetime.now(timezone.utc):
+            self.access_token = tokens.get("access_token")
+            self.access_token_expiry = expiry
+            _LOGGER.debug(f"Restored access token valid until {expiry}")
+        else:
+            self.access_token = None
+            self.access_token_expiry = None
+
+    def as_dict(self) -> dict:
+        """Export the token set."""
+        return {
+            "refresh_token": self.refresh_token,
+            "access_token": self.access_token,
+            "expires_in": self.expires_in,
+            "expires_at": (
+                self.access_token_expiry.isoformat()
+                if self.access_token_expiry
+                else None
+            ),
+        }
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -19,8 +20,10 @@ from homeassistant.helpers.typing import StateType
 from homeassistant.util import slugify
 
 from . import MobileVikingsDataUpdateCoordinator
+from .accessors import bundle_path
 from .const import DOMAIN, MOBILE_VIKINGS
 from .entity import MobileVikingsEntity
+from .registry import DescriptionRegistry, async_setup_entity_discovery
 from .utils import safe_get
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,6 +47,12 @@ class MobileVikingsBinarySensorDescription(SensorEntityDescription):
     bundle_type: str | None = None
     bundle_category: str | None = None
     mobile_platforms: tuple[str, ...] | None = None
+    # Paths resolved once per coordinator update, used instead of the functions
+    available_path: tuple | None = None
+    value_path: tuple | None = None
+    value_default: Any = None
+    attributes_path: tuple | None = None
+    placeholder_paths: dict[str, tuple] | None = None
 
 
 SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsBinarySensorDescription, ...] = (
@@ -215,10 +224,7 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsBinarySensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_data_usage_alert"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        )
-        is not None,
+        available_path=bundle_path(),
         value_fn=lambda data, bundle_id: (
             safe_get(
                 data, ["balance", "bundles", bundle_id, "used_percentage"], default=0
@@ -235,14 +241,8 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsBinarySensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         device_class=BinarySensorDeviceClass.PROBLEM,
         icon="mdi:alarm-light",
         mobile_platforms=(MOBILE_VIKINGS,),
@@ -278,14 +278,8 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsBinarySensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         device_class=BinarySensorDeviceClass.PROBLEM,
         icon="mdi:earth",
         mobile_platforms=(MOBILE_VIKINGS,),
@@ -293,6 +287,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsBinarySensorDescription, ...] = (
 )
 
 
+DESCRIPTIONS = DescriptionRegistry(
+    subscription=SUBSCRIPTION_SENSOR_TYPES,
+    bundle=BUNDLE_SENSOR_TYPES,
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -303,58 +303,16 @@ async def async_setup_entry(
     coordinator: MobileVikingsDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         "coordinator"
     ]
-    entities: list[MobileVikingsBinarySensor] = []
-    mobile_platform = coordinator.client.mobile_platform
 
-    for subscription_id, subscription_data in coordinator.data.get(
-        "subscriptions", []
-    ).items():
-        for sensor_type in SUBSCRIPTION_SENSOR_TYPES:
-            if (
-                not sensor_type.mobile_platforms
-                or mobile_platform not in sensor_type.mobile_platforms
-            ):
-                _LOGGER.debug(
-                    f"Skipping {sensor_type.key}-{sensor_type.translation_key} for mobile platform {mobile_platform}"
-                )
-                continue
-            _LOGGER.debug(
-                f"Searching for {sensor_type.key}-{sensor_type.translation_key}"
-            )
-            if (
-                sensor_type.subscription_types is None
-                or subscription_data["type"] in sensor_type.subscription_types
-            ):
-                if sensor_type.key in coordinator.data:
-                    entities.append(
-                        MobileVikingsBinarySensor(
-                            coordinator, sensor_type, entry, subscription_id, None
-                        )
-                    )
-
-        bundles = subscription_data.get("balance", {}).get("bundles", {})
-        for bundle_id, bundle in bundles.items():
-            bundle_type = bundle.get("type")
-            for sensor_type in BUNDLE_SENSOR_TYPES:
-                if mobile_platform not in sensor_type.mobile_platforms:
-                    continue
-                if (
-                    sensor_type.subscription_types is None
-                    or subscription_data["type"] in sensor_type.subscription_types
-                ):
-                    if sensor_type.bundle_type == bundle_type:
-                        entities.append(
-                            MobileVikingsBinarySensor(
-                                coordinator,
-                                sensor_type,
-                                entry,
-                                subscription_id,
-                                bundle_id,
-                            )
-                        )
-
-    async_add_entities(entities)
-    return
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        DESCRIPTIONS,
+        lambda description, idx, bundle_id: MobileVikingsBinarySensor(
+            coordinator, description, entry, idx, bundle_id
+        ),
+        async_add_entities,
+    )
 
 
 class MobileVikingsBinarySensor(MobileVikingsEntity, BinarySensorEntity):
@@ -382,35 +340,11 @@ class MobileVikingsBinarySensor(MobileVikingsEntity, BinarySensorEntity):
         self.idx = idx
         prefix_part = f"_{slugify(entity_id_prefix)}" if entity_id_prefix else ""
         self.entity_id = f"binary_sensor.{DOMAIN}{prefix_part}_{description.unique_id_fn(self.item, self.bundle_id)}"
-        if hasattr(description, "translation_placeholders_fn") and callable(
-            description.translation_placeholders_fn
-        ):
-            self._attr_translation_placeholders = (
-                description.translation_placeholders_fn(self.item, self.bundle_id)
-            )
         self._value: StateType = None
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.entity_description.value_fn:
-            return bool(self.entity_description.value_fn(self.item, self.bundle_id))
+        if self.entity_description.value_fn or self.entity_description.value_path:
+            return bool(self.snapshot.value)
         return self._attr_is_on
-
-    @property
-    def extra_state_attributes(self):
-        """Return attributes for sensor."""
-        if not self.coordinator.data:
-            return {}
-        attributes = {
-            "last_synced": self.last_synced,
-        }
-        if (
-            self.entity_description.attributes_fn
-            and self.entity_description.attributes_fn(self.item, self.bundle_id)
-            is not None
-        ):
-            return attributes | self.entity_description.attributes_fn(
-                self.item, self.bundle_id
-            )
-        return attributes
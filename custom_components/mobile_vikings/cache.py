@@ -0,0 +1,174 @@
+"""Caches used by the MobileVikings client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import hashlib
+import logging
+import time
+from typing import Any, NamedTuple
+
+from .const import PRODUCT_CACHE_SIZE, PRODUCT_CACHE_TTL, RESPONSE_CACHE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProductCache:
+    """TTL and LRU bounded cache of product details, keyed by product id.
+
+    Subscriptions sharing a product share one entry, and concurrent lookups of
+    the same product wait on a single request. The cache can be exported with
+    as_dict and restored with restore, so it survives a restart.
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta = PRODUCT_CACHE_TTL,
+        max_size: int = PRODUCT_CACHE_SIZE,
+    ) -> None:
+        """Initialize the product cache."""
+        self.ttl = ttl.total_seconds()
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+
+    def get(self, product_id: str) -> dict | None:
+        """Return the cached product, or None when missing or expired."""
+        entry = self._entries.get(product_id)
+        if entry is None:
+            return None
+        fetched_at, product = entry
+        if time.time() - fetched_at > self.ttl:
+            del self._entries[product_id]
+            return None
+        self._entries.move_to_end(product_id)
+        return product
+
+    def set(self, product_id: str, product: dict, fetched_at: float | None = None):
+        """Store a product, evicting the least recently used entries."""
+        self._entries[product_id] = (fetched_at or time.time(), product)
+        self._entries.move_to_end(product_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def async_get(
+        self, product_id: str, fetch: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        """Return the cached product or fetch it once for all concurrent callers."""
+        if (product := self.get(product_id)) is not None:
+            return product
+        if (pending := self._pending.get(product_id)) is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[product_id] = future
+        try:
+            product = await fetch()
+        except Exception as exception:
+            future.set_exception(exception)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            # Error payloads are returned but not cached, the next lookup retries
+            if isinstance(product, dict) and product and "error" not in product:
+                self.set(product_id, product)
+            future.set_result(product)
+            return product
+        finally:
+            self._pending.pop(product_id, None)
+
+    def as_dict(self) -> dict:
+        """Export the cache in a JSON serializable format."""
+        return {
+            product_id: {"fetched_at": fetched_at, "product": product}
+            for product_id, (fetched_at, product) in self._entries.items()
+        }
+
+    def restore(self, data: dict | None) -> None:
+        """Restore the entries exported by as_dict, dropping expired ones."""
+        if not isinstance(data, dict):
+            return
+        for product_id, entry in data.items():
+            try:
+                if "error" in entry["product"]:
+                    continue
+                self.set(product_id, entry["product"], entry["fetched_at"])
+            except (KeyError, TypeError):
+                _LOGGER.debug("Ignoring invalid product cache entry %s", product_id)
+        for product_id in list(self._entries):
+            self.get(product_id)
+
+
+class CachedResponse(NamedTuple):
+    """Validators, content hash and parsed body of a cached response."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    data: Any
+
+
+class ResponseCache:
+    """LRU cache of the parsed responses of GET requests, keyed by URL.
+
+    Requests send the ETag and Last-Modified of the cached response, a 304
+    reuses the cached body. When the API does not support validators, the
+    hash of the response body detects an unchanged payload, which is not
+    decoded again. Cached bodies are returned as is, callers must not modify
+    them.
+    """
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE) -> None:
+        """Initialize an empty cache."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return the conditional request headers of a URL."""
+        if (entry := self._entries.get(url)) is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, url: str) -> Any | None:
+        """Return the cached body of a URL after a 304, None when it was evicted."""
+        if (entry := self._entries.get(url)) is None:
+            return None
+        self._entries.move_to_end(url)
+        self.hits += 1
+        return entry.data
+
+    def store(self, url: str, response) -> Any:
+        """Return the parsed body of a response, reusing it when unchanged."""
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        entry = self._entries.get(url)
+        if entry is not None and entry.digest == digest:
+            self.hits += 1
+            data = entry.data
+        else:
+            self.misses += 1
+            data = response.json()
+        self._entries[url] = CachedResponse(
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            digest,
+            data,
+        )
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return data
+
+    def as_dict(self) -> dict:
+        """Return the counters of the cache, for diagnostics."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -1,36 +1,53 @@
 """Module containing the MobileVikingsClient class for interacting with the Mobile Vikings API."""
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+from datetime import datetime, timezone
 import logging
+import time
 
 from homeassistant.helpers.httpx_client import get_async_client
 
+from .analytics import BundleAnalytics
+from .auth import TokenManager
+from .cache import ProductCache, ResponseCache
 from .const import (
     BASE_URL,
     BASE_URL_JIMMOBILE,
-    CLIENT_ID,
-    CLIENT_ID_JIMMOBILE,
-    CLIENT_SECRET,
-    CLIENT_SECRET_TAG,
-    CLIENT_SECRET_TAG_JIMMOBILE,
-    CLIENT_SECRET_VALUE_JIMMOBILE,
+    DEFAULT_MAX_CONCURRENCY,
+    INVOICE_PAGE_SIZE,
     JIM_MOBILE,
     MOBILE_VIKINGS,
+    PRODUCT_CACHE_TTL,
+    SUBSCRIPTION_REUSE_MAX_AGE,
 )
+from .exceptions import (
+    BadGatewayException,
+    GatewayTimeoutException,
+    MobileVikingsServiceException,
+    TooManyRequestsException,
+)
+from .ledger import InvoiceLedger
+from .request_log import LazyPayload, RequestLog
+from .retry import RetryEngine, parse_retry_after
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class AuthenticationError(Exception):
-    """Exception raised for authentication errors."""
-
-    pass
-
-
 class MobileVikingsClient:
     """Asynchronous client for interacting with the Mobile Vikings API."""
 
-    def __init__(self, hass, username, password, mobile_platform, tokens=None):
+    def __init__(
+        self,
+        hass,
+        username,
+        password,
+        mobile_platform,
+        tokens=None,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        product_cache_ttl=PRODUCT_CACHE_TTL,
+        on_tokens_update=None,
+        scheduler=None,
+    ):
         """Initialize the MobileVikingsClient.
 
         Parameters
@@ -44,112 +61,67 @@ class MobileVikingsClient:
         mobile_platform : str
             The name of the mobile platform to connect to (Mobile Vikings or Jim Mobile).
         tokens : dict, optional
-            A dictionary containing token information (refresh_token, access_token, expiry).
+            A dictionary containing token information (refresh_token, access_token, expires_at).
+        max_concurrency : int, optional
+            The maximum number of API sections fetched in parallel by get_data,
+            and of subscriptions whose details are fetched in parallel.
+        product_cache_ttl : timedelta, optional
+            How long fetched product details are reused before being fetched again.
+        on_tokens_update : Callable, optional
+            Called when a new token set was obtained, to persist it.
+        scheduler : RequestScheduler, optional
+            The request scheduler shared by all config entries, whose connection
+            pool and rate limit are used. Without it, requests use the default
+            Home Assistant client and are not rate limited.
 
         """
         self.hass = hass
         self.username = username
         self.password = password
         self.mobile_platform = mobile_platform
-        self.refresh_token = None
-        self.access_token = None
-        self.expires_in = None
-        self.access_token_expiry = None
-        self.client = get_async_client(self.hass)
-
-        if tokens:
-            self.refresh_token = tokens.get("refresh_token")
-            self.access_token = tokens.get("access_token")
-            self.expires_in = tokens.get("expires_in")
-            if self.expires_in:
-                self.access_token_expiry = datetime.fromisoformat(str(self.expires_in))
+        self.scheduler = scheduler
+        self.client = scheduler.client if scheduler else get_async_client(self.hass)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._subscription_semaphore = asyncio.Semaphore(max_concurrency)
+        self.product_cache = ProductCache(ttl=product_cache_ttl)
+        self.response_cache = ResponseCache()
+        self.request_log = RequestLog()
+        self._enriched: dict[str, tuple] = {}
+        self._subscriptions: dict | None = None
+        self.invoice_ledger = InvoiceLedger()
+        self.retry = RetryEngine()
+        self._capture: list[dict] | None = None
+
+        self.token_manager = TokenManager(
+            username,
+            password,
+            mobile_platform,
+            self._request_token,
+            on_update=on_tokens_update,
+        )
+        self.token_manager.restore(tokens)
 
     async def close(self):
         """Set the client to none."""
         self.client = None
 
-    async def authenticate(self):
-        """Authenticate with the Mobile Vikings / JimMobile API."""
-        actual_client_id = (
-            CLIENT_ID_JIMMOBILE if self.mobile_platform == JIM_MOBILE else CLIENT_ID
-        )
-        actual_client_secret_tag = (
-            CLIENT_SECRET_TAG_JIMMOBILE
-            if self.mobile_platform == JIM_MOBILE
-            else CLIENT_SECRET_TAG
-        )
-        actual_client_secret_value = (
-            CLIENT_SECRET_VALUE_JIMMOBILE
-            if self.mobile_platform == JIM_MOBILE
-            else CLIENT_SECRET
-        )
-        if self._is_token_valid():
-            self.client.headers["Authorization"] = f"Bearer {self.access_token}"
-        else:
-            if self.refresh_token:
-                _LOGGER.debug("Access token renewal with refresh token")
-                await self._request_token(
-                    {
-                        "refresh_token": self.refresh_token,
-                        "grant_type": "refresh_token",
-                        "client_id": actual_client_id,
-                        actual_client_secret_tag: actual_client_secret_value,
-                    }
-                )
-            else:
-                _LOGGER.debug("Requesting new access token")
-                await self._request_token(
-                    {
-                        "username": self.username,
-                        "password": self.password,
-                        "grant_type": "password",
-                        "client_id": actual_client_id,
-                        actual_client_secret_tag: actual_client_secret_value,
-                    }
-                )
+    def start_capture(self):
+        """Start recording the timing of every request, for diagnostics."""
+        self._capture = []
 
-        if self._is_token_valid():
-            self.client.headers["Authorization"] = f"Bearer {self.access_token}"
-            return {
-                "refresh_token": self.refresh_token,
-                "access_token": self.access_token,
-                "expires_in": self.expires_in,
-            }
-        else:
-            return False
+    def stop_capture(self):
+        """Stop recording requests and return the recorded ones."""
+        capture, self._capture = self._capture or [], None
+        return capture
 
-    def _is_token_valid(self):
-        """Check if the current access token is valid."""
-        return (
-            self.access_token
-            and self.access_token_expiry
-            and datetime.now() < self.access_token_expiry
-        )
+    async def authenticate(self):
+        """Authenticate with the Mobile Vikings / JimMobile API."""
+        await self.token_manager.async_get_access_token()
+        return self.token_manager.as_dict()
 
     async def _request_token(self, payload):
-        """Request an access token with the given payload."""
-        response = await self.handle_request(
-            "/oauth2/token/", payload, "POST", True, True
-        )
-
-        data = response.json()
-        if response.status_code == 200:
-            self.access_token = data.get("access_token")
-            self.expires_in = data.get("expires_in")
-            self.access_token_expiry = datetime.now() + timedelta(
-                seconds=self.expires_in
-            )
-            self.refresh_token = data.get("refresh_token")
-        elif response.status_code == 400 and payload.get("grant_type") == "password":
-            raise AuthenticationError(
-                f"Invalid grant_type - {data.get('error_description')}"
-            )
-        elif (
-            response.status_code == 401 and payload.get("grant_type") == "refresh_token"
-        ):
-            raise AuthenticationError(f"Unauthorized - {data.get('error_description')}")
-        else:
-            raise AuthenticationError("Failed to authenticate")
+        """Post a token request and return the raw response."""
+        return await self.handle_request("/oauth2/token/", payload, "POST", True, True)
 
     async def handle_request(
         self,
@@ -161,51 +133,89 @@ class MobileVikingsClient:
     ):
         """Handle the HTTP request by logging the request details and handling the response."""
         # Ensure access token is valid before making the request
+        access_token = None
         if authenticate_request is False:
-            await self.authenticate()
+            access_token = await self.token_manager.async_get_access_token()
 
         if self.mobile_platform == MOBILE_VIKINGS:
             url = BASE_URL + endpoint
         else:
             url = BASE_URL_JIMMOBILE + endpoint
-        request_details = f"{method} request to: {url}"
+        # Payloads are only masked and formatted when the record is emitted
+        if payload:
+            _LOGGER.debug(
+                "%s request to: %s, Payload: %s", method, url, LazyPayload(payload)
+            )
+        else:
+            _LOGGER.debug("%s request to: %s", method, url)
 
-        # Anonymize sensitive information like passwords
-        if payload and ("password" in payload or "client_secret" in payload):
-            anonymized_payload = {
-                key: "********" if key in {"password", "client_secret"} else value
-                for key, value in payload.items()
-            }
-            request_details += f", Payload: {anonymized_payload}"
-        elif payload:
-            request_details += f", Payload: {payload}"
+        # Parsed bodies of GET requests are cached, and revalidated when possible
+        cacheable = method == "GET" and not return_raw_response
+        cache_headers = (
+            self.response_cache.conditional_headers(url) if cacheable else {}
+        )
 
-        _LOGGER.debug(request_details)
+        started = time.monotonic()
+        response = await self._send(
+            method, endpoint, url, payload, access_token, cache_headers
+        )
+        if response.status_code == 401 and access_token is not None:
+            # The token got revoked before its expiry, refresh it once and retry
+            _LOGGER.debug("Access token rejected, refreshing and retrying")
+            access_token = await self.token_manager.async_refresh(access_token)
+            response = await self._send(
+                method, endpoint, url, payload, access_token, cache_headers
+            )
 
-        # Determine the appropriate method to call based on the HTTP method
-        if method == "GET":
-            response = await self.client.get(url)
-        elif method == "POST":
-            response = await self.client.post(url, data=payload)
-        # Add support for other HTTP methods if needed
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+        duration_ms = round((time.monotonic() - started) * 1000)
+        self.request_log.record(
+            method,
+            endpoint,
+            response.status_code,
+            duration_ms,
+            payload,
+            response.content,
+        )
+        if self._capture is not None:
+            self._capture.append(
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status": response.status_code,
+                    "duration_ms": duration_ms,
+                }
+            )
+
+        if response.status_code == 304 and cacheable:
+            if (data := self.response_cache.not_modified(url)) is not None:
+                _LOGGER.debug("Not modified: %s", url)
+                return data
+            # The cached body got evicted in the meantime, fetch it again
+            response = await self._send(method, endpoint, url, payload, access_token)
 
         if return_raw_response:
-            _LOGGER.debug(f"Response data: {response.text}")
+            _LOGGER.debug("Response data: %s", LazyPayload(response.content))
             return response
 
         if response.status_code == 200:
-            data = response.json()
-            _LOGGER.debug(f"Response data: {data}")
+            if cacheable:
+                data = self.response_cache.store(url, response)
+            else:
+                data = response.json()
+            _LOGGER.debug("Response data: %s", LazyPayload(data))
             return data
         elif response.status_code == 404:
             error_data = response.json()
-            _LOGGER.debug(f"404 Error: {error_data}")
+            _LOGGER.debug("404 Error: %s", LazyPayload(error_data))
             return error_data
+        elif response.status_code == 429:
+            raise TooManyRequestsException(
+                f"Rate limited on {endpoint}",
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
         elif str(response.status_code).startswith("4"):
             error_data = response.json()
-            _LOGGER.debug(f"{response.status_code} Error: {error_data}")
+            _LOGGER.debug("%s Error: %s", response.status_code, LazyPayload(error_data))
             return False
         else:
             error_message = f"Request failed. Status code: {response.status_code}"
@@ -214,7 +224,39 @@ class MobileVikingsClient:
                 error_message += f", Error: {error_data}"
             except Exception:
                 pass
-            raise Exception(error_message)
+            if response.status_code == 502:
+                raise BadGatewayException(error_message)
+            if response.status_code == 504:
+                raise GatewayTimeoutException(error_message)
+            raise MobileVikingsServiceException(error_message)
+
+    async def _send(self, method, endpoint, url, payload, access_token, headers=None):
+        """Send the HTTP request, authorized with the given access token.
+
+        Extra headers, such as the conditional request headers, are added to
+        the request. Transient failures are retried by the retry engine, every attempt waits
+        for the shared rate limit.
+        """
+        headers = dict(headers or {})
+        if access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+        # Determine the appropriate method to call based on the HTTP method
+        if method == "GET":
+            kwargs = {}
+        elif method == "POST":
+            kwargs = {"data": payload}
+        else:
+            # Add support for other HTTP methods if needed
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        async def send_attempt(timeout):
+            if self.scheduler is not None:
+                await self.scheduler.rate_limiter.async_acquire()
+            return await self.client.request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            )
+
+        return await self.retry.async_send(endpoint, send_attempt)
 
     async def get_customer_info(self):
         """Fetch customer information from the Mobile Vikings API.
@@ -242,76 +284,96 @@ class MobileVikingsClient:
     async def get_product_details(self, product_id):
         """Fetch product details from the Mobile Vikings API.
 
+        Product details are served from the product cache while they are fresh.
+
         Returns
         -------
         dict or None: A dictionary containing product details, or None if request fails.
 
         """
-        return await self.handle_request(f"/products/{product_id}")
-
-    def enrich_bundle(self, bundle, sim_info):
-        """Add derived properties to a bundle for easy sensor creation."""
-        now = datetime.now(timezone.utc)
-        total = bundle.get("total", 0)
-        used = bundle.get("used", 0)
-        rlah_total = bundle.get("rlah_total", 0)
-        rlah_used = bundle.get("rlah_used", 0)
-        roam_row_total = bundle.get("roam_row_total", 0)
-        roam_row_used = bundle.get("roam_row_used", 0)
-
-        valid_from = datetime.strptime(bundle["valid_from"], "%Y-%m-%dT%H:%M:%S%z")
-        valid_until = datetime.strptime(bundle["valid_until"], "%Y-%m-%dT%H:%M:%S%z")
-        validity_seconds = (valid_until - valid_from).total_seconds()
-        elapsed_seconds = (now - valid_from).total_seconds()
-
-        bundle["used_percentage"] = round((used / total) * 100, 2) if total > 0 else 0
-        bundle["period_percentage"] = round(
-            max(0, min((elapsed_seconds / validity_seconds) * 100, 100)), 2
-        )
-        bundle["remaining_days"] = max((valid_until - now).days, 0)
-        bundle["unlimited"] = total <= 0
-        bundle["msisdn"] = sim_info.get("msisdn")
-        bundle["alias"] = sim_info.get("alias")
-        if bundle["type"] != "data":
-            return bundle
-
-        bundle["remaining_gb"] = round(max(total - used, 0) / (1024**3), 2)
-        bundle["rlah_used_percentage"] = (
-            round((rlah_used / rlah_total) * 100, 2) if rlah_total > 0 else 0
-        )
-        bundle["rlah_remaining_gb"] = round(
-            max(rlah_total - rlah_used, 0) / (1024**3), 2
-        )
-        bundle["roam_row_used_percentage"] = (
-            round((roam_row_used / roam_row_total) * 100, 2)
-            if roam_row_total > 0
-            else 0
+        return await self.product_cache.async_get(
+            str(product_id),
+            lambda: self.handle_request(f"/products/{product_id}"),
         )
-        bundle["roam_row_remaining_gb"] = round(
-            max(roam_row_total - roam_row_used, 0) / (1024**3), 2
-        )
-
-        return bundle
-
-    def build_bundle_key(self, bundle: dict) -> str:
-        """Return a composite key for a bundle like data_default, sms_loyalty."""
-        bundle_type = bundle.get("type", "unknown")
-        bundle_category = bundle.get("category", "unknown")
-        return f"{bundle_type}_{bundle_category}"
 
     async def get_subscriptions(self):
-        """Fetch subscriptions and enrich each bundle individually."""
+        """Fetch subscriptions and enrich their bundles in one batched pass.
+
+        The per-subscription balance, modem and product requests are fanned out
+        in parallel, bounded by the concurrency limit. The returned subscriptions
+        keep the order of the API response.
+        """
         subscriptions_raw = await self.handle_request("/subscriptions")
-        subscriptions = {}
+        results = await asyncio.gather(
+            *(
+                self._fetch_subscription_details(subscription)
+                for subscription in subscriptions_raw
+            )
+        )
+        return self._enrich_subscriptions(results)
+
+    def _enrich_subscriptions(self, results):
+        """Enrich the subscriptions, reusing the ones built from unchanged payloads.
 
-        for subscription in subscriptions_raw:
+        The response cache returns the same objects for unchanged payloads. A
+        subscription whose payloads are all the ones of the previous poll keeps
+        its enriched copy, and the previous dictionary is returned when no
+        subscription changed, so downstream consumers can skip them by identity.
+        The time derived properties are refreshed after SUBSCRIPTION_REUSE_MAX_AGE.
+        """
+        analytics = BundleAnalytics()
+        entries = {}
+        for subscription, sources in results:
             subscription_id = subscription.get("id")
+            entry = self._enriched.get(subscription_id)
+            if (
+                entry is None
+                or analytics.now - entry[1] >= SUBSCRIPTION_REUSE_MAX_AGE
+                or any(
+                    source is not previous
+                    for source, previous in zip(sources, entry[0])
+                )
+            ):
+                entry = (
+                    sources,
+                    analytics.now,
+                    analytics.enrich_subscription(subscription),
+                )
+            entries[subscription_id] = entry
+        unchanged = list(entries) == list(self._enriched) and all(
+            entry is self._enriched[subscription_id]
+            for subscription_id, entry in entries.items()
+        )
+        self._enriched = entries
+        if not unchanged or self._subscriptions is None:
+            self._subscriptions = {
+                subscription_id: entry[2] for subscription_id, entry in entries.items()
+            }
+        return self._subscriptions
+
+    async def _fetch_subscription_details(self, subscription):
+        """Fetch the balance or modem settings and the product of a subscription.
 
+        Failures are isolated to the subscription: it is returned with the
+        details that could be fetched. The API response is not modified, a
+        copy of the subscription is returned, with the payloads it was built
+        from.
+        """
+        subscription_id = subscription.get("id")
+        raw_subscription = subscription
+        subscription = dict(subscription)
+        balance = None
+        async with self._subscription_semaphore:
             # Fixed internet
             if subscription.get("type") == "fixed-internet":
-                subscription["modem_settings"] = await self.handle_request(
-                    f"/subscriptions/{subscription_id}/modem/settings"
-                )
+                try:
+                    subscription["modem_settings"] = await self.handle_request(
+                        f"/subscriptions/{subscription_id}/modem/settings"
+                    )
+                except Exception as e:
+                    _LOGGER.debug(
+                        f"Failed to fetch modem settings for {subscription_id}: {e}"
+                    )
             else:
                 sim_info = subscription.get("sim", {})
                 if sim_info.get("msisdn"):
@@ -321,26 +383,31 @@ class MobileVikingsClient:
                         )
                         # usage = await self.handle_request(f"/subscriptions/{subscription_id}/usage-summary")
                         # subscription["usage"] = usage
-                        bundles = balance.get("bundles", [])
-                        subscription["balance"] = balance
-                        # Remove "product" if present
-                        subscription["balance"].pop("product", None)
-                        subscription["balance"]["bundles"] = {
-                            self.build_bundle_key(b): self.enrich_bundle(b, sim_info)
-                            for b in bundles
+                        # Remove "product" if present, bundles are enriched later
+                        subscription["balance"] = {
+                            key: value
+                            for key, value in balance.items()
+                            if key != "product"
                         }
+                        subscription["balance"].setdefault("bundles", [])
                     except Exception as e:
                         _LOGGER.debug(
                             f"Failed to fetch balance for {subscription_id}: {e}"
                         )
 
             # Product details
-            subscription["product"] = await self.get_product_details(
-                subscription.get("product_id")
-            )
-            subscriptions[subscription_id] = subscription
-
-        return subscriptions
+            try:
+                subscription["product"] = await self.get_product_details(
+                    subscription.get("product_id")
+                )
+            except Exception as e:
+                _LOGGER.debug(f"Failed to fetch product for {subscription_id}: {e}")
+        return subscription, (
+            raw_subscription,
+            subscription.get("modem_settings"),
+            balance,
+            subscription.get("product"),
+        )
 
     async def get_unpaid_invoices(self):
         """Fetch unpaid invoices from the Mobile Vikings API."""
@@ -350,58 +417,120 @@ class MobileVikingsClient:
         return invoices
 
     async def get_paid_invoices(self):
-        """Fetch paid invoices from the Mobile Vikings API."""
-        invoices = await self.handle_request("/invoices?status=paid")
-        return invoices
+        """Sync the paid invoices ledger with the Mobile Vikings API.
+
+        Paid invoices are immutable and returned newest first, so pages are only
+        fetched until an invoice already in the ledger shows up. When the ledger
+        does not match the total reported by the API, for instance because an
+        older invoice got paid, the whole history is synced again.
+        """
+        total_items = await self._sync_paid_invoices(incremental=True)
+        if total_items is not None and total_items != len(self.invoice_ledger):
+            _LOGGER.debug(
+                f"Paid invoices ledger out of sync ({len(self.invoice_ledger)}/{total_items}), full sync"
+            )
+            await self._sync_paid_invoices(incremental=False)
+        return self.invoice_ledger.as_section()
+
+    async def _sync_paid_invoices(self, incremental):
+        """Fetch pages of paid invoices into the ledger.
+
+        An incremental sync merges the new invoices, a full sync replaces the
+        ledger by all fetched pages.
+
+        Returns the total number of paid invoices reported by the API.
+        """
+        page = 1
+        total_items = None
+        new_invoices = []
+        while True:
+            response = await self.handle_request(
+                f"/invoices?status=paid&page={page}&per_page={INVOICE_PAGE_SIZE}"
+            )
+            if not isinstance(response, dict) or "results" not in response:
+                raise ValueError(f"Unexpected paid invoices response: {response}")
+            if total_items is None:
+                total_items = response.get("total_items")
+            results = response["results"]
+            known = [self.invoice_ledger.is_known(invoice) for invoice in results]
+            if incremental and any(known):
+                new_invoices.extend(results[: known.index(True)])
+                break
+            new_invoices.extend(results)
+            if len(results) < INVOICE_PAGE_SIZE or (
+                total_items is not None and page * INVOICE_PAGE_SIZE >= total_items
+            ):
+                break
+            page += 1
+
+        if not incremental:
+            # A full sync holds every paid invoice, it replaces the ledger
+            self.invoice_ledger.replace(new_invoices)
+            _LOGGER.debug(f"Synced {len(self.invoice_ledger)} paid invoices")
+        elif added := self.invoice_ledger.merge(new_invoices):
+            _LOGGER.debug(f"Added {added} paid invoices to the ledger")
+        return total_items
+
+    async def _fetch_section(self, fetch):
+        """Run a single section fetch, bounded by the concurrency limit.
+
+        Errors are returned as an error dictionary instead of being raised, so
+        one failing section does not cancel the others.
+        """
+        async with self._semaphore:
+            try:
+                return await fetch()
+            except Exception as e:
+                return {"error": str(e)}
 
-    async def get_data(self):
+    async def get_data(self, sections=None):
         """Fetch customer info, loyalty points balance, invoices and subscriptions from the Mobile Vikings API.
 
+        Parameters
+        ----------
+        sections : list, optional
+            The names of the sections to fetch, all sections when omitted.
+
         Returns
         -------
         dict
-            A dictionary containing customer info, loyalty points balance, subscriptions, and unpaid invoices.
+            A dictionary containing the requested sections: customer info, loyalty points balance, subscriptions, and invoices.
 
         Notes
         -----
+            The sections are fetched in parallel, bounded by max_concurrency.
             Errors in individual API calls will result in an error message being included in the respective section of the returned dictionary.
 
         """
-        try:
-            customer_info = await self.get_customer_info()
-        except Exception as e:
-            customer_info = {"error": str(e)}
-
-        try:
-            loyalty_points_balance = await self.get_loyalty_points_balance()
-        except Exception as e:
-            loyalty_points_balance = {"error": str(e)}
-
-        try:
-            subscriptions = await self.get_subscriptions()
-        except Exception as e:
-            subscriptions = {"error": str(e)}
-
-        try:
-            unpaid_invoices = await self.get_unpaid_invoices()
-        except Exception as e:
-            unpaid_invoices = {"error": str(e)}
-
-        try:
-            paid_invoices = await self.get_paid_invoices()
-        except Exception as e:
-            paid_invoices = {"error": str(e)}
+        fetchers = {
+            "customer_info": self.get_customer_info,
+            "loyalty_points_balance": self.get_loyalty_points_balance,
+            "subscriptions": self.get_subscriptions,
+            "unpaid_invoices": self.get_unpaid_invoices,
+            "paid_invoices": self.get_paid_invoices,
+        }
+        fetchers = {
+            section: fetch
+            for section, fetch in fetchers.items()
+            if sections is None or section in sections
+        }
+
+        if not fetchers:
+            # No section is due, skip the token round-trip
+            results = []
+        else:
+            # Authenticate once up front so the parallel requests share one token
+            try:
+                await self.authenticate()
+            except Exception as e:
+                results = [{"error": str(e)} for _ in fetchers]
+            else:
+                results = await asyncio.gather(
+                    *(self._fetch_section(fetch) for fetch in fetchers.values())
+                )
 
         return {
-            "timestamp": datetime.now().isoformat(),
-            "customer_info": customer_info,
-            "loyalty_points_balance": loyalty_points_balance,
-            "subscriptions": subscriptions,
-            "unpaid_invoices": unpaid_invoices,
-            "paid_invoices": paid_invoices,
-            "tokens": {
-                "refresh_token": self.refresh_token,
-                "access_token": self.access_token,
-                "expires_in": self.expires_in,
-            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **dict(zip(fetchers, results)),
+            "product_cache": self.product_cache.as_dict(),
         }
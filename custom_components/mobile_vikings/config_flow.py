@@ -21,7 +21,14 @@ from homeassistant.helpers.typing import UNDEFINED
 import voluptuous as vol
 
 from .client import MobileVikingsClient
-from .const import DOMAIN, JIM_MOBILE, MOBILE_VIKINGS, NAME
+from .const import (
+    CONF_COMPACT_INVOICES,
+    DEFAULT_COMPACT_INVOICES,
+    DOMAIN,
+    JIM_MOBILE,
+    MOBILE_VIKINGS,
+    NAME,
+)
 from .exceptions import BadCredentialsException, MobileVikingsServiceException
 from .models import MobileVikingsConfigEntryData
 
@@ -170,6 +177,8 @@ class MobileVikingsOptionsFlow(MobileVikingsCommonFlow, OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize MobileVikings options flow."""
         super().__init__(initial_data=config_entry.data)  # type: ignore[arg-type]
+        self.initial_options = dict(config_entry.options)
+        self.new_options: dict[str, Any] = {}
 
     @callback
     def finish_flow(self) -> FlowResult:
@@ -182,10 +191,9 @@ class MobileVikingsOptionsFlow(MobileVikingsCommonFlow, OptionsFlow):
                 data=new_data,
                 title=self.new_title or UNDEFINED,
             )
-            self.hass.async_create_task(
-                self.hass.config_entries.async_reload(self._config_entry_id)
-            )
-        return self.async_create_entry(title="", data={})
+        return self.async_create_entry(
+            title="", data=self.initial_options | self.new_options
+        )
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -195,9 +203,34 @@ class MobileVikingsOptionsFlow(MobileVikingsCommonFlow, OptionsFlow):
             step_id="init",
             menu_options=[
                 "password",
+                "invoices",
             ],
         )
 
+    async def async_step_invoices(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure how invoices are exposed in state attributes."""
+        if user_input is not None:
+            self.new_options |= user_input
+            _LOGGER.debug(
+                f"Compact invoice attributes set to {user_input[CONF_COMPACT_INVOICES]}"
+            )
+            return self.finish_flow()
+
+        fields = {
+            vol.Required(
+                CONF_COMPACT_INVOICES,
+                default=self.initial_options.get(
+                    CONF_COMPACT_INVOICES, DEFAULT_COMPACT_INVOICES
+                ),
+            ): cv.boolean,
+        }
+        return self.async_show_form(
+            step_id="invoices",
+            data_schema=vol.Schema(fields),
+        )
+
 
 class MobileVikingsConfigFlow(MobileVikingsCommonFlow, ConfigFlow, domain=DOMAIN):
     """Handle a config flow for MobileVikings."""
@@ -16,6 +16,10 @@ ATTRIBUTION: Final = "Data provided by MobileVikings"
 
 # Date and time format used in the Mobile Vikings API responses
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+# Unit conversions, data bundles are reported in bytes
+GIB = 1024**3
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
 
 MOBILE_VIKINGS = "Mobile Vikings"
 JIM_MOBILE = "Jim Mobile"
@@ -39,8 +43,105 @@ BASE_URL = "https://uwa.mobilevikings.be/latest/mv"
 BASE_URL_JIMMOBILE = "https://uwa.mobilevikings.be/jim"
 
 COORDINATOR_UPDATE_INTERVAL = timedelta(minutes=15)
+# Update interval of every API section, the coordinator polls at the shortest one
+SECTION_UPDATE_INTERVALS: Final = {
+    "customer_info": timedelta(hours=12),
+    "loyalty_points_balance": timedelta(hours=1),
+    "subscriptions": COORDINATOR_UPDATE_INTERVAL,
+    "unpaid_invoices": timedelta(hours=1),
+    "paid_invoices": timedelta(hours=6),
+}
+# Margin within which a section counts as due, to absorb poll drift
+SCHEDULER_TOLERANCE = timedelta(minutes=1)
+# Bounds of the balance update interval, adapted to the bundle usage
+BALANCE_UPDATE_INTERVAL = SECTION_UPDATE_INTERVALS["subscriptions"]
+BALANCE_UPDATE_INTERVAL_MIN = timedelta(minutes=5)
+BALANCE_UPDATE_INTERVAL_MAX = timedelta(hours=1)
+# Used percentage from which balances are polled at the minimum interval
+BUNDLE_CRITICAL_PERCENTAGE = 90
+# Used percentage, or lead over the period percentage, from which polling speeds up
+BUNDLE_WARNING_PERCENTAGE = 75
+BUNDLE_BURN_MARGIN = 10
+# Usage samples kept per bundle to forecast its usage, a day at the base interval
+FORECAST_HISTORY_SIZE = 96
+# Minimum number of samples before a usage rate is fitted
+FORECAST_MIN_SAMPLES = 3
+# Usage records of the bundles kept on disk, old records are downsampled
+USAGE_HISTORY_RETENTION = timedelta(days=400)
+USAGE_HISTORY_DOWNSAMPLE_AFTER = timedelta(days=7)
+USAGE_HISTORY_DOWNSAMPLE_RESOLUTION = timedelta(hours=1)
+USAGE_HISTORY_COMPACT_INTERVAL = timedelta(days=1)
+# Attempts per request, and timeout in seconds of every attempt
 CONNECTION_RETRY = 5
 REQUEST_TIMEOUT = 20
+# Retries wait a jittered exponential backoff, or the Retry-After of the API
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30
+# Failed requests after which an endpoint is left alone for the cooldown
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = timedelta(minutes=5)
+# Maximum number of API sections fetched in parallel by the client
+DEFAULT_MAX_CONCURRENCY = 4
+# Requests of all config entries share one connection pool and rate limit
+REQUEST_RATE_LIMIT = 5  # Requests per second
+REQUEST_BURST = 10
+# Minimum delay between the start of the polls of two config entries
+POLL_STAGGER = timedelta(seconds=5)
+# Product details rarely change, they are cached by product id
+PRODUCT_CACHE_TTL = timedelta(hours=24)
+PRODUCT_CACHE_SIZE = 32
+# Parsed API responses kept to answer conditional requests, keyed by URL
+RESPONSE_CACHE_SIZE = 64
+# Subscriptions with unchanged payloads keep their enrichment at most this long
+SUBSCRIPTION_REUSE_MAX_AGE = timedelta(minutes=30)
+# Access tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+# Delay in seconds before a new token set is written to the token store
+TOKEN_SAVE_DELAY = 1
+# Sections of the coordinator data stored together, by store file suffix. The
+# main group comes first, it holds all sections in files written before the split.
+STORAGE_GROUPS: Final = {
+    "": ("timestamp", "subscriptions"),
+    "_invoices": ("paid_invoices", "unpaid_invoices"),
+    "_static": ("customer_info", "loyalty_points_balance", "product_cache"),
+}
+# Sections computed from the others on every update, they are never stored
+DERIVED_SECTIONS: Final = ("invoice_summary",)
+# Sections changing on every update, left out of the hash deciding whether a
+# group is written. They are saved along with the next change of their group.
+UNHASHED_SECTIONS: Final = ("timestamp",)
+# Delay in seconds used to coalesce writes of the coordinator data
+STORE_SAVE_DELAY = 10
+# Number of polls kept in the diagnostics buffer while debug logging is enabled
+DEBUG_CAPTURE_SIZE = 5
+# Number of request exchanges kept for diagnostics, and logged body length
+REQUEST_LOG_SIZE = 20
+REQUEST_LOG_BODY_MAX = 1000
+# Fields masked in logged payloads and diagnostics
+MASKED_FIELDS: Final = [
+    "access_token",
+    "refresh_token",
+    "password",
+    "client_secret",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "msisdn",
+    "iban",
+    "street",
+    "phone_number",
+]
+# Page size used when syncing the paid invoices ledger
+INVOICE_PAGE_SIZE = 20
+# Newest paid invoices listed in the sensor attributes, the ledger holds them all
+PAID_INVOICES_ATTRIBUTE_SIZE = INVOICE_PAGE_SIZE
+# Option replacing the invoice lists in state attributes by a summary
+CONF_COMPACT_INVOICES = "compact_invoice_attributes"
+DEFAULT_COMPACT_INVOICES = False
+# Page size limits of the get_invoices service
+SERVICE_INVOICE_PAGE_SIZE = 20
+SERVICE_INVOICE_PAGE_SIZE_MAX = 100
 WEBSITE = "https://mobilevikings.be/nl/my-viking"
 WEBSITE_JIMMOBILE = "https://jimmobile.be/nl/"
 
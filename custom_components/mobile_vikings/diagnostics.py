@@ -0,0 +1,31 @@
+"""Diagnostics support for MobileVikings."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, MASKED_FIELDS
+from .utils import json_safe, mask_fields
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    # json_safe returns a copy, masking it leaves the coordinator data untouched
+    diagnostics = json_safe(
+        {
+            "mobile_platform": coordinator.client.mobile_platform,
+            "data": coordinator.data,
+            "debug_captures": list(coordinator.debug_captures),
+            "circuit_breakers": coordinator.client.retry.as_dict(),
+            "response_cache": coordinator.client.response_cache.as_dict(),
+            "request_log": coordinator.client.request_log.as_list(),
+        }
+    )
+    mask_fields(diagnostics, MASKED_FIELDS)
+    return diagnostics
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import json
 import logging
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType
@@ -12,6 +14,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
 from . import MobileVikingsDataUpdateCoordinator
+from .accessors import CompiledPath
 from .const import (
     ATTRIBUTION,
     DOMAIN,
@@ -22,9 +25,13 @@ from .const import (
     WEBSITE,
     WEBSITE_JIMMOBILE,
 )
+from .models import MobileVikingsEntitySnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+# Snapshot source of an entity before its first snapshot
+_UNSET = object()
+
 
 class MobileVikingsEntity(CoordinatorEntity[MobileVikingsDataUpdateCoordinator]):
     """Base MobileVikings entity."""
@@ -33,7 +40,6 @@ class MobileVikingsEntity(CoordinatorEntity[MobileVikingsDataUpdateCoordinator])
     _unrecorded_attributes = frozenset(
         {
             "invoices",
-            "last_synced",
         }
     )
 
@@ -69,14 +75,45 @@ class MobileVikingsEntity(CoordinatorEntity[MobileVikingsDataUpdateCoordinator])
             sw_version=VERSION,
         )
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{self.entity_description.unique_id_fn(self.item, self.bundle_id)}"
-        self.last_synced = datetime.now()
+        self._paths = {
+            name: CompiledPath(path, bundle_id)
+            for name in ("available", "value", "attributes")
+            if (path := getattr(description, f"{name}_path", None)) is not None
+        }
+        if placeholder_paths := getattr(description, "placeholder_paths", None):
+            self._attr_translation_placeholders = {
+                name: CompiledPath(path, bundle_id)(self.item, "")
+                for name, path in placeholder_paths.items()
+            }
+        elif callable(getattr(description, "translation_placeholders_fn", None)):
+            self._attr_translation_placeholders = (
+                description.translation_placeholders_fn(self.item, self.bundle_id)
+            )
+        self._snapshot_source: Any = _UNSET
+        self.snapshot = self._compute_snapshot()
+        self._fingerprint: int | None = None
+        self._written_snapshot: MobileVikingsEntitySnapshot | None = None
+        self._written_available: bool | None = None
         _LOGGER.debug(f"[MobileVikingsEntity|init] {self._attr_unique_id}")
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if len(self.coordinator.data):
-            self.last_synced = datetime.now()
+            self.snapshot = self._compute_snapshot()
+            # Data slices built from unchanged payloads keep their snapshot
+            if (
+                self.snapshot is self._written_snapshot
+                and self.available == self._written_available
+            ):
+                return
+            self._written_snapshot = self.snapshot
+            self._written_available = self.available
+            # Only write a new state, and recorder row, when something changed
+            fingerprint = self._compute_fingerprint()
+            if fingerprint == self._fingerprint:
+                return
+            self._fingerprint = fingerprint
             self.async_write_ha_state()
             return
         _LOGGER.debug(
@@ -95,12 +132,76 @@ class MobileVikingsEntity(CoordinatorEntity[MobileVikingsDataUpdateCoordinator])
             _LOGGER.error("Data not available for entity %s", self._attr_unique_id)
             return {}
 
+    def _compute_snapshot(self) -> MobileVikingsEntitySnapshot:
+        """Resolve the description paths and functions into a snapshot.
+
+        The snapshot is reused as long as the slice of coordinator data of the
+        entity is the same object, sections that were not refetched keep theirs.
+        """
+        item = self.item
+        if item is self._snapshot_source:
+            return self.snapshot
+        self._snapshot_source = item
+        description = self.entity_description
+        if (path := self._paths.get("available")) is not None:
+            available = path(item) is not None
+        elif description.available_fn:
+            available = bool(description.available_fn(item, self.bundle_id))
+        else:
+            available = True
+        if (path := self._paths.get("value")) is not None:
+            value = path(item, description.value_default)
+        elif description.value_fn:
+            value = description.value_fn(item, self.bundle_id)
+        else:
+            value = None
+        if (path := self._paths.get("attributes")) is not None:
+            attributes = path(item)
+        elif description.attributes_fn:
+            attributes = description.attributes_fn(item, self.bundle_id)
+        else:
+            attributes = None
+        if self.coordinator.compact_invoices and (
+            summary_fn := getattr(description, "summary_attributes_fn", None)
+        ):
+            # Lists are dropped from the attributes, the summary replaces them
+            attributes = {
+                name: attribute
+                for name, attribute in (attributes or {}).items()
+                if not isinstance(attribute, list)
+            } | summary_fn(item, self.bundle_id)
+        return MobileVikingsEntitySnapshot(
+            available=available,
+            value=value,
+            attributes=MappingProxyType(attributes) if attributes else None,
+        )
+
+    def _compute_fingerprint(self) -> int:
+        """Return a fingerprint of the state, availability and attributes."""
+        snapshot = self.snapshot
+        return hash(
+            json.dumps(
+                [
+                    self.available,
+                    snapshot.value,
+                    dict(snapshot.attributes) if snapshot.attributes else None,
+                ],
+                sort_keys=True,
+                default=str,
+            )
+        )
+
     @property
     def available(self) -> bool:
         """Return if the entity is available."""
-        return super().available and self.entity_description.available_fn(
-            self.item, self.bundle_id
-        )
+        return super().available and self.snapshot.available
+
+    @property
+    def extra_state_attributes(self):
+        """Return attributes for sensor."""
+        if not self.coordinator.data:
+            return {}
+        return dict(self.snapshot.attributes or {})
 
     async def async_update(self) -> None:
         """Update the entity.  Only used by the generic entity update service."""
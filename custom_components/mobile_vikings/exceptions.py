@@ -35,3 +35,18 @@ class BadGatewayException(MobileVikingsServiceException):
     """Raised when server returns Bad Gateway."""
 
     pass
+
+
+class TooManyRequestsException(MobileVikingsServiceException):
+    """Raised when the API keeps rate limiting the requests."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize with the delay in seconds requested by the API, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenException(MobileVikingsServiceException):
+    """Raised when an endpoint is skipped after repeated failures."""
+
+    pass
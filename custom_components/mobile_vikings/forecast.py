@@ -0,0 +1,209 @@
+"""Forecasting of the bundle usage from a rolling history of samples."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from datetime import datetime
+import logging
+
+from .analytics import parse_timestamp, project_depletion
+from .const import FORECAST_HISTORY_SIZE, FORECAST_MIN_SAMPLES, SECONDS_PER_DAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UsageHistory:
+    """Ring buffer of the usage samples of a bundle during its current period.
+
+    Samples are kept in two fixed size arrays of doubles, so the memory used
+    by a bundle does not grow with the number of polls. The oldest sample is
+    overwritten once the buffer is full.
+    """
+
+    __slots__ = ("period", "_size", "_start", "_times", "_values")
+
+    def __init__(self, capacity: int = FORECAST_HISTORY_SIZE) -> None:
+        """Initialize an empty history holding at most capacity samples."""
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._size = 0
+        self.period: str | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples in the history."""
+        return self._size
+
+    def clear(self, period: str | None = None) -> None:
+        """Drop all samples, starting the history of a new period."""
+        self._start = 0
+        self._size = 0
+        self.period = period
+
+    def append(self, timestamp: float, used: float) -> None:
+        """Add a sample, ignoring samples older than the last one."""
+        capacity = len(self._times)
+        if self._size:
+            last = (self._start + self._size - 1) % capacity
+            if timestamp <= self._times[last]:
+                return
+            if used < self._values[last]:
+                # Usage only decreases when the bundle was reset
+                self.clear(self.period)
+        if self._size < capacity:
+            index = (self._start + self._size) % capacity
+            self._size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % capacity
+        self._times[index] = timestamp
+        self._values[index] = used
+
+    def samples(self) -> Iterator[tuple[float, float]]:
+        """Iterate over the samples, from oldest to newest."""
+        capacity = len(self._times)
+        for offset in range(self._size):
+            index = (self._start + offset) % capacity
+            yield self._times[index], self._values[index]
+
+    def rate_per_day(self) -> float | None:
+        """Return the usage per day fitted over the samples by least squares."""
+        count = self._size
+        if count < FORECAST_MIN_SAMPLES:
+            return None
+        samples = list(self.samples())
+        mean_time = sum(time for time, _ in samples) / count
+        mean_used = sum(used for _, used in samples) / count
+        variance = sum((time - mean_time) ** 2 for time, _ in samples)
+        if variance <= 0:
+            return None
+        covariance = sum(
+            (time - mean_time) * (used - mean_used) for time, used in samples
+        )
+        return max(covariance / variance, 0) * SECONDS_PER_DAY
+
+
+class UsageForecaster:
+    """Forecast the usage of the limited bundles of all subscriptions.
+
+    Every fresh balance adds a sample to the history of its bundles. The usage
+    rate fitted over the history projects when the bundle runs out and how
+    much of it will be used at the end of its period. The fitted rate follows
+    the recent usage, its projected depletion replaces the one of the bundle
+    analytics, based on the average rate of the period.
+    """
+
+    def __init__(self, capacity: int = FORECAST_HISTORY_SIZE) -> None:
+        """Initialize the forecaster with the history size of every bundle."""
+        self.capacity = capacity
+        self._histories: dict[tuple[str, str], UsageHistory] = {}
+        self._inputs: dict = {}
+        self._outputs: dict = {}
+
+    def history(self, subscription_id: str, bundle_id: str) -> UsageHistory:
+        """Return the history of a bundle, creating it when needed."""
+        key = (subscription_id, bundle_id)
+        if (history := self._histories.get(key)) is None:
+            history = self._histories[key] = UsageHistory(self.capacity)
+        return history
+
+    def seed(
+        self,
+        subscription_id: str,
+        bundle_id: str,
+        period: str | None,
+        samples: list[tuple[float, float]],
+    ) -> None:
+        """Fill the history of a bundle with samples of its current period."""
+        history = self.history(subscription_id, bundle_id)
+        history.clear(period)
+        for timestamp, used in samples[-self.capacity :]:
+            history.append(timestamp, used)
+
+    def update(self, subscriptions: dict, now: datetime) -> dict:
+        """Sample the bundles and return copies of the subscriptions with forecasts.
+
+        A subscription that is the same object as in the previous update was
+        built from unchanged payloads, it keeps its previous forecast without
+        a new sample. The previous dictionary is returned when none changed.
+        """
+        forecasted = {}
+        seen = set()
+        for subscription_id, subscription in subscriptions.items():
+            if subscription is self._inputs.get(subscription_id):
+                forecasted[subscription_id] = self._outputs[subscription_id]
+                seen.update(key for key in self._histories if key[0] == subscription_id)
+                continue
+            balance = subscription.get("balance")
+            bundles = balance.get("bundles") if isinstance(balance, dict) else None
+            if not isinstance(bundles, dict):
+                forecasted[subscription_id] = subscription
+                continue
+            forecasted[subscription_id] = subscription | {
+                "balance": balance
+                | {
+                    "bundles": {
+                        bundle_id: self._forecast(
+                            subscription_id, bundle_id, bundle, now, seen
+                        )
+                        for bundle_id, bundle in bundles.items()
+                    }
+                }
+            }
+        # Forget the bundles that disappeared
+        for key in self._histories.keys() - seen:
+            del self._histories[key]
+        self._inputs = subscriptions
+        if list(forecasted) != list(self._outputs) or any(
+            output is not self._outputs[subscription_id]
+            for subscription_id, output in forecasted.items()
+        ):
+            self._outputs = forecasted
+        return self._outputs
+
+    def _forecast(
+        self,
+        subscription_id: str,
+        bundle_id: str,
+        bundle: dict,
+        now: datetime,
+        seen: set,
+    ) -> dict:
+        """Sample a bundle and return a copy of it with its forecast."""
+        total = bundle.get("total", 0)
+        if bundle.get("unlimited", total <= 0):
+            return bundle
+        seen.add((subscription_id, bundle_id))
+        used = bundle.get("used", 0)
+        history = self.history(subscription_id, bundle_id)
+        if history.period != bundle.get("valid_from"):
+            history.clear(bundle.get("valid_from"))
+        history.append(now.timestamp(), used)
+
+        rate = history.rate_per_day()
+        forecast = {
+            "daily_rate": round(rate, 2) if rate is not None else None,
+            "samples": len(history),
+            "projected_period_usage": None,
+        }
+        if rate is None:
+            return bundle | {"forecast": forecast}
+        depletion = project_depletion(now, total, used, rate)
+        forecasted = bundle | {
+            "forecast": forecast,
+            "projected_depletion": depletion.isoformat() if depletion else None,
+        }
+        try:
+            valid_until = parse_timestamp(bundle["valid_until"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug(f"No period end for bundle {bundle_id} of {subscription_id}")
+            return forecasted
+        days_left = max((valid_until - now).total_seconds(), 0) / SECONDS_PER_DAY
+        forecast["projected_period_usage"] = round(
+            (used + rate * days_left) / total * 100, 2
+        )
+        forecasted["depletes_before_renewal"] = (
+            depletion is not None and depletion < valid_until
+        )
+        return forecasted
@@ -0,0 +1,76 @@
+"""Aggregation of the invoice sections, run once per coordinator update."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Invoice sections with the invoice key holding the amount to total
+INVOICE_AMOUNT_KEYS = {
+    "paid_invoices": "amount_total",
+    "unpaid_invoices": "amount_due",
+}
+
+
+@lru_cache(maxsize=512)
+def parse_date(value: str) -> datetime | None:
+    """Parse an API date, cached as invoices keep their dates across updates."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        _LOGGER.debug(f"Unable to parse invoice date {value}")
+        return None
+
+
+def aggregate_section(section: dict | None, amount_key: str, now: datetime) -> dict:
+    """Aggregate an invoice section in a single pass over its invoices.
+
+    Returns the invoices, a summary with the count, the total amount, the
+    oldest expiration date and the newest invoice date, and the days until
+    the oldest expiration date.
+    """
+    results = section.get("results") if isinstance(section, dict) else None
+    total = 0
+    oldest_due = newest_invoice = None
+    for invoice in results or ():
+        total += invoice.get(amount_key) or 0
+        if (value := invoice.get("expiration_date")) and (
+            expiration_date := parse_date(value)
+        ):
+            if oldest_due is None or expiration_date < oldest_due:
+                oldest_due = expiration_date
+        if (value := invoice.get("invoice_date")) and (
+            invoice_date := parse_date(value)
+        ):
+            if newest_invoice is None or invoice_date > newest_invoice:
+                newest_invoice = invoice_date
+    return {
+        "results": results,
+        "count": (
+            section.get("total_items", len(results)) if results is not None else 0
+        ),
+        "total": round(total, 2),
+        "oldest_due": oldest_due,
+        "days_until_oldest_due": (
+            (oldest_due - now).days
+            if oldest_due is not None and oldest_due.tzinfo is not None
+            else None
+        ),
+        "summary": {
+            "count": len(results or ()),
+            "total": round(total, 2),
+            "oldest_due": oldest_due,
+            "newest_invoice": newest_invoice,
+        },
+    }
+
+
+def aggregate_invoices(data: dict, now: datetime) -> dict:
+    """Aggregate all invoice sections of the coordinator data."""
+    return {
+        section: aggregate_section(data.get(section), amount_key, now)
+        for section, amount_key in INVOICE_AMOUNT_KEYS.items()
+    }
@@ -0,0 +1,71 @@
+"""Locally persisted ledger of paid invoices."""
+
+from __future__ import annotations
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InvoiceLedger:
+    """Ledger of paid invoices, ordered from newest to oldest.
+
+    Paid invoices are immutable, so once an invoice is in the ledger it never
+    has to be downloaded again. The ledger is exported in the same format as
+    the API response, so it can be stored as the paid_invoices section.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ledger."""
+        self._invoices: dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        """Return the number of invoices in the ledger."""
+        return len(self._invoices)
+
+    @staticmethod
+    def invoice_id(invoice: dict) -> str | None:
+        """Return the identifier of an invoice."""
+        invoice_id = invoice.get("id") or invoice.get("invoice_number")
+        return str(invoice_id) if invoice_id is not None else None
+
+    def is_known(self, invoice: dict) -> bool:
+        """Return True if the invoice is already in the ledger."""
+        return self.invoice_id(invoice) in self._invoices
+
+    def merge(self, invoices: list[dict]) -> int:
+        """Prepend new invoices, given from newest to oldest, to the ledger.
+
+        Returns the number of invoices added.
+        """
+        new_invoices = {
+            invoice_id: invoice
+            for invoice in invoices
+            if (invoice_id := self.invoice_id(invoice)) is not None
+            and invoice_id not in self._invoices
+        }
+        if new_invoices:
+            self._invoices = new_invoices | self._invoices
+        return len(new_invoices)
+
+    def replace(self, invoices: list[dict]) -> None:
+        """Replace the ledger by the invoices, given from newest to oldest.
+
+        Used after a full sync, so invoices the API no longer returns are
+        dropped and the ledger keeps the order of the API.
+        """
+        self._invoices = {}
+        self.merge(invoices)
+
+    def restore(self, section: dict | None) -> None:
+        """Restore the ledger from a previously stored paid_invoices section."""
+        if not isinstance(section, dict) or section.get("error"):
+            return
+        self.replace(section.get("results") or [])
+
+    def as_section(self) -> dict:
+        """Export the ledger in the format of the invoices API response."""
+        return {
+            "total_items": len(self._invoices),
+            "results": list(self._invoices.values()),
+        }
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import TypedDict
+from typing import Any, TypedDict
 
 
 class MobileVikingsConfigEntryData(TypedDict):
@@ -39,3 +40,12 @@ class MobileVikingsItem:
     data: dict = field(default_factory=dict)
     extra_attributes: dict = field(default_factory=dict)
     native_unit_of_measurement: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class MobileVikingsEntitySnapshot:
+    """Immutable state of a MobileVikings entity, computed once per update."""
+
+    available: bool = False
+    value: Any = None
+    attributes: Mapping[str, Any] | None = None
@@ -0,0 +1,169 @@
+"""Registry of the entity descriptions and discovery of new entities."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import MobileVikingsDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STATIC = "static"
+SUBSCRIPTION = "subscription"
+BUNDLE = "bundle"
+
+
+class DescriptionRegistry:
+    """Entity descriptions of a platform, indexed for direct lookups.
+
+    Descriptions are indexed by group (static, subscription or bundle), mobile
+    platform, subscription type and bundle type. A description without
+    subscription types applies to all of them. Lookups return the descriptions
+    declared for the subscription type first, then the ones applying to all
+    types, each in the order in which they were declared.
+    """
+
+    def __init__(
+        self,
+        static: Iterable[EntityDescription] = (),
+        subscription: Iterable[EntityDescription] = (),
+        bundle: Iterable[EntityDescription] = (),
+    ) -> None:
+        """Build the index of the descriptions of every group."""
+        index: dict[tuple, list[EntityDescription]] = defaultdict(list)
+        for group, descriptions in (
+            (STATIC, static),
+            (SUBSCRIPTION, subscription),
+            (BUNDLE, bundle),
+        ):
+            for description in descriptions:
+                bundle_type = description.bundle_type if group == BUNDLE else None
+                # Uncategorized bundle descriptions only apply to default bundles
+                if (
+                    group == BUNDLE
+                    and description.bundle_category is None
+                    and bundle_type != "default"
+                ):
+                    continue
+                subscription_types = (
+                    description.subscription_types if group != STATIC else None
+                ) or (None,)
+                for platform in description.mobile_platforms or ():
+                    for subscription_type in subscription_types:
+                        index[(group, platform, subscription_type, bundle_type)].append(
+                            description
+                        )
+        self._index = {key: tuple(value) for key, value in index.items()}
+        self._lookups: dict[tuple, tuple[EntityDescription, ...]] = {}
+
+    def lookup(
+        self,
+        group: str,
+        platform: str,
+        subscription_type: str | None = None,
+        bundle_type: str | None = None,
+    ) -> tuple[EntityDescription, ...]:
+        """Return the descriptions matching a group, platform and types."""
+        key = (group, platform, subscription_type, bundle_type)
+        if (descriptions := self._lookups.get(key)) is None:
+            descriptions = self._index.get(key, ())
+            if subscription_type is not None and (
+                wildcard := self._index.get((group, platform, None, bundle_type))
+            ):
+                declared = {id(description) for description in descriptions}
+                descriptions += tuple(
+                    description
+                    for description in wildcard
+                    if id(description) not in declared
+                )
+            self._lookups[key] = descriptions
+        return descriptions
+
+
+@callback
+def async_setup_entity_discovery(
+    coordinator: MobileVikingsDataUpdateCoordinator,
+    entry: ConfigEntry,
+    registry: DescriptionRegistry,
+    entity_factory: Callable[[EntityDescription, str | None, str | None], Entity],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add entities for the current data and for keys appearing in later updates.
+
+    On every coordinator update the static section, subscription and bundle
+    keys are diffed against the keys seen before, and only the entities of new
+    keys are created. A bundle bought after setup gets its entities without a
+    reload.
+    """
+    platform = coordinator.client.mobile_platform
+    known: set[tuple] = set()
+    # Unchanged subscriptions are the same object, their keys need no diffing
+    last_seen: list = [None, None]
+
+    @callback
+    def _async_add_new_entities() -> None:
+        data = coordinator.data or {}
+        if data.get("subscriptions") is last_seen[0] and data.keys() == last_seen[1]:
+            return
+        last_seen[:] = [data.get("subscriptions"), set(data)]
+        current = {
+            (STATIC, description.key): None
+            for description in registry.lookup(STATIC, platform)
+            if description.key in data
+        }
+        for subscription_id, subscription in (data.get("subscriptions") or {}).items():
+            subscription_type = subscription.get("type")
+            current[(SUBSCRIPTION, subscription_id, subscription_type)] = None
+            bundles = (subscription.get("balance") or {}).get("bundles") or {}
+            for bundle_id, bundle in bundles.items():
+                current[
+                    (
+                        BUNDLE,
+                        subscription_id,
+                        subscription_type,
+                        bundle_id,
+                        bundle.get("type"),
+                    )
+                ] = None
+        new_keys = [key for key in current if key not in known]
+        if not new_keys:
+            return
+        known.update(new_keys)
+
+        entities = []
+        for key in new_keys:
+            if key[0] == STATIC:
+                entities.extend(
+                    entity_factory(description, None, None)
+                    for description in registry.lookup(STATIC, platform)
+                    if description.key == key[1]
+                )
+            elif key[0] == SUBSCRIPTION:
+                _, subscription_id, subscription_type = key
+                entities.extend(
+                    entity_factory(description, subscription_id, None)
+                    for description in registry.lookup(
+                        SUBSCRIPTION, platform, subscription_type
+                    )
+                )
+            else:
+                _, subscription_id, subscription_type, bundle_id, bundle_type = key
+                entities.extend(
+                    entity_factory(description, subscription_id, bundle_id)
+                    for description in registry.lookup(
+                        BUNDLE, platform, subscription_type, bundle_type
+                    )
+                )
+        if entities:
+            _LOGGER.debug(f"Adding {len(entities)} entities for {len(new_keys)} keys")
+            async_add_entities(entities)
+
+    _async_add_new_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
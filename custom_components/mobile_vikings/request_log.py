@@ -0,0 +1,101 @@
+"""Lazy logging of the API requests and responses."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timezone
+import json
+import time
+from typing import Any
+
+from .const import MASKED_FIELDS, REQUEST_LOG_BODY_MAX, REQUEST_LOG_SIZE
+from .utils import json_safe, mask_fields
+
+
+class LazyPayload:
+    """Payload formatted only when a log record using it is emitted.
+
+    Pass it as a logging argument: the payload is copied, masked and
+    truncated in __str__, which logging only calls for emitted records.
+    """
+
+    __slots__ = ("payload", "max_length")
+
+    def __init__(self, payload: Any, max_length: int = REQUEST_LOG_BODY_MAX) -> None:
+        """Wrap a payload, parsed or raw bytes or text."""
+        self.payload = payload
+        self.max_length = max_length
+
+    def masked(self) -> Any:
+        """Return a JSON serializable copy of the payload with the fields masked."""
+        payload = self.payload
+        if isinstance(payload, bytes):
+            payload = payload.decode(errors="replace")
+        if isinstance(payload, str):
+            try:
+                payload = json.loads(payload)
+            except ValueError:
+                return payload
+        # json_safe returns a copy, masking it leaves the payload untouched
+        payload = json_safe(payload)
+        mask_fields(payload, MASKED_FIELDS)
+        return payload
+
+    def __str__(self) -> str:
+        """Return the masked payload, truncated to max_length characters."""
+        payload = self.masked()
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        if len(text) > self.max_length:
+            return f"{text[: self.max_length]}... ({len(text)} characters)"
+        return text
+
+
+class RequestLog:
+    """Ring buffer of the last request exchanges, for diagnostics.
+
+    Exchanges keep references to the request payload and raw response body,
+    they are only masked and formatted when exported.
+    """
+
+    def __init__(self, size: int = REQUEST_LOG_SIZE) -> None:
+        """Initialize an empty log of at most size exchanges."""
+        self._exchanges: deque[tuple] = deque(maxlen=size)
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        duration_ms: int,
+        request: Any = None,
+        response: bytes | None = None,
+    ) -> None:
+        """Record an exchange."""
+        self._exchanges.append(
+            (time.time(), method, endpoint, status, duration_ms, request, response)
+        )
+
+    def as_list(self) -> list[dict]:
+        """Export the exchanges, oldest first, with masked and truncated bodies."""
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(
+                    timestamp, timezone.utc
+                ).isoformat(),
+                "method": method,
+                "endpoint": endpoint,
+                "status": status,
+                "duration_ms": duration_ms,
+                "request": str(LazyPayload(request)) if request else None,
+                "response": str(LazyPayload(response)) if response else None,
+            }
+            for (
+                timestamp,
+                method,
+                endpoint,
+                status,
+                duration_ms,
+                request,
+                response,
+            ) in self._exchanges
+        ]
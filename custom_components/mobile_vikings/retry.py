@@ -0,0 +1,196 @@
+"""Retries with backoff and circuit breakers for the MobileVikings API requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+import logging
+import random
+import time
+
+from homeassistant.util import dt as dt_util
+import httpx
+
+from .const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CONNECTION_RETRY,
+    REQUEST_TIMEOUT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+from .exceptions import CircuitOpenException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status codes of transient failures, the request is sent again
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def endpoint_key(endpoint: str) -> str:
+    """Return the endpoint without its query, keying its circuit breaker.
+
+    Ids are kept, so the failing balance of one subscription does not block
+    the requests of the other subscriptions.
+    """
+    return endpoint.split("?", 1)[0]
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a Retry-After header, in seconds or a date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt_util.UTC)
+    return max((retry_at - dt_util.utcnow()).total_seconds(), 0)
+
+
+class CircuitBreaker:
+    """Stop sending requests to an endpoint that keeps failing.
+
+    After threshold consecutive failed requests the circuit opens and requests
+    are rejected for the cooldown. A single trial request is then let through:
+    a success closes the circuit, a failure opens it for another cooldown.
+    """
+
+    __slots__ = ("cooldown", "threshold", "_failures", "_open_until")
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: timedelta = CIRCUIT_BREAKER_COOLDOWN,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self.threshold = threshold
+        self.cooldown = cooldown.total_seconds()
+        self._failures = 0
+        self._open_until: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self._open_until is None:
+            return "closed"
+        return "open" if time.monotonic() < self._open_until else "half_open"
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent."""
+        if self._open_until is None:
+            return True
+        now = time.monotonic()
+        if now < self._open_until:
+            return False
+        # Let one trial request through, the others are rejected until its
+        # outcome closes the circuit or opens it again
+        self._open_until = now + self.cooldown
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._open_until = None
+
+    def record_failure(self, cooldown: float | None = None) -> None:
+        """Count a failed request, opening the circuit at the threshold.
+
+        A cooldown requested by the API opens the circuit at least that long.
+        """
+        self._failures += 1
+        now = time.monotonic()
+        if self._failures >= self.threshold or self._open_until is not None:
+            self._open_until = now + max(cooldown or 0, self.cooldown)
+        elif cooldown:
+            # Wait for the delay requested by the API
+            self._open_until = now + cooldown
+
+
+class RetryEngine:
+    """Send requests with timeouts, retries and per-endpoint circuit breakers.
+
+    Timeouts, connection errors and transient status codes are retried with
+    a jittered exponential backoff, or after the delay of the Retry-After
+    header. Breakers live as long as the client, so an endpoint that failed
+    in one poll is not hammered again in the next one.
+    """
+
+    def __init__(
+        self,
+        attempts: int = CONNECTION_RETRY,
+        timeout: float = REQUEST_TIMEOUT,
+        backoff_base: float = RETRY_BACKOFF_BASE,
+        backoff_max: float = RETRY_BACKOFF_MAX,
+    ) -> None:
+        """Initialize the engine."""
+        self.attempts = max(attempts, 1)
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint."""
+        key = endpoint_key(endpoint)
+        if (breaker := self._breakers.get(key)) is None:
+            breaker = self._breakers[key] = CircuitBreaker()
+        return breaker
+
+    def backoff(self, attempt: int) -> float:
+        """Return a random delay up to the exponential backoff of an attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the state of the breakers, for diagnostics."""
+        return {key: breaker.state for key, breaker in self._breakers.items()}
+
+    async def async_send(
+        self,
+        endpoint: str,
+        send: Callable[[float], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Send a request with retries, send is called with the timeout.
+
+        The last response is returned when the retries are exhausted, so the
+        caller handles its status. The last error is raised when no response
+        was received at all.
+        """
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenException(
+                f"Skipping {endpoint}, too many failed requests to {endpoint_key(endpoint)}"
+            )
+        for attempt in range(self.attempts):
+            response = None
+            retry_after = None
+            try:
+                response = await send(self.timeout)
+            except httpx.TransportError as exception:
+                error: httpx.TransportError | None = exception
+                reason = repr(exception)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    breaker.record_success()
+                    return response
+                error = None
+                reason = f"status {response.status_code}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else self.backoff(attempt)
+            if attempt + 1 >= self.attempts or delay > self.backoff_max:
+                break
+            _LOGGER.debug(
+                f"Retrying {endpoint} in {delay:.1f}s after {reason} ({attempt + 1}/{self.attempts})"
+            )
+            await asyncio.sleep(delay)
+        breaker.record_failure(retry_after)
+        if error is not None:
+            raise error
+        return response
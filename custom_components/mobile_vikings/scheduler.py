@@ -0,0 +1,117 @@
+"""Per-section polling schedule for the MobileVikings coordinator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from .const import (
+    BALANCE_UPDATE_INTERVAL,
+    BALANCE_UPDATE_INTERVAL_MAX,
+    BALANCE_UPDATE_INTERVAL_MIN,
+    BUNDLE_BURN_MARGIN,
+    BUNDLE_CRITICAL_PERCENTAGE,
+    BUNDLE_WARNING_PERCENTAGE,
+    SCHEDULER_TOLERANCE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SectionScheduler:
+    """Keep track of when each API section is due for a refresh.
+
+    Every section has its own update interval. The coordinator polls at the
+    shortest interval and only fetches the sections that are due.
+    """
+
+    def __init__(self, intervals: dict[str, timedelta]) -> None:
+        """Initialize the scheduler with the update interval of every section."""
+        self.intervals = dict(intervals)
+        self._last_fetched: dict[str, datetime] = {}
+
+    @property
+    def update_interval(self) -> timedelta:
+        """Return the interval at which the coordinator has to poll."""
+        return min(self.intervals.values())
+
+    def due_sections(self, now: datetime) -> list[str]:
+        """Return the sections to fetch at now."""
+        return [
+            section
+            for section, interval in self.intervals.items()
+            if (last_fetched := self._last_fetched.get(section)) is None
+            # Polls drift slightly, don't postpone a section by a whole poll
+            or now - last_fetched + SCHEDULER_TOLERANCE >= interval
+        ]
+
+    def mark_fetched(self, section: str, now: datetime) -> None:
+        """Record a successful fetch of a section."""
+        self._last_fetched[section] = now
+
+    def set_interval(self, section: str, interval: timedelta) -> None:
+        """Change the update interval of a section."""
+        if self.intervals.get(section) != interval:
+            _LOGGER.debug(f"Update interval of {section} set to {interval}")
+            self.intervals[section] = interval
+
+
+class AdaptiveBalanceInterval:
+    """Adapt the balance update interval to the bundle usage.
+
+    Balances are polled faster when a bundle gets close to exhaustion or is
+    used faster than its period elapses, and slower while usage does not move.
+    The interval always stays within the minimum and maximum bounds.
+    """
+
+    def __init__(
+        self,
+        base: timedelta = BALANCE_UPDATE_INTERVAL,
+        minimum: timedelta = BALANCE_UPDATE_INTERVAL_MIN,
+        maximum: timedelta = BALANCE_UPDATE_INTERVAL_MAX,
+    ) -> None:
+        """Initialize with the base interval and its bounds."""
+        self.base = base
+        self.minimum = minimum
+        self.maximum = maximum
+        self.interval = base
+        self._last_used: dict[tuple[str, str], float] = {}
+
+    def update(self, subscriptions: dict) -> timedelta:
+        """Compute the next balance update interval from freshly fetched bundles."""
+        critical = burning = moved = False
+        last_used = {}
+        for subscription_id, subscription in subscriptions.items():
+            bundles = (subscription.get("balance") or {}).get("bundles") or {}
+            for bundle_id, bundle in bundles.items():
+                if bundle.get("unlimited", False):
+                    continue
+                key = (subscription_id, bundle_id)
+                last_used[key] = bundle.get("used", 0)
+                if self._last_used.get(key, last_used[key]) != last_used[key]:
+                    moved = True
+                used_percentage = bundle.get("used_percentage", 0)
+                if used_percentage >= 100:
+                    # Nothing left to watch until the bundle renews
+                    continue
+                if used_percentage >= BUNDLE_CRITICAL_PERCENTAGE:
+                    critical = True
+                elif used_percentage >= BUNDLE_WARNING_PERCENTAGE or (
+                    used_percentage
+                    > bundle.get("period_percentage", 0) + BUNDLE_BURN_MARGIN
+                ):
+                    burning = True
+
+        first_update = not self._last_used
+        self._last_used = last_used
+        if critical:
+            interval = self.minimum
+        elif burning:
+            interval = self.base / 2
+        elif moved or first_update:
+            interval = self.base
+        else:
+            # Usage is idle, back off
+            interval = self.interval * 2
+        self.interval = max(self.minimum, min(interval, self.maximum))
+        return self.interval
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timezone
 import logging
 from typing import Any
 
@@ -15,16 +14,29 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CURRENCY_EURO, PERCENTAGE, UnitOfInformation, UnitOfTime
+from homeassistant.const import (
+    CURRENCY_EURO,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.util import slugify
+from homeassistant.util import dt as dt_util, slugify
 
 from . import MobileVikingsDataUpdateCoordinator
-from .const import DOMAIN, JIM_MOBILE, MOBILE_VIKINGS
+from .accessors import bundle_path
+from .const import (
+    DOMAIN,
+    JIM_MOBILE,
+    MOBILE_VIKINGS,
+    PAID_INVOICES_ATTRIBUTE_SIZE,
+)
 from .entity import MobileVikingsEntity
+from .registry import DescriptionRegistry, async_setup_entity_discovery
 from .utils import safe_get, to_title_case_with_spaces
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +49,8 @@ class MobileVikingsSensorDescription(SensorEntityDescription):
     available_fn: Callable[[dict, str | None], bool] | None = None
     value_fn: Callable[[dict, str | None], Any] | None = None
     attributes_fn: Callable[[dict, str | None], dict] | None = None
+    # Attributes replacing the lists in attributes when they are compacted
+    summary_attributes_fn: Callable[[dict, str | None], dict] | None = None
     unique_id_fn: Callable[[dict, str | None], dict] | None = None
     device_name_fn: Callable[[dict], str] | None = None
     device_identifier_fn: Callable[[dict], str] | None = None
@@ -50,9 +64,31 @@ class MobileVikingsSensorDescription(SensorEntityDescription):
     subscription_types: tuple[str, ...] | None = None
     mobile_platforms: tuple[str, ...] | None = None
     bundle_type: str | None = None
+    # Paths resolved once per coordinator update, used instead of the functions
+    available_path: tuple | None = None
+    value_path: tuple | None = None
+    value_default: Any = None
+    attributes_path: tuple | None = None
+    placeholder_paths: dict[str, tuple] | None = None
 
 
 SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
+    MobileVikingsSensorDescription(
+        key="timestamp",
+        translation_key="last_synced",
+        unique_id_fn=lambda data, _: "last_synced",
+        icon="mdi:cloud-sync",
+        available_fn=lambda data, _: isinstance(data, str),
+        value_fn=lambda data, _: (
+            dt_util.parse_datetime(data) if isinstance(data, str) else None
+        ),
+        device_name_fn=lambda data: "Customer",
+        device_identifier_fn=lambda data: "Customer",
+        model_fn=lambda data: "Customer Info",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE),
+    ),
     MobileVikingsSensorDescription(
         key="customer_info",
         translation_key="customer_info",
@@ -79,7 +115,7 @@ SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         model_fn=lambda data: "Loyalty Points",
         device_class=SensorDeviceClass.MONETARY,
         native_unit_of_measurement=CURRENCY_EURO,
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="loyalty_points_balance",
@@ -94,7 +130,7 @@ SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         model_fn=lambda data: "Loyalty Points",
         device_class=SensorDeviceClass.MONETARY,
         native_unit_of_measurement=CURRENCY_EURO,
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="loyalty_points_balance",
@@ -109,84 +145,65 @@ SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         model_fn=lambda data: "Loyalty Points",
         device_class=SensorDeviceClass.MONETARY,
         native_unit_of_measurement=CURRENCY_EURO,
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
-        key="paid_invoices",
+        key="invoice_summary",
         translation_key="paid_invoices",
         unique_id_fn=lambda data, _: "paid_invoices",
         icon="mdi:receipt-text-check",
-        available_fn=lambda data, _: data is not None
-        and data.get("results") is not None,
-        value_fn=lambda data, _: 0 if data is None else data.get("total_items", 0),
+        available_path=("paid_invoices", "results"),
+        value_path=("paid_invoices", "count"),
+        value_default=0,
         device_name_fn=lambda data: "Invoices",
         device_identifier_fn=lambda data: "Invoices",
         model_fn=lambda data: "Invoices",
         attributes_fn=lambda data, _: {
-            "invoices": safe_get(data, ["results"], default=[])
+            "invoices": (safe_get(data, ["paid_invoices", "results"]) or [])[
+                :PAID_INVOICES_ATTRIBUTE_SIZE
+            ]
         },
-        mobile_platforms=(MOBILE_VIKINGS),
+        summary_attributes_fn=lambda data, _: data["paid_invoices"]["summary"],
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
-        key="unpaid_invoices",
+        key="invoice_summary",
         translation_key="unpaid_invoices",
         unique_id_fn=lambda data, _: "unpaid_invoices",
         icon="mdi:currency-eur",
-        available_fn=lambda data, _: data is not None
-        and data.get("results") is not None,
-        value_fn=lambda data, _: sum(
-            item.get("amount_due", 0) for item in data.get("results", [])
-        ),
+        available_path=("unpaid_invoices", "results"),
+        value_path=("unpaid_invoices", "total"),
+        value_default=0,
         device_name_fn=lambda data: "Invoices",
         device_identifier_fn=lambda data: "Invoices",
         model_fn=lambda data: "Invoices",
         attributes_fn=lambda data, _: {
-            "invoices": safe_get(data, ["results"], default=[])
+            "invoices": safe_get(data, ["unpaid_invoices", "results"], default=[])
         },
+        summary_attributes_fn=lambda data, _: data["unpaid_invoices"]["summary"],
         device_class=SensorDeviceClass.MONETARY,
         native_unit_of_measurement=CURRENCY_EURO,
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
-        key="unpaid_invoices",
+        key="invoice_summary",
         translation_key="next_invoice_expiration",
         unique_id_fn=lambda data, _: "next_invoice_expiration",
         icon="mdi:calendar-star",
-        available_fn=lambda data, _: data is not None
-        and data.get("results") is not None,
-        value_fn=lambda data, _: min(
-            (
-                datetime.fromisoformat(item["expiration_date"].replace("Z", "+00:00"))
-                for item in data.get("results", [])
-                if "expiration_date" in item
-            ),
-            default=None,
-        ),
+        available_path=("unpaid_invoices", "results"),
+        value_path=("unpaid_invoices", "oldest_due"),
         device_name_fn=lambda data: "Invoices",
         device_identifier_fn=lambda data: "Invoices",
         model_fn=lambda data: "Invoices",
         attributes_fn=lambda data, _: {
-            "days_until_next_expiration_date": (
-                (
-                    min(
-                        (
-                            datetime.fromisoformat(
-                                item["expiration_date"].replace("Z", "+00:00")
-                            )
-                            for item in data.get("results", [])
-                            if "expiration_date" in item
-                        ),
-                        default=None,
-                    )
-                    - datetime.now(timezone.utc)
-                ).days
-                if data.get("results")
-                else None
+            "days_until_next_expiration_date": safe_get(
+                data, ["unpaid_invoices", "days_until_oldest_due"]
             ),
-            "results": safe_get(data, ["results"], default={}),
+            "results": safe_get(data, ["unpaid_invoices", "results"], default={}),
         },
+        summary_attributes_fn=lambda data, _: data["unpaid_invoices"]["summary"],
         device_class=SensorDeviceClass.TIMESTAMP,
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
 )
 
@@ -199,9 +216,9 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + "_credit"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, _: safe_get(data, ["balance", "credit"], default=None)
-        is not None,
-        value_fn=lambda data, _: safe_get(data, ["balance", "credit"], default=0),
+        available_path=("balance", "credit"),
+        value_path=("balance", "credit"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -222,9 +239,9 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + "_product_info"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, _: safe_get(data, ["product", "price"], default=None)
-        is not None,
-        value_fn=lambda data, _: safe_get(data, ["product", "price"], default=0.0),
+        available_path=("product", "price"),
+        value_path=("product", "price"),
+        value_default=0.0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -232,7 +249,7 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, _: safe_get(data, ["product"], default={}),
+        attributes_path=("product",),
         device_class=SensorDeviceClass.MONETARY,
         native_unit_of_measurement=CURRENCY_EURO,
         icon="mdi:package-variant",
@@ -246,9 +263,9 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + "_sim_alias"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, _: safe_get(data, ["sim", "alias"], default=None)
-        is not None,
-        value_fn=lambda data, _: safe_get(data, ["sim", "alias"], default=""),
+        available_path=("sim", "alias"),
+        value_path=("sim", "alias"),
+        value_default="",
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -256,20 +273,19 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, _: safe_get(data, ["sim"], default={}),
+        attributes_path=("sim",),
         icon="mdi:sim",
         mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
         translation_key="modem",
-        subscription_types=("fixed-internet"),
+        subscription_types=("fixed-internet",),
         unique_id_fn=lambda data, _: (data.get("id", "") + "_modem_settings"),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, _: data.get("modem_settings") is not None,
-        value_fn=lambda data, _: safe_get(
-            data, ["modem_settings", "actual", "gateway", "mode"], default=""
-        ),
+        available_path=("modem_settings",),
+        value_path=("modem_settings", "actual", "gateway", "mode"),
+        value_default="",
         device_name_fn=lambda data: "Fixed Internet",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: to_title_case_with_spaces(
@@ -281,9 +297,9 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, _: safe_get(data, ["modem_settings"], default={}),
+        attributes_path=("modem_settings",),
         icon="mdi:router-network-wireless",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -293,13 +309,9 @@ SUBSCRIPTION_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + "_out_of_bundle_cost"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, _: safe_get(
-            data, ["balance", "out_of_bundle_cost"], default=None
-        )
-        is not None,
-        value_fn=lambda data, _: safe_get(
-            data, ["balance", "out_of_bundle_cost"], default=0
-        ),
+        available_path=("balance", "out_of_bundle_cost"),
+        value_path=("balance", "out_of_bundle_cost"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -326,13 +338,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_used_percentage"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "used_percentage"], default=0
-        ),
+        available_path=bundle_path(),
+        value_path=bundle_path("used_percentage"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -340,18 +348,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:signal-4g",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -363,13 +365,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_data_remaining"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "remaining_gb"], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "remaining_gb"], default=0
-        ),
+        available_path=bundle_path("remaining_gb"),
+        value_path=bundle_path("remaining_gb"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -377,18 +375,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=UnitOfInformation.GIGABYTES,
         icon="mdi:signal-4g",
         suggested_display_precision=1,
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -400,13 +392,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_remaining_days"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "remaining_days"], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "remaining_days"], default=0
-        ),
+        available_path=bundle_path("remaining_days"),
+        value_path=bundle_path("remaining_days"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -414,17 +402,11 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=UnitOfTime.DAYS,
         icon="mdi:calendar-end-outline",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -437,13 +419,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             + f"_{bundle_id}_period_percentage"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "period_percentage"], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "period_percentage"], default=0
-        ),
+        available_path=bundle_path("period_percentage"),
+        value_path=bundle_path("period_percentage"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -451,18 +429,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:calendar-clock",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -474,13 +446,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_used_percentage"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "used_percentage"], default=0
-        ),
+        available_path=bundle_path(),
+        value_path=bundle_path("used_percentage"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -488,14 +456,8 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:phone",
@@ -511,13 +473,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             + f"_{bundle_id}_period_percentage"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "period_percentage"], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "period_percentage"], default=0
-        ),
+        available_path=bundle_path("period_percentage"),
+        value_path=bundle_path("period_percentage"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -525,18 +483,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:calendar-clock",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -547,13 +499,9 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_remaining_days"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "remaining_days"], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "remaining_days"], default=0
-        ),
+        available_path=bundle_path("remaining_days"),
+        value_path=bundle_path("remaining_days"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -561,17 +509,11 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=UnitOfTime.DAYS,
         icon="mdi:calendar-end-outline",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -590,9 +532,8 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         > 0
         and safe_get(data, ["balance", "bundles", bundle_id, "category"], default="")
         != "loyalty",
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "rlah_used_percentage"], default=0
-        ),
+        value_path=bundle_path("rlah_used_percentage"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -600,18 +541,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:earth",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -629,9 +564,8 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         > 0
         and safe_get(data, ["balance", "bundles", bundle_id, "category"], default="")
         != "loyalty",
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "rlah_remaining_gb"], default=0
-        ),
+        value_path=bundle_path("rlah_remaining_gb"),
+        value_default=0,
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -639,18 +573,12 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=UnitOfInformation.GIGABYTES,
         suggested_display_precision=1,
         icon="mdi:earth",
-        mobile_platforms=(MOBILE_VIKINGS),
+        mobile_platforms=(MOBILE_VIKINGS,),
     ),
     MobileVikingsSensorDescription(
         key="subscriptions",
@@ -662,13 +590,37 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
             (data.get("sim") or {}).get("msisdn", "") + f"_{bundle_id}_used_percentage"
         ),
         entity_id_prefix_fn=lambda data: "",
-        available_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
-        )
-        is not None,
-        value_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id, "used_percentage"], default=0
+        available_path=bundle_path(),
+        value_path=bundle_path("used_percentage"),
+        value_default=0,
+        device_name_fn=lambda data: "Subscription",
+        device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
+        model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
+        + " - "
+        + safe_get(
+            data, ["product", "descriptions", "title"], default="Unknown Product"
+        ),
+        attributes_path=bundle_path(),
+        placeholder_paths={"category": bundle_path("category")},
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+        icon="mdi:message",
+        mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE),
+    ),
+    # Forecasts of the bundle usage, refined by the rate fitted over its history
+    MobileVikingsSensorDescription(
+        key="subscriptions",
+        bundle_type="data",
+        bundle_category="all",
+        translation_key="data_projected_depletion",
+        subscription_types=("postpaid", "prepaid", "data-only"),
+        unique_id_fn=lambda data, bundle_id: (
+            (data.get("sim") or {}).get("msisdn", "")
+            + f"_{bundle_id}_projected_depletion"
         ),
+        entity_id_prefix_fn=lambda data: "",
+        available_path=bundle_path(),
+        value_path=bundle_path("projected_depletion"),
         device_name_fn=lambda data: "Subscription",
         device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
         model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
@@ -676,14 +628,140 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
         + safe_get(
             data, ["product", "descriptions", "title"], default="Unknown Product"
         ),
-        attributes_fn=lambda data, bundle_id: safe_get(
-            data, ["balance", "bundles", bundle_id], default=None
+        attributes_path=bundle_path("forecast"),
+        placeholder_paths={"category": bundle_path("category")},
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:calendar-alert",
+        mobile_platforms=(MOBILE_VIKINGS,),
+    ),
+    MobileVikingsSensorDescription(
+        key="subscriptions",
+        bundle_type="data",
+        bundle_category="all",
+        translation_key="data_projected_usage",
+        subscription_types=("postpaid", "prepaid", "data-only"),
+        unique_id_fn=lambda data, bundle_id: (
+            (data.get("sim") or {}).get("msisdn", "")
+            + f"_{bundle_id}_projected_usage"
         ),
-        translation_placeholders_fn=lambda data, bundle_id: {
-            "category": safe_get(
-                data, ["balance", "bundles", bundle_id, "category"], default=""
-            )
-        },
+        entity_id_prefix_fn=lambda data: "",
+        available_path=bundle_path("forecast", "projected_period_usage"),
+        value_path=bundle_path("forecast", "projected_period_usage"),
+        device_name_fn=lambda data: "Subscription",
+        device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
+        model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
+        + " - "
+        + safe_get(
+            data, ["product", "descriptions", "title"], default="Unknown Product"
+        ),
+        attributes_path=bundle_path("forecast"),
+        placeholder_paths={"category": bundle_path("category")},
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+        icon="mdi:signal-4g",
+        mobile_platforms=(MOBILE_VIKINGS,),
+    ),
+    MobileVikingsSensorDescription(
+        key="subscriptions",
+        bundle_type="voice",
+        bundle_category="all",
+        translation_key="voice_projected_depletion",
+        subscription_types=("postpaid", "prepaid"),
+        unique_id_fn=lambda data, bundle_id: (
+            (data.get("sim") or {}).get("msisdn", "")
+            + f"_{bundle_id}_projected_depletion"
+        ),
+        entity_id_prefix_fn=lambda data: "",
+        available_path=bundle_path(),
+        value_path=bundle_path("projected_depletion"),
+        device_name_fn=lambda data: "Subscription",
+        device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
+        model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
+        + " - "
+        + safe_get(
+            data, ["product", "descriptions", "title"], default="Unknown Product"
+        ),
+        attributes_path=bundle_path("forecast"),
+        placeholder_paths={"category": bundle_path("category")},
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:calendar-alert",
+        mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE),
+    ),
+    MobileVikingsSensorDescription(
+        key="subscriptions",
+        bundle_type="voice",
+        bundle_category="all",
+        translation_key="voice_projected_usage",
+        subscription_types=("postpaid", "prepaid"),
+        unique_id_fn=lambda data, bundle_id: (
+            (data.get("sim") or {}).get("msisdn", "")
+            + f"_{bundle_id}_projected_usage"
+        ),
+        entity_id_prefix_fn=lambda data: "",
+        available_path=bundle_path("forecast", "projected_period_usage"),
+        value_path=bundle_path("forecast", "projected_period_usage"),
+        device_name_fn=lambda data: "Subscription",
+        device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
+        model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
+        + " - "
+        + safe_get(
+            data, ["product", "descriptions", "title"], default="Unknown Product"
+        ),
+        attributes_path=bundle_path("forecast"),
+        placeholder_paths={"category": bundle_path("category")},
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+        icon="mdi:phone",
+        mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE),
+    ),
+    MobileVikingsSensorDescription(
+        key="subscriptions",
+        bundle_type="sms",
+        bundle_category="all",
+        translation_key="sms_projected_depletion",
+        subscription_types=("postpaid", "prepaid"),
+        unique_id_fn=lambda data, bundle_id: (
+            (data.get("sim") or {}).get("msisdn", "")
+            + f"_{bundle_id}_projected_depletion"
+        ),
+        entity_id_prefix_fn=lambda data: "",
+        available_path=bundle_path(),
+        value_path=bundle_path("projected_depletion"),
+        device_name_fn=lambda data: "Subscription",
+        device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
+        model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
+        + " - "
+        + safe_get(
+            data, ["product", "descriptions", "title"], default="Unknown Product"
+        ),
+        attributes_path=bundle_path("forecast"),
+        placeholder_paths={"category": bundle_path("category")},
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:calendar-alert",
+        mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE),
+    ),
+    MobileVikingsSensorDescription(
+        key="subscriptions",
+        bundle_type="sms",
+        bundle_category="all",
+        translation_key="sms_projected_usage",
+        subscription_types=("postpaid", "prepaid"),
+        unique_id_fn=lambda data, bundle_id: (
+            (data.get("sim") or {}).get("msisdn", "")
+            + f"_{bundle_id}_projected_usage"
+        ),
+        entity_id_prefix_fn=lambda data: "",
+        available_path=bundle_path("forecast", "projected_period_usage"),
+        value_path=bundle_path("forecast", "projected_period_usage"),
+        device_name_fn=lambda data: "Subscription",
+        device_identifier_fn=lambda data: "Subscription " + data.get("id", ""),
+        model_fn=lambda data: (data.get("sim") or {}).get("msisdn", "")
+        + " - "
+        + safe_get(
+            data, ["product", "descriptions", "title"], default="Unknown Product"
+        ),
+        attributes_path=bundle_path("forecast"),
+        placeholder_paths={"category": bundle_path("category")},
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         icon="mdi:message",
@@ -692,6 +770,13 @@ BUNDLE_SENSOR_TYPES: tuple[MobileVikingsSensorDescription, ...] = (
 )
 
 
+DESCRIPTIONS = DescriptionRegistry(
+    static=SENSOR_TYPES,
+    subscription=SUBSCRIPTION_SENSOR_TYPES,
+    bundle=BUNDLE_SENSOR_TYPES,
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -703,66 +788,15 @@ async def async_setup_entry(
         "coordinator"
     ]
 
-    entities: list[MobileVikingsSensor] = []
-    mobile_platform = coordinator.client.mobile_platform
-
-    # Add static sensors from SENSOR_TYPES
-    for sensor_type in SENSOR_TYPES:
-        if mobile_platform not in sensor_type.mobile_platforms:
-            _LOGGER.debug(
-                f"Skipping {sensor_type.key}-{sensor_type.translation_key} for mobile platform {mobile_platform}"
-            )
-            continue
-        _LOGGER.debug(f"Searching for {sensor_type.key}-{sensor_type.translation_key}")
-        if sensor_type.key in coordinator.data:
-            entities.append(
-                MobileVikingsSensor(coordinator, sensor_type, entry, None, None)
-            )
-
-    # Add subscription-related sensors
-    for subscription_id, subscription_data in coordinator.data.get(
-        "subscriptions", {}
-    ).items():
-        # Existing static subscription sensors
-        for sensor_type in SUBSCRIPTION_SENSOR_TYPES:
-            if mobile_platform not in sensor_type.mobile_platforms:
-                continue
-            if (
-                sensor_type.subscription_types is None
-                or subscription_data["type"] in sensor_type.subscription_types
-            ):
-                if sensor_type.key in coordinator.data:
-                    entities.append(
-                        MobileVikingsSensor(
-                            coordinator, sensor_type, entry, subscription_id, None
-                        )
-                    )
-
-        bundles = subscription_data.get("balance", {}).get("bundles", {})
-        for bundle_id, bundle in bundles.items():
-            bundle_type = bundle.get("type")
-            for sensor_type in BUNDLE_SENSOR_TYPES:
-                if bundle_type != "default" and sensor_type.bundle_category is None:
-                    continue
-                if mobile_platform not in sensor_type.mobile_platforms:
-                    continue
-                if (
-                    sensor_type.subscription_types is None
-                    or subscription_data["type"] in sensor_type.subscription_types
-                ):
-                    if sensor_type.bundle_type == bundle_type:
-                        entities.append(
-                            MobileVikingsSensor(
-                                coordinator,
-                                sensor_type,
-                                entry,
-                                subscription_id,
-                                bundle_id,
-                            )
-                        )
-
-    async_add_entities(entities)
-    return
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        DESCRIPTIONS,
+        lambda description, idx, bundle_id: MobileVikingsSensor(
+            coordinator, description, entry, idx, bundle_id
+        ),
+        async_add_entities,
+    )
 
 
 class MobileVikingsSensor(MobileVikingsEntity, RestoreSensor, SensorEntity):
@@ -792,19 +826,20 @@ class MobileVikingsSensor(MobileVikingsEntity, RestoreSensor, SensorEntity):
         # Clean up entity ID construction to avoid double underscores
         entity_id_prefix = f"_{prefix}" if prefix else ""
         self.entity_id = f"sensor.{DOMAIN}{entity_id_prefix}_{description.unique_id_fn(self.item, self.bundle_id)}"
-        if hasattr(description, "translation_placeholders_fn") and callable(
-            description.translation_placeholders_fn
-        ):
-            self._attr_translation_placeholders = (
-                description.translation_placeholders_fn(self.item, self.bundle_id)
-            )
         self._value: StateType = None
 
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
         if self.coordinator.data is not None:
-            return self.entity_description.value_fn(self.item, self.bundle_id)
+            value = self.snapshot.value
+            if (
+                isinstance(value, str)
+                and self.entity_description.device_class == SensorDeviceClass.TIMESTAMP
+            ):
+                # Timestamps are kept as ISO strings in the stored data
+                return dt_util.parse_datetime(value)
+            return value
         return self._value
 
     async def async_added_to_hass(self) -> None:
@@ -822,20 +857,4 @@ class MobileVikingsSensor(MobileVikingsEntity, RestoreSensor, SensorEntity):
                 )
                 await self.coordinator.async_request_refresh()
         else:
-            self._value = self.entity_description.value_fn(self.item, self.bundle_id)
-
-    @property
-    def extra_state_attributes(self):
-        """Return attributes for sensor."""
-        if not self.coordinator.data:
-            return {}
-
-        attributes = {"last_synced": self.last_synced}
-
-        if self.entity_description.attributes_fn:
-            bundle_id = getattr(self, "bundle_id", None)
-            extra_attrs = self.entity_description.attributes_fn(self.item, bundle_id)
-            if extra_attrs:
-                return attributes | extra_attrs
-
-        return attributes
+            self._value = self.snapshot.value
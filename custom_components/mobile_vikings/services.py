@@ -0,0 +1,133 @@
+"""Services of the MobileVikings integration."""
+
+from __future__ import annotations
+
+import logging
+import math
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+import voluptuous as vol
+
+from .const import DOMAIN, SERVICE_INVOICE_PAGE_SIZE, SERVICE_INVOICE_PAGE_SIZE_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GET_INVOICES = "get_invoices"
+SERVICE_GET_USAGE_HISTORY = "get_usage_history"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_STATUS = "status"
+ATTR_PAGE = "page"
+ATTR_PAGE_SIZE = "page_size"
+ATTR_SUBSCRIPTION_ID = "subscription_id"
+ATTR_BUNDLE_ID = "bundle_id"
+ATTR_START = "start"
+ATTR_END = "end"
+
+INVOICE_SECTIONS = {
+    "paid": "paid_invoices",
+    "unpaid": "unpaid_invoices",
+}
+
+GET_INVOICES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_STATUS): vol.In(list(INVOICE_SECTIONS)),
+        vol.Optional(ATTR_PAGE, default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_PAGE_SIZE, default=SERVICE_INVOICE_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=SERVICE_INVOICE_PAGE_SIZE_MAX)
+        ),
+    }
+)
+
+GET_USAGE_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_SUBSCRIPTION_ID): cv.string,
+        vol.Required(ATTR_BUNDLE_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+def _get_coordinator(call: ServiceCall):
+    """Return the coordinator of the config entry targeted by a service call."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    try:
+        return call.hass.data[DOMAIN][entry_id]["coordinator"]
+    except KeyError as exception:
+        raise ServiceValidationError(
+            f"No loaded Mobile Vikings config entry with id {entry_id}"
+        ) from exception
+
+
+async def async_get_invoices(call: ServiceCall) -> ServiceResponse:
+    """Return a page of the invoices held by the coordinator of a config entry."""
+    coordinator = _get_coordinator(call)
+    section = coordinator.data.get(INVOICE_SECTIONS[call.data[ATTR_STATUS]]) or {}
+    invoices = section.get("results") or []
+    page = call.data[ATTR_PAGE]
+    page_size = call.data[ATTR_PAGE_SIZE]
+    start = (page - 1) * page_size
+    _LOGGER.debug(
+        f"[get_invoices] {call.data[ATTR_STATUS]} page {page} of {page_size} invoices"
+    )
+    return {
+        "total_items": len(invoices),
+        "page": page,
+        "page_size": page_size,
+        "pages": math.ceil(len(invoices) / page_size),
+        "results": invoices[start : start + page_size],
+    }
+
+
+async def async_get_usage_history(call: ServiceCall) -> ServiceResponse:
+    """Return the stored usage records of a bundle between start and end."""
+    coordinator = _get_coordinator(call)
+    # Naive datetimes are in the time zone of Home Assistant
+    start, end = (
+        dt_util.as_utc(value) if (value := call.data.get(attribute)) else None
+        for attribute in (ATTR_START, ATTR_END)
+    )
+    records = await coordinator.usage_history.async_read(
+        call.data[ATTR_SUBSCRIPTION_ID], call.data[ATTR_BUNDLE_ID], start, end
+    )
+    return {
+        "records": [
+            {
+                "timestamp": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                "used": used,
+                "total": total,
+            }
+            for timestamp, used, total in records
+        ]
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the MobileVikings services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_INVOICES,
+        async_get_invoices,
+        schema=GET_INVOICES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_USAGE_HISTORY,
+        async_get_usage_history,
+        schema=GET_USAGE_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
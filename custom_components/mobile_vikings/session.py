@@ -0,0 +1,89 @@
+"""HTTP session and request scheduling shared by all MobileVikings entries."""
+
+from __future__ import annotations
+
+import asyncio
+from importlib.util import find_spec
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.httpx_client import create_async_httpx_client
+
+from .const import DOMAIN, POLL_STAGGER, REQUEST_BURST, REQUEST_RATE_LIMIT
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_REQUEST_SCHEDULER = f"{DOMAIN}_request_scheduler"
+
+
+class RateLimiter:
+    """Token bucket limiting the rate of requests.
+
+    Up to burst requests go out at once, after which requests are spaced at
+    the given rate. Waiting requests are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+class RequestScheduler:
+    """Connection pool, rate limit and poll staggering of all config entries.
+
+    Mobile Vikings and JIM Mobile accounts talk to the same host. Their
+    requests share one keep-alive connection pool, over HTTP/2 when the h2
+    package is available, and one rate limit. Polls are spread so the
+    entries do not hit the API at the same instant.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared client, closed when Home Assistant stops.
+
+        The client keeps the connection pool limits of Home Assistant, which
+        sets them itself.
+        """
+        self.http2 = find_spec("h2") is not None
+        self.client = create_async_httpx_client(hass, http2=self.http2)
+        self.rate_limiter = RateLimiter(REQUEST_RATE_LIMIT, REQUEST_BURST)
+        self._next_poll = 0.0
+
+    async def async_stagger(self) -> None:
+        """Wait until a poll may start, at least POLL_STAGGER after the previous one.
+
+        The coordinators schedule their next poll from the end of the current
+        one, so polls spread once stay apart.
+        """
+        now = time.monotonic()
+        delay = max(self._next_poll - now, 0)
+        self._next_poll = now + delay + POLL_STAGGER.total_seconds()
+        if delay:
+            _LOGGER.debug(f"Delaying poll by {delay:.1f}s to stagger the accounts")
+            await asyncio.sleep(delay)
+
+
+@callback
+def async_get_request_scheduler(hass: HomeAssistant) -> RequestScheduler:
+    """Return the request scheduler shared by all config entries."""
+    if (scheduler := hass.data.get(DATA_REQUEST_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_REQUEST_SCHEDULER] = RequestScheduler(hass)
+    return scheduler
@@ -0,0 +1,209 @@
+"""Import of the bundle usage and invoices into the long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import CURRENCY_EURO, UnitOfInformation
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, GIB, SECONDS_PER_HOUR
+from .invoices import INVOICE_AMOUNT_KEYS, parse_date
+from .timeseries import UsageHistoryStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def hourly_usage_statistics(
+    records: list[tuple[float, float, float]],
+    after: float | None,
+    until: float,
+    base_sum: float,
+    scale: float = 1,
+) -> list[StatisticData]:
+    """Turn usage records into hourly statistics with a growing sum.
+
+    Records before after only serve as the baseline of the first delta, and
+    records from until onwards are left for a later import, as their hour is
+    not complete yet. A usage decrease is a bundle renewal: the new usage
+    counts as the delta.
+    """
+    hours: dict[float, tuple[float, float]] = {}
+    previous = None
+    total = base_sum
+    for timestamp, used, _ in records:
+        if timestamp >= until:
+            break
+        if previous is None:
+            increase = 0
+        else:
+            increase = used - previous if used >= previous else used
+        previous = used
+        hour = timestamp - timestamp % SECONDS_PER_HOUR
+        if after is not None and hour <= after:
+            continue
+        total += increase * scale
+        hours[hour] = (used * scale, total)
+    return [
+        StatisticData(
+            start=dt_util.utc_from_timestamp(hour),
+            state=round(state, 3),
+            sum=round(total_sum, 3),
+        )
+        for hour, (state, total_sum) in hours.items()
+    ]
+
+
+def invoice_statistics(invoices: list[dict], amount_key: str) -> list[StatisticData]:
+    """Turn invoices into hourly statistics of the invoiced amount."""
+    hours: dict[datetime, float] = {}
+    for invoice in invoices:
+        if not (value := invoice.get("invoice_date")) or not (
+            invoice_date := parse_date(value)
+        ):
+            continue
+        if invoice_date.tzinfo is None:
+            invoice_date = invoice_date.replace(tzinfo=timezone.utc)
+        hour = invoice_date.replace(minute=0, second=0, microsecond=0)
+        hours[hour] = hours.get(hour, 0) + (invoice.get(amount_key) or 0)
+    statistics = []
+    total = 0
+    for hour in sorted(hours):
+        total += hours[hour]
+        statistics.append(
+            StatisticData(start=hour, state=round(hours[hour], 2), sum=round(total, 2))
+        )
+    return statistics
+
+
+class StatisticsImporter:
+    """Import hourly bundle usage and paid invoices as external statistics.
+
+    Usage statistics are built from the local usage history, so the first
+    import backfills all of it. Later imports only add the hours completed
+    since the last imported statistic.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, usage_history: UsageHistoryStore
+    ) -> None:
+        """Initialize the importer of a config entry."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.usage_history = usage_history
+        self._last_hour: datetime | None = None
+        self._last_imported: dict[str, tuple[float, float] | None] = {}
+        self._invoice_count: int | None = None
+
+    def statistic_id(self, name: str) -> str:
+        """Return the id of an external statistic of the config entry."""
+        return f"{DOMAIN}:{slugify(f'{self.entry_id}_{name}')}"
+
+    async def async_import_usage(self, subscriptions: dict, now: datetime) -> None:
+        """Import the usage of the hours completed since the last import."""
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if hour == self._last_hour:
+            return
+        self._last_hour = hour
+        for subscription_id, subscription in subscriptions.items():
+            bundles = (subscription.get("balance") or {}).get("bundles") or {}
+            for bundle_id, bundle in bundles.items():
+                if bundle.get("unlimited", bundle.get("total", 0) <= 0):
+                    continue
+                await self._async_import_bundle(
+                    subscription_id, subscription, bundle_id, bundle, hour
+                )
+
+    async def _async_import_bundle(
+        self,
+        subscription_id: str,
+        subscription: dict,
+        bundle_id: str,
+        bundle: dict,
+        hour: datetime,
+    ) -> None:
+        """Import the hourly usage of a bundle."""
+        statistic_id = self.statistic_id(f"{subscription_id}_{bundle_id}_usage")
+        last = await self._async_last_imported(statistic_id)
+        after, base_sum = last if last else (None, 0)
+        records = await self.usage_history.async_read(
+            subscription_id,
+            bundle_id,
+            start=dt_util.utc_from_timestamp(after) if after is not None else None,
+        )
+        is_data = bundle.get("type") == "data"
+        statistics = hourly_usage_statistics(
+            records, after, hour.timestamp(), base_sum, 1 / GIB if is_data else 1
+        )
+        if not statistics:
+            return
+        msisdn = (subscription.get("sim") or {}).get("msisdn") or subscription_id
+        async_add_external_statistics(
+            self.hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{msisdn} {bundle_id} usage",
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=UnitOfInformation.GIGABYTES if is_data else None,
+            ),
+            statistics,
+        )
+        self._last_imported[statistic_id] = (
+            statistics[-1]["start"].timestamp(),
+            statistics[-1]["sum"],
+        )
+        _LOGGER.debug(f"Imported {len(statistics)} hours of {statistic_id}")
+
+    async def _async_last_imported(
+        self, statistic_id: str
+    ) -> tuple[float, float] | None:
+        """Return the start and sum of the last imported hour of a statistic."""
+        if statistic_id not in self._last_imported:
+            result = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+            )
+            last = None
+            if rows := result.get(statistic_id):
+                start = rows[0]["start"]
+                if isinstance(start, datetime):
+                    start = start.timestamp()
+                last = (start, rows[0].get("sum") or 0)
+            self._last_imported[statistic_id] = last
+        return self._last_imported[statistic_id]
+
+    async def async_import_invoices(self, section: dict) -> None:
+        """Import the paid invoices when the ledger changed.
+
+        Invoices are few, the whole series is imported again, replacing the
+        statistics of the same hours.
+        """
+        invoices = section.get("results") or []
+        if len(invoices) == self._invoice_count:
+            return
+        self._invoice_count = len(invoices)
+        statistics = invoice_statistics(invoices, INVOICE_AMOUNT_KEYS["paid_invoices"])
+        if not statistics:
+            return
+        async_add_external_statistics(
+            self.hass,
+            StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name="Paid invoices",
+                source=DOMAIN,
+                statistic_id=self.statistic_id("paid_invoices"),
+                unit_of_measurement=CURRENCY_EURO,
+            ),
+            statistics,
+        )
+        _LOGGER.debug(f"Imported {len(statistics)} hours of paid invoices")
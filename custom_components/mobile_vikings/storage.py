@@ -0,0 +1,95 @@
+"""Persistence of the MobileVikings coordinator data."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DERIVED_SECTIONS,
+    DOMAIN,
+    STORAGE_GROUPS,
+    STORE_SAVE_DELAY,
+    UNHASHED_SECTIONS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MobileVikingsStorage:
+    """Store the coordinator data, split in groups of sections.
+
+    Slow changing sections like invoices and products are kept apart from fast
+    changing ones like balances. A group is only written when the hash of its
+    content changed, and writes are coalesced with Store.async_delay_save.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, delay: int = STORE_SAVE_DELAY
+    ) -> None:
+        """Initialize the storage of a config entry."""
+        self.delay = delay
+        self._stores = {
+            group: Store(hass, 1, f"{DOMAIN}/{entry_id}{group}")
+            for group in STORAGE_GROUPS
+        }
+        self._hashes: dict[str, str] = {}
+
+    async def async_load(self) -> dict:
+        """Load and merge the data of all groups."""
+        data = {}
+        for group, store in self._stores.items():
+            stored = await store.async_load() or {}
+            # Files written before the split hold every section in one group
+            data |= {
+                key: value
+                for key, value in stored.items()
+                if self._group_of(key) == group or key not in data
+            }
+            self._hashes[group] = self._hash(self._sections_of(group, stored))
+        return data
+
+    @callback
+    def async_schedule_save(self, data: dict) -> None:
+        """Schedule a write of the groups whose content changed."""
+        for group, store in self._stores.items():
+            sections = self._sections_of(group, data)
+            digest = self._hash(sections)
+            if digest == self._hashes.get(group):
+                continue
+            self._hashes[group] = digest
+            _LOGGER.debug("Scheduling save of storage group '%s'", group or "main")
+            store.async_delay_save(lambda sections=sections: sections, self.delay)
+
+    @staticmethod
+    def _group_of(key: str) -> str | None:
+        """Return the group a section is stored in, the main group by default."""
+        if key in DERIVED_SECTIONS:
+            return None
+        for group, keys in STORAGE_GROUPS.items():
+            if key in keys:
+                return group
+        return ""
+
+    def _sections_of(self, group: str, data: dict) -> dict:
+        """Return the sections of data stored in group."""
+        return {
+            key: value for key, value in data.items() if self._group_of(key) == group
+        }
+
+    @staticmethod
+    def _hash(sections: dict) -> str:
+        """Return a content hash of the sections, without the unhashed ones."""
+        hashed = {
+            key: value
+            for key, value in sections.items()
+            if key not in UNHASHED_SECTIONS
+        }
+        return hashlib.sha1(
+            json.dumps(hashed, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
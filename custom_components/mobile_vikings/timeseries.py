@@ -0,0 +1,204 @@
+"""Compact on-disk time series of the bundle usage."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+import mmap
+import os
+from pathlib import Path
+import re
+import struct
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    DOMAIN,
+    USAGE_HISTORY_COMPACT_INTERVAL,
+    USAGE_HISTORY_DOWNSAMPLE_AFTER,
+    USAGE_HISTORY_DOWNSAMPLE_RESOLUTION,
+    USAGE_HISTORY_RETENTION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timestamp in seconds since the epoch, used and total of the bundle
+RECORD = struct.Struct("<ddd")
+
+
+class UsageTimeSeries:
+    """Append-only file of fixed size usage records of a bundle.
+
+    Records are ordered by timestamp, so range reads are binary searches on
+    the memory-mapped file. Compaction downsamples old records and drops the
+    ones past the retention. All methods do blocking I/O, run them in the
+    executor.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the time series stored at path."""
+        self.path = path
+        self._last_timestamp: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of records in the file."""
+        try:
+            return self.path.stat().st_size // RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def append(self, timestamp: float, used: float, total: float) -> bool:
+        """Append a record, unless it is not newer than the last one."""
+        if self._last_timestamp is None:
+            self._last_timestamp = self._read_last_timestamp()
+        if timestamp <= self._last_timestamp:
+            return False
+        with self.path.open("ab") as file:
+            file.write(RECORD.pack(timestamp, used, total))
+        self._last_timestamp = timestamp
+        return True
+
+    def _read_last_timestamp(self) -> float:
+        """Return the timestamp of the last record, dropping a partial record."""
+        try:
+            file = self.path.open("r+b")
+        except FileNotFoundError:
+            return float("-inf")
+        with file:
+            size = os.fstat(file.fileno()).st_size
+            if size % RECORD.size:
+                # An interrupted write left a partial record behind
+                size -= size % RECORD.size
+                file.truncate(size)
+            if not size:
+                return float("-inf")
+            file.seek(size - RECORD.size)
+            return RECORD.unpack(file.read(RECORD.size))[0]
+
+    def read(
+        self, start: float | None = None, end: float | None = None
+    ) -> list[tuple[float, float, float]]:
+        """Return the records with a timestamp between start and end included."""
+        try:
+            file = self.path.open("rb")
+        except FileNotFoundError:
+            return []
+        with file:
+            count = os.fstat(file.fileno()).st_size // RECORD.size
+            if not count:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                first = 0 if start is None else self._bisect(data, count, start)
+                last = (
+                    count
+                    if end is None
+                    else self._bisect(data, count, end, inclusive=True)
+                )
+                return [
+                    RECORD.unpack_from(data, index * RECORD.size)
+                    for index in range(first, last)
+                ]
+
+    @staticmethod
+    def _bisect(
+        data: mmap.mmap, count: int, timestamp: float, inclusive: bool = False
+    ) -> int:
+        """Return the index of the first record after timestamp."""
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            value = RECORD.unpack_from(data, middle * RECORD.size)[0]
+            if value < timestamp or (inclusive and value == timestamp):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def compact(self, now: float) -> None:
+        """Downsample the old records and drop the records past the retention."""
+        records = self.read(start=now - USAGE_HISTORY_RETENTION.total_seconds())
+        downsample_before = now - USAGE_HISTORY_DOWNSAMPLE_AFTER.total_seconds()
+        resolution = USAGE_HISTORY_DOWNSAMPLE_RESOLUTION.total_seconds()
+        # The last record of every bucket is kept, usage only grows in a period
+        buckets: dict[float, tuple[float, float, float]] = {}
+        recent = []
+        for record in records:
+            if record[0] < downsample_before:
+                buckets[record[0] // resolution] = record
+            else:
+                recent.append(record)
+        compacted = [*buckets.values(), *recent]
+        if len(compacted) == len(self):
+            return
+        temporary = self.path.with_suffix(".tmp")
+        with temporary.open("wb") as file:
+            file.write(b"".join(RECORD.pack(*record) for record in compacted))
+        os.replace(temporary, self.path)
+        _LOGGER.debug(
+            f"Compacted {self.path.name} from {len(records)} to {len(compacted)} records"
+        )
+
+
+class UsageHistoryStore:
+    """Usage time series of all bundles of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store, files live next to the entry's other storage."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.directory = Path(hass.config.path(STORAGE_DIR)) / DOMAIN
+        self._series: dict[tuple[str, str], UsageTimeSeries] = {}
+        self._last_compaction: float | None = None
+
+    def series(self, subscription_id: str, bundle_id: str) -> UsageTimeSeries:
+        """Return the time series of a bundle."""
+        key = (subscription_id, bundle_id)
+        if (series := self._series.get(key)) is None:
+            name = re.sub(r"[^\w-]", "_", f"{subscription_id}_{bundle_id}")
+            series = self._series[key] = UsageTimeSeries(
+                self.directory / f"{self.entry_id}_usage_{name}.bin"
+            )
+        return series
+
+    async def async_append(self, subscriptions: dict, now: datetime) -> None:
+        """Append the usage of every limited bundle, compacting once a day."""
+        samples = [
+            (self.series(subscription_id, bundle_id), bundle)
+            for subscription_id, subscription in subscriptions.items()
+            for bundle_id, bundle in (
+                (subscription.get("balance") or {}).get("bundles") or {}
+            ).items()
+            if not bundle.get("unlimited", bundle.get("total", 0) <= 0)
+        ]
+        await self.hass.async_add_executor_job(
+            self._append_samples, samples, now.timestamp()
+        )
+
+    def _append_samples(self, samples: list, timestamp: float) -> None:
+        """Append the samples and compact the files when due."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for series, bundle in samples:
+            series.append(timestamp, bundle.get("used", 0), bundle.get("total", 0))
+        if (
+            self._last_compaction is None
+            or timestamp - self._last_compaction
+            >= USAGE_HISTORY_COMPACT_INTERVAL.total_seconds()
+        ):
+            self._last_compaction = timestamp
+            for series, _ in samples:
+                series.compact(timestamp)
+
+    async def async_read(
+        self,
+        subscription_id: str,
+        bundle_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[tuple[float, float, float]]:
+        """Return the usage records of a bundle between start and end."""
+        return await self.hass.async_add_executor_job(
+            self.series(subscription_id, bundle_id).read,
+            start.timestamp() if start else None,
+            end.timestamp() if end else None,
+        )
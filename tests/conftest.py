@@ -0,0 +1,137 @@
+"""Fixtures for the MobileVikings tests."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+import httpx
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mobile_vikings.client import MobileVikingsClient
+from custom_components.mobile_vikings.const import (
+    BASE_URL,
+    DOMAIN,
+    INVOICE_PAGE_SIZE,
+    MOBILE_VIKINGS,
+)
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+UNPAID_INVOICES = "/invoices?status=accepted,bad_dept,created,issued,partially_paid,pending_payment,review,unknown&per_page=20"
+PAID_INVOICES = f"/invoices?status=paid&page=1&per_page={INVOICE_PAGE_SIZE}"
+
+TOKEN_RESPONSE = {
+    "access_token": "access",
+    "refresh_token": "refresh",
+    "expires_in": 3600,
+}
+
+
+class MockApi:
+    """Double of the Mobile Vikings API, answering the requests of an httpx client.
+
+    Routes map an endpoint, with its query, to a response or a list of
+    responses served in turn, the last one being repeated. A response is a
+    JSON serializable body, an httpx.Response or an exception to raise.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the API with the token endpoint."""
+        self.routes: dict[str, list] = {"/oauth2/token/": [TOKEN_RESPONSE]}
+        self.requests: list[httpx.Request] = []
+
+    def add(self, endpoint: str, *responses) -> None:
+        """Answer an endpoint with the responses, in turn."""
+        self.routes[endpoint] = list(responses)
+
+    def endpoints(self) -> list[str]:
+        """Return the endpoints requested so far, without the token requests."""
+        return [
+            endpoint
+            for request in self.requests
+            if (endpoint := str(request.url).removeprefix(BASE_URL)) != "/oauth2/token/"
+        ]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Return the next response of the requested endpoint."""
+        self.requests.append(request)
+        endpoint = str(request.url).removeprefix(BASE_URL)
+        if not (responses := self.routes.get(endpoint)):
+            return httpx.Response(404, json={"detail": "Not found."})
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        if isinstance(response, httpx.Response):
+            return response
+        return httpx.Response(200, content=json.dumps(response).encode())
+
+
+@pytest.fixture(autouse=True)
+def mock_recorder_before_hass(async_test_recorder) -> None:
+    """Prepare the recorder before hass is set up, the integration depends on it."""
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the custom integrations in every test."""
+    yield
+
+
+@pytest.fixture
+def api() -> MockApi:
+    """Return the API double."""
+    return MockApi()
+
+
+@pytest.fixture
+def mock_transport(api: MockApi):
+    """Route the requests of every httpx client of Home Assistant to the API double."""
+
+    async def handle_async_request(transport, request: httpx.Request) -> httpx.Response:
+        return api.handler(request)
+
+    with patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    ):
+        yield api
+
+
+@pytest.fixture
+def client(hass, api: MockApi) -> MobileVikingsClient:
+    """Return a client talking to the API double, without retry delays."""
+    client = MobileVikingsClient(hass, "user", "secret", MOBILE_VIKINGS)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(api.handler))
+    client.retry.backoff_base = 0
+    return client
+
+
+@pytest.fixture
+def mock_api(mock_transport: MockApi) -> MockApi:
+    """Return the API double of an account without subscriptions."""
+    mock_transport.add("/customers/me", {"first_name": "Ragnar"})
+    mock_transport.add("/loyalty-points/balance", {"available": 42})
+    mock_transport.add("/subscriptions", [])
+    mock_transport.add(UNPAID_INVOICES, {"total_items": 0, "results": []})
+    mock_transport.add(PAID_INVOICES, {"total_items": 0, "results": []})
+    return mock_transport
+
+
+@pytest.fixture
+def entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a config entry added to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="user",
+        unique_id=f"{DOMAIN}_user",
+        data={
+            CONF_USERNAME: "user",
+            CONF_PASSWORD: "secret",
+            "mobile_platform": MOBILE_VIKINGS,
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
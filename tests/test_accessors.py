@@ -0,0 +1,31 @@
+"""Tests for the compiled accessor paths."""
+
+from custom_components.mobile_vikings.accessors import CompiledPath, bundle_path
+
+SUBSCRIPTION = {
+    "balance": {"bundles": {"42": {"used": 10, "periods": [{"used": 4}]}}},
+    "type": "mobile",
+}
+
+
+def test_bundle_path_is_bound_to_bundle_id() -> None:
+    """Test the bundle placeholder is replaced by the bundle id of the entity."""
+    path = CompiledPath(bundle_path("used"), "42")
+
+    assert path.keys == ("balance", "bundles", "42", "used")
+    assert path(SUBSCRIPTION) == 10
+
+
+def test_missing_keys_return_default() -> None:
+    """Test a missing key or a value of the wrong type returns the default."""
+    assert CompiledPath(bundle_path("used"), "7")(SUBSCRIPTION) is None
+    assert CompiledPath(("type", "name"))(SUBSCRIPTION, "unknown") == "unknown"
+    assert CompiledPath(("balance",))(None) is None
+
+
+def test_list_indexes() -> None:
+    """Test list items are resolved by index."""
+    path = CompiledPath(bundle_path("periods", 0, "used"), "42")
+
+    assert path(SUBSCRIPTION) == 4
+    assert CompiledPath(bundle_path("periods", 1, "used"), "42")(SUBSCRIPTION) is None
@@ -0,0 +1,81 @@
+"""Tests for the batched bundle analytics."""
+
+from datetime import datetime, timezone
+
+from custom_components.mobile_vikings.analytics import BundleAnalytics
+from custom_components.mobile_vikings.const import GIB
+
+NOW = datetime(2026, 1, 11, tzinfo=timezone.utc)
+
+
+def subscription(*bundles: dict) -> dict:
+    """Return a subscription holding the bundles."""
+    return {
+        "id": "1",
+        "sim": {"msisdn": "32470000000", "alias": "Phone"},
+        "balance": {"bundles": list(bundles)},
+    }
+
+
+def bundle(**values) -> dict:
+    """Return a bundle of a period from the first to the 31st of January."""
+    return {
+        "type": "data",
+        "category": "default",
+        "valid_from": "2026-01-01T00:00:00+0000",
+        "valid_until": "2026-01-31T00:00:00+0000",
+        **values,
+    }
+
+
+def test_enrich_bundles_by_key() -> None:
+    """Test bundles are keyed by type and category and get derived properties."""
+    enriched = BundleAnalytics(NOW).enrich_subscription(
+        subscription(
+            bundle(total=10 * GIB, used=5 * GIB),
+            bundle(type="sms", total=0, used=3),
+        )
+    )
+
+    data = enriched["balance"]["bundles"]["data_default"]
+    assert data["used_percentage"] == 50
+    assert data["period_percentage"] == 33.33
+    assert data["remaining_days"] == 20
+    assert data["remaining_gb"] == 5
+    assert data["msisdn"] == "32470000000"
+    assert data["daily_burn_rate"] == round(GIB / 2, 2)
+    assert data["projected_depletion"] == "2026-01-21T00:00:00+00:00"
+    assert data["depletes_before_renewal"]
+
+    sms = enriched["balance"]["bundles"]["sms_default"]
+    assert sms["unlimited"]
+    assert sms["used_percentage"] == 0
+    assert sms["projected_depletion"] is None
+
+
+def test_api_data_is_left_untouched() -> None:
+    """Test the enriched subscription is a copy."""
+    raw = subscription(bundle(total=10, used=5))
+
+    enriched = BundleAnalytics(NOW).enrich_subscription(raw)
+
+    assert isinstance(raw["balance"]["bundles"], list)
+    assert enriched is not raw
+
+
+def test_period_not_started() -> None:
+    """Test a bundle whose period has not started has no burn rate."""
+    analytics = BundleAnalytics(datetime(2025, 12, 1, tzinfo=timezone.utc))
+    enriched = analytics.enrich_subscription(subscription(bundle(total=10, used=0)))
+
+    assert enriched["balance"]["bundles"]["data_default"]["daily_burn_rate"] is None
+
+
+def test_invalid_bundles_drop_the_balance() -> None:
+    """Test a bundle without a valid period drops the balance of the subscription."""
+    raw = subscription(bundle(total=10, used=5, valid_from="invalid"))
+
+    enriched = BundleAnalytics(NOW).enrich_subscription(raw)
+
+    assert "balance" not in enriched
+    assert enriched["id"] == "1"
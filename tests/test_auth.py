@@ -0,0 +1,117 @@
+"""Tests for the OAuth2 token manager."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from custom_components.mobile_vikings.auth import AuthenticationError, TokenManager
+from custom_components.mobile_vikings.const import MOBILE_VIKINGS
+
+
+class TokenEndpoint:
+    """Token endpoint double, recording the grant types it was asked for."""
+
+    def __init__(self, *responses: httpx.Response) -> None:
+        """Initialize the endpoint with the responses, served in turn."""
+        self.responses = list(responses)
+        self.grants: list[str] = []
+
+    async def __call__(self, payload: dict) -> httpx.Response:
+        """Answer a token request."""
+        self.grants.append(payload["grant_type"])
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+
+def token_response(access_token: str = "access", expires_in: int = 3600):
+    """Return a successful token response."""
+    return httpx.Response(
+        200,
+        json={
+            "access_token": access_token,
+            "refresh_token": f"refresh-{access_token}",
+            "expires_in": expires_in,
+        },
+    )
+
+
+def manager(endpoint: TokenEndpoint, **kwargs) -> TokenManager:
+    """Return a token manager using the endpoint double."""
+    return TokenManager("user", "secret", MOBILE_VIKINGS, endpoint, **kwargs)
+
+
+async def test_concurrent_callers_share_one_request() -> None:
+    """Test concurrent callers wait on the token request in progress."""
+    endpoint = TokenEndpoint(token_response())
+    tokens = manager(endpoint)
+
+    results = await asyncio.gather(*(tokens.async_get_access_token() for _ in range(5)))
+
+    assert results == ["access"] * 5
+    assert endpoint.grants == ["password"]
+
+
+async def test_refresh_before_expiry() -> None:
+    """Test a token about to expire is refreshed with the refresh token."""
+    endpoint = TokenEndpoint(token_response("first", 60), token_response("second"))
+    tokens = manager(endpoint, margin=timedelta(minutes=5))
+
+    assert await tokens.async_get_access_token() == "first"
+    assert await tokens.async_get_access_token() == "second"
+    assert endpoint.grants == ["password", "refresh_token"]
+
+
+async def test_rejected_refresh_token_logs_in() -> None:
+    """Test a rejected refresh token falls back to a password login."""
+    endpoint = TokenEndpoint(
+        httpx.Response(401, json={"error_description": "expired"}),
+        token_response(),
+    )
+    tokens = manager(endpoint)
+    tokens.restore({"refresh_token": "old"})
+
+    assert await tokens.async_get_access_token() == "access"
+    assert endpoint.grants == ["refresh_token", "password"]
+
+
+async def test_invalid_credentials() -> None:
+    """Test a rejected password login raises an authentication error."""
+    endpoint = TokenEndpoint(
+        httpx.Response(400, json={"error_description": "invalid credentials"})
+    )
+
+    with pytest.raises(AuthenticationError):
+        await manager(endpoint).async_get_access_token()
+
+
+async def test_refresh_rejected_token_once() -> None:
+    """Test a token rejected by several callers is refreshed once."""
+    endpoint = TokenEndpoint(token_response("first"), token_response("second"))
+    tokens = manager(endpoint)
+    rejected = await tokens.async_get_access_token()
+
+    results = await asyncio.gather(*(tokens.async_refresh(rejected) for _ in range(3)))
+
+    assert results == ["second"] * 3
+    assert endpoint.grants == ["password", "refresh_token"]
+
+
+async def test_restore_tokens() -> None:
+    """Test a valid access token is restored and an expired one is dropped."""
+    endpoint = TokenEndpoint(token_response())
+    tokens = manager(endpoint)
+    await tokens.async_get_access_token()
+
+    restored = manager(TokenEndpoint())
+    restored.restore(tokens.as_dict())
+    assert await restored.async_get_access_token() == "access"
+
+    expired = manager(TokenEndpoint())
+    expired.restore(
+        tokens.as_dict()
+        | {"expires_at": (datetime.now(timezone.utc) - timedelta(1)).isoformat()}
+    )
+    assert not expired.is_token_valid()
+    assert expired.refresh_token == "refresh-access"
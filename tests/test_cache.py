@@ -0,0 +1,148 @@
+"""Tests for the MobileVikings caches."""
+
+import asyncio
+from datetime import timedelta
+import time
+
+import httpx
+import pytest
+
+from custom_components.mobile_vikings.cache import ProductCache, ResponseCache
+from custom_components.mobile_vikings.client import MobileVikingsClient
+
+
+def test_product_cache_expires_entries() -> None:
+    """Test an entry older than the TTL is dropped."""
+    cache = ProductCache(ttl=timedelta(hours=1))
+    cache.set("fresh", {"id": "fresh"})
+    cache.set("stale", {"id": "stale"}, fetched_at=time.time() - 7200)
+
+    assert cache.get("fresh") == {"id": "fresh"}
+    assert cache.get("stale") is None
+    assert "stale" not in cache.as_dict()
+
+
+def test_product_cache_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is evicted at the size limit."""
+    cache = ProductCache(max_size=2)
+    cache.set("1", {"id": "1"})
+    cache.set("2", {"id": "2"})
+    cache.get("1")
+    cache.set("3", {"id": "3"})
+
+    assert list(cache.as_dict()) == ["1", "3"]
+
+
+async def test_product_cache_single_flight() -> None:
+    """Test concurrent lookups of a product share a single fetch."""
+    cache = ProductCache()
+    calls = 0
+
+    async def fetch() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"id": "1"}
+
+    results = await asyncio.gather(*(cache.async_get("1", fetch) for _ in range(5)))
+
+    assert results == [{"id": "1"}] * 5
+    assert calls == 1
+    assert await cache.async_get("1", fetch) == {"id": "1"}
+    assert calls == 1
+
+
+async def test_product_cache_does_not_cache_errors() -> None:
+    """Test a failed fetch is raised and fetched again on the next lookup."""
+    cache = ProductCache()
+
+    async def fail() -> dict:
+        raise ValueError("boom")
+
+    async def fetch() -> dict:
+        return {"id": "1"}
+
+    with pytest.raises(ValueError):
+        await cache.async_get("1", fail)
+    assert await cache.async_get("1", fetch) == {"id": "1"}
+
+
+async def test_product_cache_does_not_cache_error_payloads() -> None:
+    """Test an error payload is returned without being cached."""
+    cache = ProductCache()
+    responses = [{"error": "Not found."}, {"id": "1"}]
+
+    async def fetch() -> dict:
+        return responses.pop(0)
+
+    assert await cache.async_get("1", fetch) == {"error": "Not found."}
+    assert cache.as_dict() == {}
+    assert await cache.async_get("1", fetch) == {"id": "1"}
+    assert cache.get("1") == {"id": "1"}
+
+
+def test_product_cache_restore() -> None:
+    """Test exported entries are restored, dropping invalid, error and expired ones."""
+    cache = ProductCache(ttl=timedelta(hours=1))
+    cache.set("1", {"id": "1"})
+    exported = cache.as_dict()
+    exported["2"] = {"product": {"id": "2"}}
+    exported["3"] = {"product": {"id": "3"}, "fetched_at": time.time() - 7200}
+    exported["4"] = {"product": {"error": "Not found."}, "fetched_at": time.time()}
+
+    restored = ProductCache(ttl=timedelta(hours=1))
+    restored.restore(exported)
+
+    assert restored.as_dict() == cache.as_dict()
+
+
+def test_response_cache_reuses_unchanged_bodies() -> None:
+    """Test an unchanged body is not decoded again and keeps its object."""
+    cache = ResponseCache()
+
+    first = cache.store("/customers/me", httpx.Response(200, json={"id": 1}))
+    second = cache.store("/customers/me", httpx.Response(200, json={"id": 1}))
+    changed = cache.store("/customers/me", httpx.Response(200, json={"id": 2}))
+
+    assert second is first
+    assert changed == {"id": 2}
+    assert cache.as_dict() == {"size": 1, "hits": 1, "misses": 2}
+
+
+def test_response_cache_conditional_headers() -> None:
+    """Test the validators of the cached response are sent back."""
+    cache = ResponseCache(max_size=1)
+    assert cache.conditional_headers("/customers/me") == {}
+
+    cache.store(
+        "/customers/me",
+        httpx.Response(
+            200,
+            json={"id": 1},
+            headers={"ETag": '"v1"', "Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT"},
+        ),
+    )
+
+    assert cache.conditional_headers("/customers/me") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Thu, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert cache.not_modified("/customers/me") == {"id": 1}
+
+    cache.store("/subscriptions", httpx.Response(200, json=[]))
+    assert cache.not_modified("/customers/me") is None
+
+
+async def test_client_revalidates_responses(client: MobileVikingsClient, api) -> None:
+    """Test a 304 answer returns the cached body of the previous response."""
+    api.add(
+        "/customers/me",
+        httpx.Response(200, json={"first_name": "Ragnar"}, headers={"ETag": '"v1"'}),
+        httpx.Response(304),
+    )
+
+    first = await client.get_customer_info()
+    second = await client.get_customer_info()
+
+    assert second is first
+    assert api.requests[-1].headers["If-None-Match"] == '"v1"'
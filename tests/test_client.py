@@ -0,0 +1,229 @@
+"""Tests for the MobileVikings API client."""
+
+import asyncio
+
+import httpx
+
+from custom_components.mobile_vikings.client import MobileVikingsClient
+from custom_components.mobile_vikings.const import MOBILE_VIKINGS
+
+from .conftest import PAID_INVOICES, UNPAID_INVOICES, MockApi
+
+
+class ConcurrencyProbe:
+    """Delay the responses of the API double, counting the requests in flight."""
+
+    def __init__(self, api: MockApi, delays: dict[str, float] | None = None) -> None:
+        """Initialize the probe in front of the API double, with delays by path."""
+        self.api = api
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request after a delay letting the other requests start."""
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(request.url.path, 0.01))
+            return self.api.handler(request)
+        finally:
+            self.in_flight -= 1
+
+
+def probed_client(
+    hass, api: MockApi, max_concurrency: int, delays: dict[str, float] | None = None
+) -> tuple:
+    """Return a client whose requests go through a concurrency probe."""
+    probe = ConcurrencyProbe(api, delays)
+    client = MobileVikingsClient(
+        hass, "user", "secret", MOBILE_VIKINGS, max_concurrency=max_concurrency
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(probe.handler))
+    client.retry.backoff_base = 0
+    return client, probe
+
+
+async def test_get_data_fetches_sections(client: MobileVikingsClient, api) -> None:
+    """Test the requested sections are fetched with one token request."""
+    api.add("/customers/me", {"first_name": "Ragnar"})
+    api.add("/loyalty-points/balance", {"available": 42})
+
+    data = await client.get_data(["customer_info", "loyalty_points_balance"])
+
+    assert data["customer_info"] == {"first_name": "Ragnar"}
+    assert data["loyalty_points_balance"] == {"available": 42}
+    assert "subscriptions" not in data
+    assert (
+        sum(request.url.path.endswith("/oauth2/token/") for request in api.requests)
+        == 1
+    )
+
+
+async def test_get_data_isolates_failing_section(
+    client: MobileVikingsClient, api
+) -> None:
+    """Test a failing section returns an error while the others succeed."""
+    api.add("/customers/me", {"first_name": "Ragnar"})
+    api.add("/loyalty-points/balance", httpx.Response(500))
+
+    data = await client.get_data(["customer_info", "loyalty_points_balance"])
+
+    assert data["customer_info"] == {"first_name": "Ragnar"}
+    assert "error" in data["loyalty_points_balance"]
+
+
+async def test_get_data_authentication_failure(
+    client: MobileVikingsClient, api
+) -> None:
+    """Test every section returns an error when the login fails."""
+    api.add("/oauth2/token/", httpx.Response(400, json={"error": "invalid_grant"}))
+
+    data = await client.get_data(["customer_info"])
+
+    assert "error" in data["customer_info"]
+    assert api.endpoints() == []
+
+
+async def test_get_data_without_sections(client: MobileVikingsClient, api) -> None:
+    """Test no request is made, not even for a token, when no section is due."""
+    data = await client.get_data([])
+
+    assert set(data) == {"timestamp", "product_cache"}
+    assert api.requests == []
+
+
+async def test_get_data_bounds_concurrency(hass, api: MockApi) -> None:
+    """Test no more sections than max_concurrency are fetched at once."""
+    api.add("/customers/me", {"first_name": "Ragnar"})
+    api.add("/loyalty-points/balance", {"available": 42})
+    api.add(UNPAID_INVOICES, {"total_items": 0, "results": []})
+    api.add(PAID_INVOICES, {"total_items": 0, "results": []})
+    sections = [
+        "customer_info",
+        "loyalty_points_balance",
+        "unpaid_invoices",
+        "paid_invoices",
+    ]
+
+    client, probe = probed_client(hass, api, max_concurrency=2)
+    data = await client.get_data(sections)
+    assert all("error" not in data[section] for section in sections)
+    assert probe.peak == 2
+
+    client, probe = probed_client(hass, api, max_concurrency=4)
+    await client.get_data(sections)
+    assert probe.peak == 4
+
+
+def mock_subscription(api, balance: dict) -> None:
+    """Answer the requests of a subscription with a data bundle."""
+    api.add(
+        "/subscriptions",
+        [{"id": "1", "type": "postpaid", "sim": {"msisdn": "1"}, "product_id": "p"}],
+    )
+    api.add("/subscriptions/1/balance", balance)
+    api.add("/products/p", {"id": "p", "price": 10})
+
+
+BUNDLE = {
+    "type": "data",
+    "category": "default",
+    "total": 10,
+    "used": 5,
+    "valid_from": "2026-01-01T00:00:00+0000",
+    "valid_until": "2026-01-31T00:00:00+0000",
+}
+
+
+async def test_unchanged_subscriptions_are_reused(
+    client: MobileVikingsClient, api
+) -> None:
+    """Test subscriptions built from unchanged payloads keep their object."""
+    mock_subscription(api, {"bundles": [BUNDLE]})
+
+    first = await client.get_subscriptions()
+    second = await client.get_subscriptions()
+
+    assert second is first
+    assert first["1"]["balance"]["bundles"]["data_default"]["used_percentage"] == 50
+    assert first["1"]["product"] == {"id": "p", "price": 10}
+
+
+async def test_changed_subscriptions_are_enriched_again(
+    client: MobileVikingsClient, api
+) -> None:
+    """Test a changed balance builds new subscriptions."""
+    mock_subscription(api, {"bundles": [BUNDLE]})
+    first = await client.get_subscriptions()
+
+    api.add("/subscriptions/1/balance", {"bundles": [BUNDLE | {"used": 8}]})
+    second = await client.get_subscriptions()
+
+    assert second is not first
+    assert second["1"]["balance"]["bundles"]["data_default"]["used_percentage"] == 80
+
+
+def mock_subscriptions(api: MockApi, count: int) -> None:
+    """Answer the requests of count subscriptions, each with its own product."""
+    api.add(
+        "/subscriptions",
+        [
+            {
+                "id": str(index),
+                "type": "postpaid",
+                "sim": {"msisdn": str(index)},
+                "product_id": f"p{index}",
+            }
+            for index in range(1, count + 1)
+        ],
+    )
+    for index in range(1, count + 1):
+        api.add(f"/subscriptions/{index}/balance", {"bundles": [BUNDLE]})
+        api.add(f"/products/p{index}", {"id": f"p{index}"})
+
+
+async def test_subscriptions_keep_api_order(hass, api: MockApi) -> None:
+    """Test the subscriptions keep the API order when their details finish out of order."""
+    mock_subscriptions(api, 3)
+    client, _ = probed_client(
+        hass,
+        api,
+        max_concurrency=3,
+        delays={"/latest/mv/subscriptions/1/balance": 0.05},
+    )
+
+    subscriptions = await client.get_subscriptions()
+
+    assert list(subscriptions) == ["1", "2", "3"]
+    assert [s["product"]["id"] for s in subscriptions.values()] == ["p1", "p2", "p3"]
+
+
+async def test_subscription_details_bound_concurrency(hass, api: MockApi) -> None:
+    """Test no more subscriptions than max_concurrency fetch their details at once."""
+    mock_subscriptions(api, 5)
+    client, probe = probed_client(hass, api, max_concurrency=2)
+
+    subscriptions = await client.get_subscriptions()
+
+    assert len(subscriptions) == 5
+    assert probe.peak == 2
+
+
+async def test_subscription_failure_is_isolated(
+    client: MobileVikingsClient, api: MockApi
+) -> None:
+    """Test a failing balance or product only affects its own subscription."""
+    mock_subscriptions(api, 3)
+    api.add("/subscriptions/2/balance", httpx.Response(500))
+    api.add("/products/p3", httpx.Response(500))
+
+    subscriptions = await client.get_subscriptions()
+
+    assert list(subscriptions) == ["1", "2", "3"]
+    assert subscriptions["1"]["product"] == {"id": "p1"}
+    assert "data_default" in subscriptions["1"]["balance"]["bundles"]
+    assert "balance" not in subscriptions["2"]
+    assert subscriptions["2"]["product"] == {"id": "p2"}
+    assert "data_default" in subscriptions["3"]["balance"]["bundles"]
+    assert "product" not in subscriptions["3"]
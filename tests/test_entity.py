@@ -0,0 +1,87 @@
+"""Tests for the MobileVikings base entity."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.mobile_vikings.const import MOBILE_VIKINGS
+from custom_components.mobile_vikings.sensor import (
+    SUBSCRIPTION_SENSOR_TYPES,
+    MobileVikingsSensor,
+)
+
+CREDIT = next(
+    description
+    for description in SUBSCRIPTION_SENSOR_TYPES
+    if description.translation_key == "credit"
+)
+
+
+def subscriptions(credit: float) -> dict:
+    """Return the subscriptions section of a postpaid subscription."""
+    return {
+        "1": {
+            "id": "1",
+            "type": "postpaid",
+            "sim": {"msisdn": "3247"},
+            "balance": {"credit": credit},
+        }
+    }
+
+
+def credit_sensor(data: dict) -> MobileVikingsSensor:
+    """Return the credit sensor of subscription 1, on a coordinator double."""
+    coordinator = SimpleNamespace(
+        data=data,
+        config_entry=SimpleNamespace(entry_id="entry"),
+        client=SimpleNamespace(mobile_platform=MOBILE_VIKINGS),
+        compact_invoices=False,
+        last_update_success=True,
+    )
+    return MobileVikingsSensor(
+        coordinator, CREDIT, SimpleNamespace(title="user"), "1", None
+    )
+
+
+def test_snapshot_reused_for_unchanged_subscription() -> None:
+    """Test an update keeping the subscription object keeps its snapshot."""
+    data = {"timestamp": "1", "subscriptions": subscriptions(10)}
+    sensor = credit_sensor(data)
+    snapshot = sensor.snapshot
+
+    sensor.coordinator.data = data | {"timestamp": "2"}
+    assert sensor._compute_snapshot() is snapshot
+
+    sensor.coordinator.data = data | {"subscriptions": subscriptions(5)}
+    changed = sensor._compute_snapshot()
+    assert changed is not snapshot
+    assert changed.value == 5
+
+
+def test_state_written_only_on_change() -> None:
+    """Test the state is only written when the snapshot and fingerprint changed."""
+    data = {"timestamp": "1", "subscriptions": subscriptions(10)}
+    sensor = credit_sensor(data)
+
+    with patch.object(sensor, "async_write_ha_state") as write:
+        sensor._handle_coordinator_update()
+        assert write.call_count == 1
+
+        # Same subscription object, the snapshot is reused
+        sensor.coordinator.data = data | {"timestamp": "2"}
+        sensor._handle_coordinator_update()
+        assert write.call_count == 1
+
+        # New subscription object with the same content, same fingerprint
+        sensor.coordinator.data = data | {"subscriptions": subscriptions(10)}
+        sensor._handle_coordinator_update()
+        assert write.call_count == 1
+
+        sensor.coordinator.data = data | {"subscriptions": subscriptions(5)}
+        sensor._handle_coordinator_update()
+        assert write.call_count == 2
+        assert sensor.native_value == 5
+
+        # Availability changes are written even with an unchanged snapshot
+        sensor.coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        assert write.call_count == 3
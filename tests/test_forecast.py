@@ -0,0 +1,108 @@
+"""Tests for the forecasting of the bundle usage."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.mobile_vikings.forecast import UsageForecaster, UsageHistory
+
+NOW = datetime(2026, 1, 11, tzinfo=timezone.utc)
+DAY = 86400
+
+
+def subscriptions(used: float, **bundle) -> dict:
+    """Return subscriptions holding a data bundle of 100 units."""
+    return {
+        "1": {
+            "balance": {
+                "bundles": {
+                    "data_default": {
+                        "total": 100,
+                        "used": used,
+                        "valid_from": "2026-01-01T00:00:00+0000",
+                        "valid_until": "2026-01-31T00:00:00+0000",
+                        "projected_depletion": None,
+                        **bundle,
+                    }
+                }
+            }
+        }
+    }
+
+
+def bundle_of(subscriptions: dict) -> dict:
+    """Return the bundle of the subscriptions."""
+    return subscriptions["1"]["balance"]["bundles"]["data_default"]
+
+
+def test_history_is_bounded() -> None:
+    """Test the oldest samples are overwritten once the history is full."""
+    history = UsageHistory(capacity=3)
+    for day in range(5):
+        history.append(day * DAY, day * 2)
+
+    assert list(history.samples()) == [(2 * DAY, 4), (3 * DAY, 6), (4 * DAY, 8)]
+    assert history.rate_per_day() == 2
+
+
+def test_history_resets_on_usage_decrease() -> None:
+    """Test a usage decrease starts a new history and old samples are ignored."""
+    history = UsageHistory()
+    history.append(DAY, 10)
+    history.append(2 * DAY, 20)
+    history.append(DAY, 30)
+    history.append(3 * DAY, 5)
+
+    assert list(history.samples()) == [(3 * DAY, 5)]
+    assert history.rate_per_day() is None
+
+
+def test_forecast_from_fitted_rate() -> None:
+    """Test the fitted rate projects the depletion and the end of period usage."""
+    forecaster = UsageForecaster()
+
+    for day in range(3):
+        forecasted = forecaster.update(
+            subscriptions(40 + day * 5), NOW + timedelta(days=day)
+        )
+
+    bundle = bundle_of(forecasted)
+    assert bundle["forecast"] == {
+        "daily_rate": 5,
+        "samples": 3,
+        "projected_period_usage": 140,
+    }
+    # 50 units left at 5 per day
+    assert bundle["projected_depletion"] == (NOW + timedelta(days=12)).isoformat()
+    assert bundle["depletes_before_renewal"]
+
+
+def test_analytics_depletion_kept_without_rate() -> None:
+    """Test the depletion of the analytics is kept until a rate is fitted."""
+    forecaster = UsageForecaster()
+    depletion = (NOW + timedelta(days=5)).isoformat()
+
+    bundle = bundle_of(
+        forecaster.update(subscriptions(40, projected_depletion=depletion), NOW)
+    )
+
+    assert bundle["forecast"]["daily_rate"] is None
+    assert bundle["projected_depletion"] == depletion
+
+
+def test_unchanged_subscriptions_are_reused() -> None:
+    """Test unchanged subscriptions keep their forecast without a new sample."""
+    forecaster = UsageForecaster()
+    fetched = subscriptions(40)
+
+    forecasted = forecaster.update(fetched, NOW)
+
+    assert forecaster.update(fetched, NOW + timedelta(hours=1)) is forecasted
+    assert bundle_of(forecasted)["forecast"]["samples"] == 1
+
+
+def test_unlimited_bundles_are_not_forecast() -> None:
+    """Test unlimited bundles are returned as is."""
+    forecaster = UsageForecaster()
+
+    bundle = bundle_of(forecaster.update(subscriptions(40, unlimited=True), NOW))
+
+    assert "forecast" not in bundle
@@ -0,0 +1,108 @@
+"""Tests for the setup of the MobileVikings integration."""
+
+import logging
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mobile_vikings.const import DOMAIN
+from custom_components.mobile_vikings.session import DATA_REQUEST_SCHEDULER
+
+from .conftest import MockApi
+
+
+async def test_setup_entry(
+    recorder_mock, hass: HomeAssistant, entry: MockConfigEntry, mock_api: MockApi
+) -> None:
+    """Test an entry is set up with the shared request scheduler."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.client.scheduler is hass.data[DATA_REQUEST_SCHEDULER]
+    assert coordinator.data["customer_info"] == {"first_name": "Ragnar"}
+    assert "/customers/me" in mock_api.endpoints()
+
+
+def write_token_file(path: Path) -> None:
+    """Write an empty token store file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}")
+
+
+async def test_unload_keeps_stores(
+    recorder_mock, hass: HomeAssistant, entry: MockConfigEntry, mock_api: MockApi
+) -> None:
+    """Test the stores survive an unload and are removed with the entry."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    token_file = Path(hass.config.path(STORAGE_DIR), DOMAIN, f"{entry.entry_id}_tokens")
+    await hass.async_add_executor_job(write_token_file, token_file)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert token_file.exists()
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    assert not token_file.exists()
+
+
+async def test_migrate_legacy_tokens(
+    recorder_mock,
+    hass: HomeAssistant,
+    hass_storage: dict,
+    entry: MockConfigEntry,
+    mock_api: MockApi,
+) -> None:
+    """Test tokens stored with the data are used instead of logging in again."""
+    key = f"{DOMAIN}/{entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "tokens": {
+                "refresh_token": "legacy",
+                "access_token": "expired",
+                "expires_in": 3600,
+            }
+        },
+    }
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    token_request = parse_qs(mock_api.requests[0].content.decode())
+    assert token_request["grant_type"] == ["refresh_token"]
+    assert token_request["refresh_token"] == ["legacy"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert "tokens" not in coordinator.data
+
+
+async def test_debug_capture(
+    recorder_mock,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    entry: MockConfigEntry,
+    mock_api: MockApi,
+) -> None:
+    """Test debug logging records the poll once, without fetching it twice."""
+    caplog.set_level(logging.DEBUG, logger="custom_components.mobile_vikings")
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert len(coordinator.debug_captures) == 1
+    capture = coordinator.debug_captures[0]
+    assert "/customers/me" in [request["endpoint"] for request in capture["requests"]]
+    assert capture["responses"]["customer_info"] == {"first_name": "Ragnar"}
+    endpoints = mock_api.endpoints()
+    assert endpoints.count("/customers/me") == 1
+    assert len(endpoints) == len(set(endpoints))
@@ -0,0 +1,65 @@
+"""Tests for the aggregation of the invoice sections."""
+
+from datetime import datetime, timezone
+
+from custom_components.mobile_vikings.invoices import aggregate_invoices
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_aggregate_invoices() -> None:
+    """Test the invoices are totalled and their dates summarized."""
+    data = {
+        "unpaid_invoices": {
+            "total_items": 2,
+            "results": [
+                {
+                    "amount_due": 10.25,
+                    "expiration_date": "2026-01-11T00:00:00Z",
+                    "invoice_date": "2025-12-01T00:00:00Z",
+                },
+                {
+                    "amount_due": 5,
+                    "expiration_date": "2026-01-21T00:00:00Z",
+                    "invoice_date": "2025-12-11T00:00:00Z",
+                },
+            ],
+        }
+    }
+
+    unpaid = aggregate_invoices(data, NOW)["unpaid_invoices"]
+
+    assert unpaid["count"] == 2
+    assert unpaid["total"] == 15.25
+    assert unpaid["oldest_due"] == datetime(2026, 1, 11, tzinfo=timezone.utc)
+    assert unpaid["days_until_oldest_due"] == 10
+    assert unpaid["summary"]["newest_invoice"] == datetime(
+        2025, 12, 11, tzinfo=timezone.utc
+    )
+
+
+def test_aggregate_missing_sections() -> None:
+    """Test missing, failed and invalid sections aggregate to empty summaries."""
+    summary = aggregate_invoices(
+        {"paid_invoices": {"error": "boom"}, "unpaid_invoices": False}, NOW
+    )
+
+    for section in ("paid_invoices", "unpaid_invoices"):
+        assert summary[section]["results"] is None
+        assert summary[section]["count"] == 0
+        assert summary[section]["oldest_due"] is None
+
+
+def test_invalid_dates_are_skipped() -> None:
+    """Test invoices with an invalid date are totalled but not dated."""
+    data = {
+        "paid_invoices": {
+            "results": [{"amount_total": 20, "invoice_date": "not a date"}],
+        }
+    }
+
+    paid = aggregate_invoices(data, NOW)["paid_invoices"]
+
+    assert paid["count"] == 1
+    assert paid["total"] == 20
+    assert paid["summary"]["newest_invoice"] is None
@@ -0,0 +1,70 @@
+"""Tests for the paid invoices ledger."""
+
+from custom_components.mobile_vikings.client import MobileVikingsClient
+from custom_components.mobile_vikings.const import INVOICE_PAGE_SIZE
+from custom_components.mobile_vikings.ledger import InvoiceLedger
+
+PAID_INVOICES = f"/invoices?status=paid&page=1&per_page={INVOICE_PAGE_SIZE}"
+
+
+def invoices(*ids: int) -> list[dict]:
+    """Return paid invoices with the given ids, newest first."""
+    return [{"id": invoice_id, "amount": invoice_id * 10} for invoice_id in ids]
+
+
+def ids(section: dict) -> list[int]:
+    """Return the invoice ids of a paid_invoices section."""
+    return [invoice["id"] for invoice in section["results"]]
+
+
+def test_merge_prepends_new_invoices() -> None:
+    """Test merging keeps the known invoices and prepends the new ones."""
+    ledger = InvoiceLedger()
+    ledger.restore({"results": invoices(4, 2)})
+
+    assert ledger.merge(invoices(6, 5, 4)) == 2
+    assert ids(ledger.as_section()) == [6, 5, 4, 2]
+
+
+def test_replace_drops_stale_invoices() -> None:
+    """Test replacing keeps the order of the API and drops the other invoices."""
+    ledger = InvoiceLedger()
+    ledger.restore({"results": invoices(5, 4, 1)})
+
+    ledger.replace(invoices(5, 4, 3, 2))
+
+    assert ids(ledger.as_section()) == [5, 4, 3, 2]
+
+
+def test_restore_ignores_errors() -> None:
+    """Test a stored section holding an error is not restored."""
+    ledger = InvoiceLedger()
+    ledger.restore({"error": "boom"})
+
+    assert len(ledger) == 0
+
+
+async def test_incremental_sync(client: MobileVikingsClient, api) -> None:
+    """Test only the invoices newer than the ledger are added."""
+    client.invoice_ledger.restore({"results": invoices(4, 2)})
+    api.add(PAID_INVOICES, {"total_items": 3, "results": invoices(5, 4, 2)})
+
+    section = await client.get_paid_invoices()
+
+    assert ids(section) == [5, 4, 2]
+    assert api.endpoints() == [PAID_INVOICES]
+
+
+async def test_full_sync_replaces_ledger(client: MobileVikingsClient, api) -> None:
+    """Test a ledger out of sync with the API is replaced in the order of the API."""
+    client.invoice_ledger.restore({"results": invoices(5, 4, 2)})
+    api.add(PAID_INVOICES, {"total_items": 4, "results": invoices(5, 4, 3, 2)})
+
+    section = await client.get_paid_invoices()
+
+    assert ids(section) == [5, 4, 3, 2]
+    assert api.endpoints() == [PAID_INVOICES, PAID_INVOICES]
+
+    # The ledger now matches the API, the next poll is incremental
+    await client.get_paid_invoices()
+    assert api.endpoints() == [PAID_INVOICES] * 3
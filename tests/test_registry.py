@@ -0,0 +1,115 @@
+"""Tests for the entity description registry and the entity discovery."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.mobile_vikings.const import JIM_MOBILE, MOBILE_VIKINGS
+from custom_components.mobile_vikings.registry import (
+    BUNDLE,
+    STATIC,
+    SUBSCRIPTION,
+    DescriptionRegistry,
+    async_setup_entity_discovery,
+)
+
+
+def description(key: str, **values) -> SimpleNamespace:
+    """Return an entity description double."""
+    return SimpleNamespace(
+        key=key,
+        **{
+            "mobile_platforms": (MOBILE_VIKINGS,),
+            "subscription_types": None,
+            "bundle_type": None,
+            "bundle_category": "all",
+        }
+        | values,
+    )
+
+
+CUSTOMER = description("customer_info", mobile_platforms=(MOBILE_VIKINGS, JIM_MOBILE))
+CREDIT = description("credit")
+MODEM = description("modem", subscription_types=("fixed-internet",))
+DATA = description("data_balance", bundle_type="data")
+DEFAULT = description("default_bundle", bundle_type="default", bundle_category=None)
+UNCATEGORIZED = description("uncategorized", bundle_type="data", bundle_category=None)
+
+REGISTRY = DescriptionRegistry(
+    static=(CUSTOMER,),
+    subscription=(CREDIT, MODEM),
+    bundle=(DATA, DEFAULT, UNCATEGORIZED),
+)
+
+
+def test_lookup_by_platform_and_types() -> None:
+    """Test descriptions are looked up by platform, subscription and bundle type."""
+    assert REGISTRY.lookup(STATIC, JIM_MOBILE) == (CUSTOMER,)
+    assert REGISTRY.lookup(SUBSCRIPTION, JIM_MOBILE, "postpaid") == ()
+    assert REGISTRY.lookup(SUBSCRIPTION, MOBILE_VIKINGS, "postpaid") == (CREDIT,)
+    assert REGISTRY.lookup(SUBSCRIPTION, MOBILE_VIKINGS, "fixed-internet") == (
+        MODEM,
+        CREDIT,
+    )
+    assert REGISTRY.lookup(BUNDLE, MOBILE_VIKINGS, "postpaid", "data") == (DATA,)
+
+
+def test_uncategorized_bundle_descriptions() -> None:
+    """Test uncategorized bundle descriptions only apply to default bundles."""
+    assert REGISTRY.lookup(BUNDLE, MOBILE_VIKINGS, "postpaid", "default") == (DEFAULT,)
+
+
+def subscriptions(*bundle_ids: str) -> dict:
+    """Return a postpaid subscription holding data bundles."""
+    return {
+        "1": {
+            "type": "postpaid",
+            "balance": {
+                "bundles": {bundle_id: {"type": "data"} for bundle_id in bundle_ids}
+            },
+        }
+    }
+
+
+def test_discovery_adds_entities_of_new_keys() -> None:
+    """Test entities are only created for keys not seen before."""
+    listeners = []
+    coordinator = SimpleNamespace(
+        client=SimpleNamespace(mobile_platform=MOBILE_VIKINGS),
+        data={"customer_info": {}, "subscriptions": subscriptions("data_default")},
+        async_add_listener=lambda listener: listeners.append(listener),
+    )
+    add_entities = MagicMock()
+
+    async_setup_entity_discovery(
+        coordinator,
+        MagicMock(),
+        REGISTRY,
+        lambda description, subscription_id, bundle_id: (
+            description.key,
+            subscription_id,
+            bundle_id,
+        ),
+        add_entities,
+    )
+
+    assert sorted(add_entities.call_args.args[0], key=str) == sorted(
+        [
+            ("customer_info", None, None),
+            ("credit", "1", None),
+            ("data_balance", "1", "data_default"),
+        ],
+        key=str,
+    )
+
+    add_entities.reset_mock()
+    coordinator.data = coordinator.data | {
+        "subscriptions": subscriptions("data_default")
+    }
+    listeners[0]()
+    add_entities.assert_not_called()
+
+    coordinator.data = coordinator.data | {
+        "subscriptions": subscriptions("data_default", "data_loyalty")
+    }
+    listeners[0]()
+    add_entities.assert_called_once_with([("data_balance", "1", "data_loyalty")])
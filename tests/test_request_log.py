@@ -0,0 +1,70 @@
+"""Tests for the request log."""
+
+from custom_components.mobile_vikings.request_log import LazyPayload, RequestLog
+
+
+def test_payload_masks_fields() -> None:
+    """Test sensitive fields are masked, without changing the payload."""
+    payload = {"username": "viking", "sim": [{"msisdn": "3247"}], "amount": 10}
+
+    assert LazyPayload(payload).masked() == {
+        "username": "***FILTERED***",
+        "sim": [{"msisdn": "***FILTERED***"}],
+        "amount": 10,
+    }
+    assert payload["username"] == "viking"
+    assert payload["sim"][0]["msisdn"] == "3247"
+
+
+def test_payload_parses_raw_bodies() -> None:
+    """Test bytes and text payloads are parsed before masking."""
+    assert LazyPayload(b'{"password": "secret"}').masked() == {
+        "password": "***FILTERED***"
+    }
+    assert LazyPayload("not json").masked() == "not json"
+    assert str(LazyPayload(b"\xff")) == "�"
+
+
+def test_payload_is_truncated() -> None:
+    """Test long payloads are truncated to max_length characters."""
+    assert str(LazyPayload({"a": 1}, max_length=20)) == '{"a": 1}'
+    assert str(LazyPayload("x" * 30, max_length=10)) == (
+        "xxxxxxxxxx... (30 characters)"
+    )
+
+
+def test_log_keeps_last_exchanges() -> None:
+    """Test the log keeps the last exchanges, oldest first."""
+    log = RequestLog(size=2)
+    for status in (200, 304, 500):
+        log.record("GET", f"/status/{status}", status, 12)
+
+    assert [exchange["status"] for exchange in log.as_list()] == [304, 500]
+
+
+def test_log_export() -> None:
+    """Test exchanges are exported with masked bodies."""
+    log = RequestLog()
+    log.record(
+        "POST",
+        "/oauth2/token/",
+        200,
+        35,
+        request={"username": "viking", "grant_type": "password"},
+        response=b'{"access_token": "token", "expires_in": 3600}',
+    )
+    log.record("GET", "/customers/me", 204, 20)
+
+    token, customer = log.as_list()
+    assert token["method"] == "POST"
+    assert token["endpoint"] == "/oauth2/token/"
+    assert token["duration_ms"] == 35
+    assert token["timestamp"].endswith("+00:00")
+    assert token["request"] == (
+        '{"username": "***FILTERED***", "grant_type": "password"}'
+    )
+    assert token["response"] == (
+        '{"access_token": "***FILTERED***", "expires_in": 3600}'
+    )
+    assert customer["request"] is None
+    assert customer["response"] is None
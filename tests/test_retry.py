@@ -0,0 +1,143 @@
+"""Tests for the retries and circuit breakers of the API requests."""
+
+from datetime import timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+import httpx
+import pytest
+
+from custom_components.mobile_vikings.exceptions import CircuitOpenException
+from custom_components.mobile_vikings.retry import (
+    CircuitBreaker,
+    RetryEngine,
+    endpoint_key,
+    parse_retry_after,
+)
+
+
+class Endpoint:
+    """Endpoint double answering the attempts with the responses, in turn."""
+
+    def __init__(self, *responses) -> None:
+        """Initialize the endpoint, the last response is repeated."""
+        self.responses = list(responses)
+        self.attempts = 0
+
+    async def __call__(self, timeout: float) -> httpx.Response:
+        """Answer an attempt, raising the response when it is an exception."""
+        self.attempts += 1
+        response = (
+            self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        )
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def engine(attempts: int = 3) -> RetryEngine:
+    """Return a retry engine without backoff delays."""
+    return RetryEngine(attempts=attempts, backoff_base=0)
+
+
+def test_endpoint_key_keeps_ids() -> None:
+    """Test the breakers of the subscriptions are kept apart."""
+    assert endpoint_key("/subscriptions/1/balance") == "/subscriptions/1/balance"
+    assert endpoint_key("/invoices?status=paid&page=2") == "/invoices"
+
+
+def test_parse_retry_after() -> None:
+    """Test Retry-After headers in seconds and as a date are parsed."""
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    retry_at = dt_util.utcnow() + timedelta(seconds=60)
+    assert 55 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 60
+
+
+def test_circuit_breaker_states() -> None:
+    """Test the circuit opens at the threshold and lets a trial through."""
+    breaker = CircuitBreaker(threshold=2, cooldown=timedelta(minutes=5))
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    with patch(
+        "custom_components.mobile_vikings.retry.time.monotonic",
+        return_value=breaker._open_until,
+    ):
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        # The trial is in flight, the other requests are rejected
+        assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+async def test_retry_transient_status() -> None:
+    """Test transient status codes are retried until a response succeeds."""
+    send = Endpoint(httpx.Response(503), httpx.Response(502), httpx.Response(200))
+
+    response = await engine().async_send("/customers/me", send)
+
+    assert response.status_code == 200
+    assert send.attempts == 3
+
+
+async def test_client_errors_are_not_retried() -> None:
+    """Test a client error is returned without retry."""
+    send = Endpoint(httpx.Response(404))
+
+    response = await engine().async_send("/customers/me", send)
+
+    assert response.status_code == 404
+    assert send.attempts == 1
+
+
+async def test_exhausted_retries() -> None:
+    """Test the last response is returned and the last error raised."""
+    retry = engine()
+
+    response = await retry.async_send("/customers/me", Endpoint(httpx.Response(500)))
+    assert response.status_code == 500
+
+    with pytest.raises(httpx.ConnectError):
+        await retry.async_send(
+            "/loyalty-points/balance", Endpoint(httpx.ConnectError("down"))
+        )
+
+
+async def test_long_retry_after_is_not_waited() -> None:
+    """Test a Retry-After longer than the maximum backoff ends the retries."""
+    send = Endpoint(httpx.Response(429, headers={"Retry-After": "3600"}))
+
+    response = await engine().async_send("/customers/me", send)
+
+    assert response.status_code == 429
+    assert send.attempts == 1
+
+
+async def test_open_circuit_rejects_requests() -> None:
+    """Test a failing endpoint is skipped without blocking other subscriptions."""
+    retry = engine(attempts=1)
+    failing = Endpoint(httpx.Response(500))
+    for _ in range(3):
+        await retry.async_send("/subscriptions/1/balance", failing)
+
+    with pytest.raises(CircuitOpenException):
+        await retry.async_send("/subscriptions/1/balance", failing)
+    assert failing.attempts == 3
+
+    response = await retry.async_send(
+        "/subscriptions/2/balance", Endpoint(httpx.Response(200))
+    )
+    assert response.status_code == 200
+    assert retry.as_dict() == {
+        "/subscriptions/1/balance": "open",
+        "/subscriptions/2/balance": "closed",
+    }
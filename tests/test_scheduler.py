@@ -0,0 +1,115 @@
+"""Tests for the polling schedule of the coordinator."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.mobile_vikings.scheduler import (
+    AdaptiveBalanceInterval,
+    SectionScheduler,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def subscriptions(**bundle) -> dict:
+    """Return subscriptions holding a single bundle."""
+    return {"1": {"balance": {"bundles": {"data": bundle}}}}
+
+
+def test_sections_are_due_on_their_interval() -> None:
+    """Test a section is only due once its interval elapsed."""
+    scheduler = SectionScheduler(
+        {"subscriptions": timedelta(minutes=15), "paid_invoices": timedelta(hours=6)}
+    )
+    assert scheduler.update_interval == timedelta(minutes=15)
+    assert scheduler.due_sections(NOW) == ["subscriptions", "paid_invoices"]
+
+    scheduler.mark_fetched("subscriptions", NOW)
+    scheduler.mark_fetched("paid_invoices", NOW)
+    assert scheduler.due_sections(NOW + timedelta(minutes=15)) == ["subscriptions"]
+    assert scheduler.due_sections(NOW + timedelta(hours=6)) == [
+        "subscriptions",
+        "paid_invoices",
+    ]
+
+
+def test_poll_drift_is_tolerated() -> None:
+    """Test a poll slightly early does not postpone a section by a whole poll."""
+    scheduler = SectionScheduler({"subscriptions": timedelta(minutes=15)})
+    scheduler.mark_fetched("subscriptions", NOW)
+
+    assert scheduler.due_sections(NOW + timedelta(minutes=14, seconds=30)) == [
+        "subscriptions"
+    ]
+
+
+def test_failed_section_stays_due() -> None:
+    """Test a section that was not marked fetched is due on the next poll."""
+    scheduler = SectionScheduler(
+        {"subscriptions": timedelta(minutes=15), "customer_info": timedelta(hours=12)}
+    )
+    scheduler.mark_fetched("subscriptions", NOW)
+
+    assert scheduler.due_sections(NOW + timedelta(minutes=15)) == [
+        "subscriptions",
+        "customer_info",
+    ]
+
+
+def test_set_interval() -> None:
+    """Test changing an interval changes the poll interval."""
+    scheduler = SectionScheduler(
+        {"subscriptions": timedelta(minutes=15), "paid_invoices": timedelta(hours=6)}
+    )
+    scheduler.set_interval("subscriptions", timedelta(minutes=5))
+
+    assert scheduler.update_interval == timedelta(minutes=5)
+
+
+def test_balance_interval_base() -> None:
+    """Test a bundle used in line with its period is polled at the base interval."""
+    interval = AdaptiveBalanceInterval()
+
+    assert interval.update(
+        subscriptions(used=10, used_percentage=40, period_percentage=50)
+    ) == timedelta(minutes=15)
+
+
+def test_balance_interval_speeds_up() -> None:
+    """Test bundles burning fast or close to exhaustion are polled faster."""
+    interval = AdaptiveBalanceInterval()
+
+    assert interval.update(
+        subscriptions(used=10, used_percentage=40, period_percentage=20)
+    ) == timedelta(minutes=7, seconds=30)
+    assert interval.update(
+        subscriptions(used=20, used_percentage=95, period_percentage=60)
+    ) == timedelta(minutes=5)
+
+
+def test_balance_interval_backs_off() -> None:
+    """Test idle bundles back off up to the maximum interval."""
+    interval = AdaptiveBalanceInterval()
+    idle = subscriptions(used=10, used_percentage=40, period_percentage=50)
+
+    intervals = [interval.update(idle) for _ in range(4)]
+
+    assert intervals == [
+        timedelta(minutes=15),
+        timedelta(minutes=30),
+        timedelta(hours=1),
+        timedelta(hours=1),
+    ]
+    moved = subscriptions(used=11, used_percentage=41, period_percentage=50)
+    assert interval.update(moved) == timedelta(minutes=15)
+
+
+def test_balance_interval_ignores_exhausted_and_unlimited() -> None:
+    """Test exhausted and unlimited bundles do not speed up the polling."""
+    interval = AdaptiveBalanceInterval()
+
+    assert interval.update(
+        subscriptions(used=100, used_percentage=100, period_percentage=10)
+    ) == timedelta(minutes=15)
+    assert AdaptiveBalanceInterval().update(
+        subscriptions(unlimited=True, used_percentage=95)
+    ) == timedelta(minutes=15)
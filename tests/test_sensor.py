@@ -0,0 +1,136 @@
+"""Tests for the MobileVikings sensors."""
+
+from datetime import timedelta
+from pathlib import Path
+
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mobile_vikings.const import (
+    DATETIME_FORMAT,
+    DOMAIN,
+    GIB,
+    PAID_INVOICES_ATTRIBUTE_SIZE,
+)
+from custom_components.mobile_vikings.sensor import SENSOR_TYPES
+from custom_components.mobile_vikings.timeseries import RECORD
+
+from .conftest import MockApi
+
+
+def sensor_description(translation_key: str):
+    """Return the sensor description with the translation key."""
+    return next(
+        description
+        for description in SENSOR_TYPES
+        if description.translation_key == translation_key
+    )
+
+
+def test_paid_invoices_attribute_is_bounded() -> None:
+    """Test only the most recent paid invoices are listed in the attributes."""
+    ledger = [{"id": invoice_id} for invoice_id in range(100, 0, -1)]
+    description = sensor_description("paid_invoices")
+
+    invoices = description.attributes_fn(
+        {"paid_invoices": {"count": 100, "results": ledger}}, None
+    )["invoices"]
+
+    assert invoices == ledger[:PAID_INVOICES_ATTRIBUTE_SIZE]
+    assert description.attributes_fn({}, None) == {"invoices": []}
+
+
+def write_usage_history(path: Path, records: list[tuple[float, float, float]]) -> None:
+    """Write the usage records of a bundle."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"".join(RECORD.pack(*record) for record in records))
+
+
+async def test_forecast_sensors(
+    recorder_mock,
+    hass: HomeAssistant,
+    hass_storage: dict,
+    entry: MockConfigEntry,
+    mock_api: MockApi,
+) -> None:
+    """Test the projection sensors report the forecast of their bundle."""
+    now = dt_util.utcnow()
+    bundle = {
+        "type": "data",
+        "category": "default",
+        "total": 10 * GIB,
+        "used": 3 * GIB,
+        "valid_from": (now - timedelta(days=10)).strftime(DATETIME_FORMAT),
+        "valid_until": (now + timedelta(days=20)).strftime(DATETIME_FORMAT),
+    }
+    mock_api.add(
+        "/subscriptions",
+        [
+            {
+                "id": "1",
+                "type": "postpaid",
+                "sim": {"msisdn": "3247"},
+                "product_id": "p1",
+            }
+        ],
+    )
+    mock_api.add("/subscriptions/1/balance", {"bundles": [bundle]})
+    mock_api.add("/products/p1", {"id": "p1", "price": 10})
+    # Two hours of stored usage, the first poll adds the third sample
+    key = f"{DOMAIN}/{entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "subscriptions": {"1": {"balance": {"bundles": {"data_default": bundle}}}}
+        },
+    }
+    await hass.async_add_executor_job(
+        write_usage_history,
+        Path(
+            hass.config.path(STORAGE_DIR),
+            DOMAIN,
+            f"{entry.entry_id}_usage_1_data_default.bin",
+        ),
+        [
+            ((now - timedelta(hours=2)).timestamp(), 1 * GIB, 10 * GIB),
+            ((now - timedelta(hours=1)).timestamp(), 2 * GIB, 10 * GIB),
+        ],
+    )
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    forecasted = coordinator.data["subscriptions"]["1"]["balance"]["bundles"][
+        "data_default"
+    ]
+    registry = er.async_get(hass)
+
+    depletion = hass.states.get(
+        registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_3247_data_default_projected_depletion"
+        )
+    )
+    assert depletion.state == dt_util.parse_datetime(
+        forecasted["projected_depletion"]
+    ).astimezone(dt_util.UTC).isoformat(timespec="seconds")
+    assert depletion.attributes["samples"] == 3
+    assert depletion.attributes["daily_rate"] == pytest.approx(24 * GIB, rel=1e-3)
+
+    usage = hass.states.get(
+        registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_3247_data_default_projected_usage"
+        )
+    )
+    assert float(usage.state) == forecasted["forecast"]["projected_period_usage"]
+    assert usage.attributes["unit_of_measurement"] == PERCENTAGE
+
+    # The entry removal deletes the usage history files
+    assert await hass.config_entries.async_remove(entry.entry_id)
@@ -0,0 +1,64 @@
+"""Tests for the MobileVikings services."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mobile_vikings.const import DOMAIN
+
+from .conftest import PAID_INVOICES, MockApi
+
+
+@pytest.fixture
+async def loaded_entry(
+    recorder_mock, hass: HomeAssistant, entry: MockConfigEntry, mock_api: MockApi
+) -> MockConfigEntry:
+    """Return a loaded config entry holding three paid invoices."""
+    mock_api.add(
+        PAID_INVOICES,
+        {"total_items": 3, "results": [{"id": 3}, {"id": 2}, {"id": 1}]},
+    )
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_get_invoices_pages(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry
+) -> None:
+    """Test the invoices are returned page by page."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_invoices",
+        {
+            "config_entry_id": loaded_entry.entry_id,
+            "status": "paid",
+            "page": 2,
+            "page_size": 2,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "total_items": 3,
+        "page": 2,
+        "page_size": 2,
+        "pages": 2,
+        "results": [{"id": 1}],
+    }
+
+
+async def test_get_invoices_unknown_entry(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry
+) -> None:
+    """Test a call for an entry that is not loaded is rejected."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_invoices",
+            {"config_entry_id": "unknown", "status": "paid"},
+            blocking=True,
+            return_response=True,
+        )
@@ -0,0 +1,49 @@
+"""Tests for the request scheduling shared by the config entries."""
+
+from datetime import timedelta
+import time
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.mobile_vikings.session import (
+    RateLimiter,
+    async_get_request_scheduler,
+)
+
+
+async def test_rate_limiter_burst_then_rate() -> None:
+    """Test a burst is let through at once and later requests are spaced."""
+    limiter = RateLimiter(rate=50, burst=3)
+
+    started = time.monotonic()
+    for _ in range(3):
+        await limiter.async_acquire()
+    assert time.monotonic() - started < 0.02
+
+    for _ in range(2):
+        await limiter.async_acquire()
+    assert time.monotonic() - started >= 0.035
+
+
+async def test_scheduler_is_shared(hass: HomeAssistant) -> None:
+    """Test all config entries get the same scheduler and client."""
+    scheduler = async_get_request_scheduler(hass)
+
+    assert async_get_request_scheduler(hass) is scheduler
+    assert scheduler.client is not None
+
+
+async def test_stagger_spreads_polls(hass: HomeAssistant) -> None:
+    """Test a poll starting right after another one is delayed."""
+    scheduler = async_get_request_scheduler(hass)
+
+    with patch(
+        "custom_components.mobile_vikings.session.POLL_STAGGER",
+        timedelta(seconds=0.05),
+    ):
+        started = time.monotonic()
+        await scheduler.async_stagger()
+        assert time.monotonic() - started < 0.04
+        await scheduler.async_stagger()
+        assert time.monotonic() - started >= 0.04
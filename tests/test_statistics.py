@@ -0,0 +1,154 @@
+"""Tests for the import of the long-term statistics."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.mobile_vikings.statistics import (
+    StatisticsImporter,
+    hourly_usage_statistics,
+    invoice_statistics,
+)
+
+HOUR = 3600
+
+
+def test_hourly_usage_statistics() -> None:
+    """Test the usage is summed per hour, a decrease being a renewal."""
+    records = [
+        (HOUR, 10, 100),
+        (HOUR + 1800, 15, 100),
+        (2 * HOUR, 20, 100),
+        (3 * HOUR, 5, 100),
+        (4 * HOUR, 8, 100),
+    ]
+
+    statistics = hourly_usage_statistics(records, None, 4 * HOUR, 0)
+
+    assert [
+        (statistic["start"].timestamp(), statistic["state"], statistic["sum"])
+        for statistic in statistics
+    ] == [(HOUR, 15, 5), (2 * HOUR, 20, 10), (3 * HOUR, 5, 15)]
+
+
+def test_hourly_usage_statistics_continue_after_last_import() -> None:
+    """Test the hours imported before only serve as baseline."""
+    records = [(HOUR, 10, 100), (2 * HOUR, 20, 100), (3 * HOUR, 25, 100)]
+
+    statistics = hourly_usage_statistics(records, 2 * HOUR, 4 * HOUR, 40)
+
+    assert [(statistic["state"], statistic["sum"]) for statistic in statistics] == [
+        (25, 45)
+    ]
+
+
+def test_invoice_statistics() -> None:
+    """Test invoices are summed by invoice hour, invalid dates are skipped."""
+    invoices = [
+        {"invoice_date": "2026-02-01T10:30:00+00:00", "amount_total": 20},
+        {"invoice_date": "2026-01-01T10:00:00Z", "amount_total": 15.5},
+        {"invoice_date": "2026-01-01T10:45:00+00:00", "amount_total": 4.5},
+        {"invoice_date": "invalid", "amount_total": 99},
+    ]
+
+    statistics = invoice_statistics(invoices, "amount_total")
+
+    assert [
+        (statistic["start"], statistic["state"], statistic["sum"])
+        for statistic in statistics
+    ] == [
+        (datetime(2026, 1, 1, 10, tzinfo=timezone.utc), 20, 20),
+        (datetime(2026, 2, 1, 10, tzinfo=timezone.utc), 20, 40),
+    ]
+
+
+class UsageHistoryDouble:
+    """Usage history returning the records of one bundle from a start time."""
+
+    def __init__(self, records: list[tuple[float, float, float]]) -> None:
+        """Initialize the history with its records."""
+        self.records = records
+        self.starts: list[datetime | None] = []
+
+    async def async_read(
+        self, subscription_id: str, bundle_id: str, start: datetime | None = None
+    ) -> list[tuple[float, float, float]]:
+        """Return the records from start."""
+        self.starts.append(start)
+        return [
+            record
+            for record in self.records
+            if start is None or record[0] >= start.timestamp()
+        ]
+
+
+async def test_import_usage_resumes_after_last_statistic() -> None:
+    """Test the import continues after the last statistic, without gaps or duplicates."""
+    history = UsageHistoryDouble(
+        [
+            (HOUR, 10, 100),
+            (2 * HOUR, 20, 100),
+            (3 * HOUR, 25, 100),
+            (4 * HOUR, 30, 100),
+            (5 * HOUR, 32, 100),
+            (6 * HOUR, 40, 100),
+        ]
+    )
+    importer = StatisticsImporter(SimpleNamespace(), "entry", history)
+    statistic_id = importer.statistic_id("1_voice_default_usage")
+    subscriptions = {
+        "1": {
+            "sim": {"msisdn": "3247"},
+            "balance": {"bundles": {"voice_default": {"type": "voice", "total": 100}}},
+        }
+    }
+
+    async def async_add_executor_job(target, *args):
+        return target(*args)
+
+    # The recorder holds the hours up to the second one
+    get_last_statistics = MagicMock(
+        return_value={statistic_id: [{"start": 2 * HOUR, "sum": 40}]}
+    )
+    with (
+        patch(
+            "custom_components.mobile_vikings.statistics.get_instance",
+            return_value=SimpleNamespace(async_add_executor_job=async_add_executor_job),
+        ),
+        patch(
+            "custom_components.mobile_vikings.statistics.get_last_statistics",
+            get_last_statistics,
+        ),
+        patch(
+            "custom_components.mobile_vikings.statistics.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        await importer.async_import_usage(
+            subscriptions, dt_util.utc_from_timestamp(5 * HOUR + 1800)
+        )
+        await importer.async_import_usage(
+            subscriptions, dt_util.utc_from_timestamp(5 * HOUR + 2700)
+        )
+        await importer.async_import_usage(
+            subscriptions, dt_util.utc_from_timestamp(6 * HOUR + 600)
+        )
+
+    imported = [
+        [
+            (statistic["start"].timestamp(), statistic["state"], statistic["sum"])
+            for statistic in call.args[2]
+        ]
+        for call in add_statistics.call_args_list
+    ]
+    assert imported == [
+        [(3 * HOUR, 25, 45), (4 * HOUR, 30, 50)],
+        [(5 * HOUR, 32, 52)],
+    ]
+    assert add_statistics.call_args.args[1]["statistic_id"] == statistic_id
+    get_last_statistics.assert_called_once()
+    assert history.starts == [
+        dt_util.utc_from_timestamp(2 * HOUR),
+        dt_util.utc_from_timestamp(4 * HOUR),
+    ]
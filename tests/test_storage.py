@@ -0,0 +1,81 @@
+"""Tests for the storage of the coordinator data."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.mobile_vikings.storage import MobileVikingsStorage
+
+DATA = {
+    "timestamp": "2026-01-01T00:00:00+00:00",
+    "subscriptions": {"1": {"type": "mobile"}},
+    "paid_invoices": {"total_items": 0, "results": []},
+    "customer_info": {"first_name": "Ragnar"},
+    "invoice_summary": {"count": 0},
+}
+
+
+def saved(delay_save) -> list[str]:
+    """Return the store keys of the scheduled saves."""
+    return [call.args[0].key for call in delay_save.call_args_list]
+
+
+async def test_only_changed_groups_are_saved(hass: HomeAssistant) -> None:
+    """Test a group is only written when its content changed."""
+    storage = MobileVikingsStorage(hass, "entry")
+
+    with patch.object(Store, "async_delay_save", autospec=True) as delay_save:
+        storage.async_schedule_save(DATA)
+        assert sorted(saved(delay_save)) == [
+            "mobile_vikings/entry",
+            "mobile_vikings/entry_invoices",
+            "mobile_vikings/entry_static",
+        ]
+
+        delay_save.reset_mock()
+        storage.async_schedule_save(
+            DATA | {"customer_info": {"first_name": "Lagertha"}}
+        )
+        assert saved(delay_save) == ["mobile_vikings/entry_static"]
+
+
+async def test_timestamp_does_not_trigger_save(hass: HomeAssistant) -> None:
+    """Test a new timestamp alone does not rewrite the main group."""
+    storage = MobileVikingsStorage(hass, "entry")
+
+    with patch.object(Store, "async_delay_save", autospec=True) as delay_save:
+        storage.async_schedule_save(DATA)
+        delay_save.reset_mock()
+        storage.async_schedule_save(DATA | {"timestamp": "2026-01-01T00:15:00+00:00"})
+        assert saved(delay_save) == []
+
+
+async def test_derived_sections_are_not_stored(hass: HomeAssistant) -> None:
+    """Test derived sections are left out of every group."""
+    storage = MobileVikingsStorage(hass, "entry")
+
+    with patch.object(Store, "async_delay_save", autospec=True) as delay_save:
+        storage.async_schedule_save(DATA)
+        stored = {}
+        for call in delay_save.call_args_list:
+            stored |= call.args[1]()
+
+    assert stored == {
+        key: value for key, value in DATA.items() if key != "invoice_summary"
+    }
+
+
+async def test_load_files_written_before_the_split(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """Test a single file holding every section is loaded."""
+    hass_storage["mobile_vikings/entry"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "mobile_vikings/entry",
+        "data": DATA,
+    }
+    storage = MobileVikingsStorage(hass, "entry")
+
+    assert await storage.async_load() == DATA
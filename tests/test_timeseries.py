@@ -0,0 +1,51 @@
+"""Tests for the on-disk usage time series."""
+
+from datetime import timedelta
+from pathlib import Path
+
+from custom_components.mobile_vikings.timeseries import RECORD, UsageTimeSeries
+
+DAY = timedelta(days=1).total_seconds()
+HOUR = timedelta(hours=1).total_seconds()
+
+
+def test_append_and_read_ranges(tmp_path: Path) -> None:
+    """Test records are appended in order and read by range."""
+    series = UsageTimeSeries(tmp_path / "usage.bin")
+    for hour in range(5):
+        assert series.append(hour * HOUR, hour, 10)
+
+    assert not series.append(2 * HOUR, 7, 10)
+    assert len(series) == 5
+    assert series.read(HOUR, 3 * HOUR) == [
+        (HOUR, 1, 10),
+        (2 * HOUR, 2, 10),
+        (3 * HOUR, 3, 10),
+    ]
+    assert series.read(start=4.5 * HOUR) == []
+    assert UsageTimeSeries(tmp_path / "missing.bin").read() == []
+
+
+def test_partial_record_is_dropped(tmp_path: Path) -> None:
+    """Test a partial record left by an interrupted write is dropped."""
+    path = tmp_path / "usage.bin"
+    path.write_bytes(RECORD.pack(HOUR, 1, 10) + b"\x00" * 5)
+
+    series = UsageTimeSeries(path)
+    assert series.append(2 * HOUR, 2, 10)
+
+    assert series.read() == [(HOUR, 1, 10), (2 * HOUR, 2, 10)]
+
+
+def test_compact(tmp_path: Path) -> None:
+    """Test old records are downsampled and expired records dropped."""
+    now = 500 * DAY
+    series = UsageTimeSeries(tmp_path / "usage.bin")
+    series.append(now - 450 * DAY, 1, 10)
+    for minute in range(4):
+        series.append(now - 30 * DAY + minute * 900, minute, 10)
+    series.append(now - HOUR, 5, 10)
+
+    series.compact(now)
+
+    assert series.read() == [(now - 30 * DAY + 2700, 3, 10), (now - HOUR, 5, 10)]